@@ -0,0 +1,242 @@
+# src/nier_editora/bench/cli_latency.py
+"""
+cli_latency.py
+
+End-to-end latency of the CLI, measured as subprocesses.
+
+For each command (info, set, convert) the harness records wall-clock time
+and peak RSS over cold and warm runs, and splits the time into interpreter
+startup, imports (parsed from `-X importtime`), catalog loading (the
+module-level JSON loads in constants and i18n) and the command's own work.
+
+"Cold" runs use a fresh bytecode cache directory, so every module is
+compiled again. With --drop-caches (root only) the OS page cache is synced
+and dropped before each cold run as well; this affects the whole machine,
+so it is off by default. "Warm" runs reuse a populated cache.
+
+Usage:
+    python -m nier_editora.bench.cli_latency --save-baseline .bench/cli.json
+    python -m nier_editora.bench.cli_latency --baseline .bench/cli.json
+"""
+
+import argparse
+import os
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import nier_editora
+from nier_editora.bench.harness import TEMPLATE_SAVE, add_common_args, finish
+
+# Directory that makes both `nier_editora` and `utils` importable
+_SRC_DIR = Path(nier_editora.__file__).resolve().parents[1]
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)")
+
+CATALOG_MODULES = ("nier_editora.core.constants", "nier_editora.core.i18n")
+
+COMMANDS = ("info", "set", "convert")
+MODES = ("cold", "warm")
+
+
+def _command_args(command: str, save: Path, out: Path) -> List[str]:
+    if command == "info":
+        return ["info", str(save)]
+    if command == "set":
+        return ["set", str(save), "--money", "12345", "--output", str(out)]
+    if command == "convert":
+        return ["convert", str(save), "--to-console", "--output", str(out)]
+    raise ValueError(f"Unknown command {command!r}")
+
+
+def _env(pycache: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_SRC_DIR), env.get("PYTHONPATH")]))
+    env["PYTHONPYCACHEPREFIX"] = str(pycache)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+_DROP_CACHES = "/proc/sys/vm/drop_caches"
+
+
+def _drop_page_cache() -> None:
+    """
+    Flush and drop the OS page cache (system-wide; needs root).
+
+    Raises:
+        OSError: If the cache cannot be dropped.
+    """
+    os.sync()
+    with open(_DROP_CACHES, "w") as f:
+        f.write("3\n")
+
+
+def run_process(argv: Sequence[str], env: Dict[str, str]) -> Tuple[float, int, str]:
+    """
+    Run a process to completion and measure it.
+
+    Args:
+        argv: Command line.
+        env: Environment for the child.
+
+    Returns:
+        (wall seconds, peak RSS in KiB, captured stderr).
+    """
+    start = time.perf_counter()
+    proc = subprocess.Popen(argv, env=env, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.PIPE, text=True)
+    stderr = proc.stderr.read()
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{' '.join(argv)} exited with {proc.returncode}:\n{stderr}")
+    # ru_maxrss is KiB on Linux but bytes on macOS
+    rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return wall, rss, stderr
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Parse `-X importtime` output.
+
+    Returns:
+        (module, self µs, cumulative µs, nesting depth) per imported module.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+def breakdown(command: str, save: Path, out: Path, env: Dict[str, str],
+              startup_modules: set) -> Dict[str, float]:
+    """
+    Split one command's run time into imports and catalog loading.
+
+    Args:
+        command: CLI command to run.
+        save: Save file to operate on.
+        out: Output path for commands that write.
+        env: Environment for the child.
+        startup_modules: Top-level modules imported by a bare interpreter.
+
+    Returns:
+        Milliseconds spent on imports and on catalogs, plus the slowest imports.
+    """
+    argv = [sys.executable, "-X", "importtime", "-m", "nier_editora.cli", "-q",
+            *_command_args(command, save, out)]
+    _, _, stderr = run_process(argv, env)
+    rows = parse_importtime(stderr)
+    imports_us = sum(cum for mod, _, cum, depth in rows if depth == 0 and mod not in startup_modules)
+    catalogs_us = sum(self_us for mod, self_us, _, _ in rows if mod in CATALOG_MODULES)
+    slowest = sorted(rows, key=lambda r: r[1], reverse=True)[:5]
+    return {
+        "imports_ms": imports_us / 1000,
+        "catalogs_ms": catalogs_us / 1000,
+        "slowest_imports": {mod: self_us / 1000 for mod, self_us, _, _ in slowest},
+    }
+
+
+def run(commands: Sequence[str] = COMMANDS, runs: int = 5,
+        save: Optional[Path] = None, drop_caches: bool = False) -> Dict[str, dict]:
+    """
+    Measure every command in cold and warm mode.
+
+    Args:
+        commands: CLI commands to measure.
+        runs: Runs per command and mode.
+        save: Save file to operate on (default: the bundled template).
+        drop_caches: Drop the system-wide page cache before each cold run.
+
+    Returns:
+        "<command>:<mode>" → metrics, plus a "startup" entry.
+    """
+    results: Dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="niereditora-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        target = tmp_dir / "SlotData_0.dat"
+        shutil.copyfile(save or TEMPLATE_SAVE, target)
+        out = tmp_dir / "out.dat"
+        warm_env = _env(tmp_dir / "pycache-warm")
+
+        startup = [run_process([sys.executable, "-c", "pass"], warm_env)[0] for _ in range(runs)]
+        startup_ms = statistics.median(startup) * 1000
+        _, _, bare = run_process([sys.executable, "-X", "importtime", "-c", "pass"], warm_env)
+        startup_modules = {mod for mod, _, _, depth in parse_importtime(bare) if depth == 0}
+        results["startup"] = {"wall_ms": startup_ms}
+
+        for command in commands:
+            argv = [sys.executable, "-m", "nier_editora.cli", "-q", *_command_args(command, target, out)]
+            # Populate the warm cache before the first warm run
+            run_process(argv, warm_env)
+            for mode in MODES:
+                walls, rss = [], []
+                for i in range(runs):
+                    if mode == "cold":
+                        env = _env(tmp_dir / f"pycache-cold-{command}-{i}")
+                        if drop_caches:
+                            _drop_page_cache()
+                    else:
+                        env = warm_env
+                    wall, peak, _ = run_process(argv, env)
+                    walls.append(wall)
+                    rss.append(peak)
+                wall_ms = statistics.median(walls) * 1000
+                split = breakdown(command, target, out, warm_env if mode == "warm"
+                                  else _env(tmp_dir / f"pycache-split-{command}"), startup_modules)
+                results[f"{command}:{mode}"] = {
+                    "wall_ms": wall_ms,
+                    "wall_min_ms": min(walls) * 1000,
+                    "peak_rss_kib": max(rss),
+                    "startup_ms": startup_ms,
+                    "imports_ms": split["imports_ms"],
+                    "catalogs_ms": split["catalogs_ms"],
+                    "work_ms": max(0.0, wall_ms - startup_ms - split["imports_ms"]),
+                    "slowest_imports": split["slowest_imports"],
+                }
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m nier_editora.bench.cli_latency",
+        description="End-to-end CLI latency and peak RSS, cold and warm",
+    )
+    parser.add_argument("--command", dest="commands", action="append", choices=COMMANDS,
+                        help="Command to measure (repeatable; default: all)")
+    parser.add_argument("--runs", type=int, default=5, help="Runs per command and mode")
+    parser.add_argument("--save", type=Path, help="Save file to run against (default: bundled template)")
+    parser.add_argument("--drop-caches", action="store_true",
+                        help=f"Sync and drop the system-wide page cache before each cold run "
+                             f"(writes {_DROP_CACHES}; needs root)")
+    add_common_args(parser)
+    args = parser.parse_args(argv)
+
+    if args.drop_caches and not os.access(_DROP_CACHES, os.W_OK):
+        parser.error(f"--drop-caches needs write access to {_DROP_CACHES} (run as root)")
+    results = run(args.commands or COMMANDS, args.runs, args.save, args.drop_caches)
+    print(f"{'run':<16}{'wall':>10}{'startup':>10}{'imports':>10}{'catalogs':>10}{'work':>10}{'rss':>12}")
+    print(f"{'startup':<16}{results['startup']['wall_ms']:>8.1f}ms")
+    for name, r in results.items():
+        if name == "startup":
+            continue
+        print(f"{name:<16}{r['wall_ms']:>8.1f}ms{r['startup_ms']:>8.1f}ms{r['imports_ms']:>8.1f}ms"
+              f"{r['catalogs_ms']:>8.1f}ms{r['work_ms']:>8.1f}ms{r['peak_rss_kib']:>9,d}KiB")
+
+    return finish(args, results, metric="wall_ms", higher_is_better=False,
+                  extra={"page_cache_dropped": args.drop_caches})
+
+
+if __name__ == "__main__":
+    sys.exit(main())
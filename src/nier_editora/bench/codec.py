@@ -0,0 +1,126 @@
+# src/nier_editora/bench/codec.py
+"""
+codec.py
+
+Microbenchmarks for the save codec: whole-file load/write, format
+conversion, per-record decoding and SlotManager.active.
+
+Usage:
+    python -m nier_editora.bench.codec --save-baseline bench/codec.json
+    python -m nier_editora.bench.codec --baseline bench/codec.json --threshold 10
+"""
+
+import argparse
+import io
+import logging
+import sys
+from typing import Dict, List, Optional, Sequence
+
+from nier_editora.bench.harness import Result, add_common_args, finish, measure, synthetic_saves
+from nier_editora.core import Chip, Item, SaveFile, Weapon, constants
+from utils import console_to_pc, pc_to_console
+
+
+def run(corpus_size: int = 16, seed: int = 0, repeat: int = 5, min_time: float = 0.2,
+        only: Optional[Sequence[str]] = None) -> List[Result]:
+    """
+    Run every codec benchmark over a synthetic corpus.
+
+    Args:
+        corpus_size: Number of synthetic saves to cycle through.
+        seed: Seed for the synthetic corpus.
+        repeat: Timed runs per benchmark.
+        min_time: Minimum duration of one run, in seconds.
+        only: Names of the benchmarks to run (default: all).
+
+    Returns:
+        One Result per benchmark.
+    """
+    pc_saves = synthetic_saves(corpus_size, seed)
+    console_saves = [pc_to_console(data) for data in pc_saves]
+    loaded = []
+    for data in pc_saves:
+        save = SaveFile()
+        save.load(data)
+        loaded.append(save)
+    n = len(pc_saves)
+
+    def load_all():
+        for data in pc_saves:
+            SaveFile().load(data)
+
+    def write_all():
+        for save in loaded:
+            save.write()
+
+    def to_pc_all():
+        for data in console_saves:
+            console_to_pc(data)
+
+    def to_console_all():
+        for data in pc_saves:
+            pc_to_console(data)
+
+    def read_records(cls, offset: int, size: int, count: int):
+        region = pc_saves[0][offset:offset + size * count]
+
+        def read_all():
+            buf = io.BytesIO(region)
+            for i in range(count):
+                cls.read(buf, i)
+        return read_all
+
+    def active_all():
+        for save in loaded:
+            save.inventory.active
+            save.corpse_inventory.active
+            save.weapons.active
+            save.chips.active
+
+    cases = [
+        ("SaveFile.load", load_all, n),
+        ("SaveFile.write", write_all, n),
+        ("console_to_pc", to_pc_all, n),
+        ("pc_to_console", to_console_all, n),
+        ("Item.read", read_records(Item, constants.OFF_INVENTORY, constants.ITEM_SIZE,
+                                   constants.INVENTORY_ITEM_COUNT), constants.INVENTORY_ITEM_COUNT),
+        ("Weapon.read", read_records(Weapon, constants.OFF_WEAPONS, constants.WEAPON_SIZE,
+                                     constants.INVENTORY_WEAPON_COUNT), constants.INVENTORY_WEAPON_COUNT),
+        ("Chip.read", read_records(Chip, constants.OFF_CHIPS, constants.CHIP_SIZE,
+                                   constants.INVENTORY_CHIPS_COUNT), constants.INVENTORY_CHIPS_COUNT),
+        ("SlotManager.active", active_all, n * 4),
+    ]
+    return [
+        measure(name, fn, ops, repeat=repeat, min_time=min_time)
+        for name, fn, ops in cases
+        if not only or name in only
+    ]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m nier_editora.bench.codec",
+        description="Codec microbenchmarks with baseline regression checks",
+    )
+    parser.add_argument("--corpus-size", type=int, default=16, help="Synthetic saves to cycle through")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per timed run")
+    parser.add_argument("--only", action="append", metavar="NAME", help="Run only these benchmarks")
+    add_common_args(parser)
+    args = parser.parse_args(argv)
+
+    # Keep log formatting out of the measurements
+    logging.disable(logging.CRITICAL)
+
+    results: Dict[str, dict] = {}
+    print(f"{'benchmark':<22}{'per op':>14}{'ops/s':>14}")
+    for result in run(args.corpus_size, args.seed, args.repeat, args.min_time, args.only):
+        results[result.name] = result.to_dict()
+        print(f"{result.name:<22}{result.per_op * 1e6:>11.2f} us{result.ops_per_sec:>14,.0f}")
+
+    return finish(args, results, extra={"corpus": {"size": args.corpus_size, "seed": args.seed}})
+
+
+if __name__ == "__main__":
+    sys.exit(main())
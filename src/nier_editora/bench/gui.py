@@ -0,0 +1,180 @@
+# src/nier_editora/bench/gui.py
+"""
+gui.py
+
+Offscreen benchmark of the Qt editor (NierEditoraUI).
+
+Drives the main window under QT_QPA_PLATFORM=offscreen over a synthetic
+corpus and records, per run:
+  - open-to-populated latency of open_save()
+  - _populate_items() / _populate_weapons() / _populate_chips()
+  - add and remove latency for items, weapons and chips
+  - opening time of the add dialogs
+  - repaint cost per scroll step in each table view
+
+Modal dialogs are replaced by non-blocking stand-ins so the run needs no
+user input, and QSettings are redirected to a temporary directory so the
+user's own settings are left alone.
+
+Usage:
+    python -m nier_editora.bench.gui --save-baseline .bench/gui.json
+    python -m nier_editora.bench.gui --baseline .bench/gui.json
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from nier_editora.bench.harness import add_common_args, finish
+from nier_editora.core.corpus import generate_corpus
+
+
+def _stats(samples: List[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "median_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def run(corpus_size: int = 8, seed: int = 0, ops: int = 20) -> Dict[str, dict]:
+    """
+    Run the GUI benchmark over a synthetic corpus.
+
+    Args:
+        corpus_size: Number of synthetic saves to open.
+        seed: Seed for the synthetic corpus.
+        ops: Add/remove operations per save and inventory.
+
+    Returns:
+        Benchmark name → latency statistics in milliseconds.
+    """
+    from PySide6.QtCore import QSettings
+    from PySide6.QtWidgets import QApplication, QInputDialog, QMessageBox
+
+    samples: Dict[str, List[float]] = defaultdict(list)
+
+    with tempfile.TemporaryDirectory(prefix="niereditora-gui-bench-") as tmp:
+        tmp_dir = Path(tmp)
+        QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, str(tmp_dir / "settings"))
+        QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, str(tmp_dir / "settings"))
+        QSettings("YourCompany", "NieREditora").setValue("seenChipWarning", True)
+
+        paths = generate_corpus(
+            tmp_dir / "corpus", corpus_size, seed=seed, formats=("pc",),
+            fill={"inventory": 0.9, "weapons": 0.5, "chips": 0.9},
+        )
+
+        app = QApplication.instance() or QApplication([])
+        from nier_editora.ui.main_window import NierEditoraUI
+
+        dialog_start = [0.0]
+
+        def fake_get_item(parent, title, label, items, current=0, editable=True, *args, **kwargs):
+            dialog = QInputDialog(parent)
+            dialog.setWindowTitle(title)
+            dialog.setLabelText(label)
+            dialog.setComboBoxItems(items)
+            dialog.show()
+            app.processEvents()
+            samples["add_dialog_open"].append(time.perf_counter() - dialog_start[0])
+            dialog.close()
+            dialog.deleteLater()
+            return items[0], True
+
+        def timed(name: str, fn: Callable[[], object]) -> None:
+            start = time.perf_counter()
+            fn()
+            app.processEvents()
+            samples[name].append(time.perf_counter() - start)
+
+        def timed_add(name: str, fn: Callable[[], object]) -> None:
+            dialog_start[0] = start = time.perf_counter()
+            before = len(samples["add_dialog_open"])
+            fn()
+            app.processEvents()
+            total = time.perf_counter() - start
+            dialog = sum(samples["add_dialog_open"][before:])
+            samples[name].append(total - dialog)
+
+        def scroll(name: str, view) -> None:
+            bar = view.verticalScrollBar()
+            step = max(1, bar.pageStep())
+            for value in range(bar.minimum(), bar.maximum() + 1, step):
+                start = time.perf_counter()
+                bar.setValue(value)
+                view.viewport().repaint()
+                samples[name].append(time.perf_counter() - start)
+
+        original_get_item = QInputDialog.getItem
+        original_warning = QMessageBox.warning
+        QInputDialog.getItem = staticmethod(fake_get_item)
+        QMessageBox.warning = staticmethod(lambda *a, **k: QMessageBox.Ok)
+        try:
+            window = NierEditoraUI()
+            window.show()
+            app.processEvents()
+
+            for path in paths:
+                timed("open_to_populated", lambda: window.open_save(path))
+                timed("populate_items", window._populate_items)
+                timed("populate_weapons", window._populate_weapons)
+                timed("populate_chips", window._populate_chips)
+
+                scroll("scroll_repaint_items", window.item_table)
+                scroll("scroll_repaint_chips", window.chip_table)
+                scroll("scroll_repaint_weapons", window.weapon_table)
+
+                for _ in range(ops):
+                    window.item_table.selectRow(0)
+                    timed("remove_item", window._on_remove_item)
+                    timed_add("add_item", window._on_add_item)
+                    window.chip_table.selectRow(0)
+                    timed("remove_chip", window._on_remove_chip)
+                    timed_add("add_chip", window._on_add_chip)
+                window.weapon_table.selectRow(0)
+                timed("remove_weapon", window._on_remove_weapon)
+                timed_add("add_weapon", window._on_add_weapon)
+
+            window._dirty = False
+            window.close()
+        finally:
+            QInputDialog.getItem = original_get_item
+            QMessageBox.warning = original_warning
+
+    return {name: _stats(values) for name, values in samples.items() if values}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m nier_editora.bench.gui",
+        description="Offscreen Qt GUI latency benchmark",
+    )
+    parser.add_argument("--corpus-size", type=int, default=8, help="Synthetic saves to open")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic corpus")
+    parser.add_argument("--ops", type=int, default=20, help="Add/remove operations per save and inventory")
+    add_common_args(parser)
+    args = parser.parse_args(argv)
+
+    results = run(args.corpus_size, args.seed, args.ops)
+    print(f"{'benchmark':<26}{'mean':>10}{'p95':>10}{'max':>10}{'n':>6}")
+    for name, r in results.items():
+        print(f"{name:<26}{r['mean_ms']:>8.2f}ms{r['p95_ms']:>8.2f}ms{r['max_ms']:>8.2f}ms{r['n']:>6}")
+
+    return finish(args, results, metric="mean_ms", higher_is_better=False,
+                  extra={"corpus": {"size": args.corpus_size, "seed": args.seed}, "ops": args.ops})
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,213 @@
+# src/nier_editora/bench/harness.py
+"""
+harness.py
+
+Shared timing, reporting and baseline comparison for the benchmark suites.
+
+Results are written as JSON documents of the form
+{"environment": {...}, "results": {name: {...}}}; a previous document can
+be passed back as a baseline, and any benchmark whose throughput dropped by
+more than the threshold percentage is reported as a regression.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from nier_editora.core.corpus import DEFAULT_TEMPLATE, SaveGenerator
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SAVE: Path = DEFAULT_TEMPLATE
+
+
+@dataclass
+class Result:
+    """
+    Timing of one benchmark.
+
+    Attributes:
+        name: Benchmark name.
+        ops: Operations performed per timed run.
+        best: Fastest run, in seconds.
+        mean: Mean run time, in seconds.
+    """
+    name: str
+    ops: int
+    best: float
+    mean: float
+
+    @property
+    def per_op(self) -> float:
+        return self.best / self.ops
+
+    @property
+    def ops_per_sec(self) -> float:
+        return self.ops / self.best if self.best else float("inf")
+
+    def to_dict(self) -> dict:
+        return {
+            "ops": self.ops,
+            "best_s": self.best,
+            "mean_s": self.mean,
+            "per_op_us": self.per_op * 1e6,
+            "ops_per_sec": self.ops_per_sec,
+        }
+
+
+def measure(name: str, fn: Callable[[], object], ops: int = 1,
+            repeat: int = 5, min_time: float = 0.2) -> Result:
+    """
+    Time a callable, timeit-style.
+
+    The number of calls per run is doubled until a run takes at least
+    min_time, then the run is repeated and the best time is kept.
+
+    Args:
+        name: Benchmark name.
+        fn: Callable performing `ops` operations per call.
+        ops: Operations performed by one call of fn.
+        repeat: Number of timed runs.
+        min_time: Minimum duration of one run, in seconds.
+
+    Returns:
+        The Result for this benchmark.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - start >= min_time:
+            break
+        loops *= 2
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        timings.append(time.perf_counter() - start)
+    result = Result(name, ops * loops, min(timings), sum(timings) / len(timings))
+    logger.debug("%s: %.2f us/op", name, result.per_op * 1e6)
+    return result
+
+
+def synthetic_saves(count: int, seed: int = 0) -> List[bytes]:
+    """
+    Build a reproducible in-memory corpus from the bundled template.
+
+    Args:
+        count: Number of saves to build.
+        seed: Corpus seed, so runs are reproducible.
+
+    Returns:
+        Raw PC-format save bytes.
+    """
+    generator = SaveGenerator(TEMPLATE_SAVE.read_bytes())
+    return [generator.generate(seed, i) for i in range(count)]
+
+
+def environment() -> Dict[str, object]:
+    """
+    Describe the machine and revision a benchmark ran on.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent,
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def add_common_args(parser: argparse.ArgumentParser) -> None:
+    """
+    Add the output/baseline options shared by all benchmark suites.
+    """
+    parser.add_argument("-o", "--output", type=Path, help="Write the results as JSON to this path")
+    parser.add_argument("--baseline", type=Path, help="Compare against a results JSON from an earlier run")
+    parser.add_argument("--save-baseline", type=Path, metavar="PATH",
+                        help="Also write the results to PATH for use as a future baseline")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Fail if a benchmark gets worse by more than this percentage (default: 10)")
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float,
+            metric: str = "ops_per_sec", higher_is_better: bool = True) -> List[str]:
+    """
+    Find benchmarks that regressed against a baseline.
+
+    Args:
+        results: Current results, name → metrics.
+        baseline: Baseline results, name → metrics.
+        threshold: Allowed slowdown in percent.
+        metric: Metric to compare.
+        higher_is_better: Whether larger metric values are better.
+
+    Returns:
+        One message per regression.
+    """
+    regressions = []
+    for name, base in baseline.items():
+        if name not in results or metric not in base or not base[metric]:
+            continue
+        old, new = base[metric], results[name][metric]
+        change = (old - new) / old * 100 if higher_is_better else (new - old) / old * 100
+        if change > threshold:
+            regressions.append(f"{name}: {metric} {old:.6g} → {new:.6g} ({change:.1f}% worse)")
+    return regressions
+
+
+def finish(args: argparse.Namespace, results: Dict[str, dict],
+           metric: str = "ops_per_sec", higher_is_better: bool = True,
+           extra: Optional[dict] = None) -> int:
+    """
+    Write results, compare them with the baseline and pick the exit code.
+
+    Args:
+        args: Parsed arguments including the common options.
+        results: name → metrics mapping.
+        metric: Metric used for regression checks.
+        higher_is_better: Whether larger metric values are better.
+        extra: Additional top-level keys for the JSON document.
+
+    Returns:
+        0 if no benchmark regressed beyond the threshold, 1 otherwise.
+    """
+    document = {"environment": environment(), **(extra or {}), "results": results}
+    text = json.dumps(document, indent=2)
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(text + "\n", encoding="utf-8")
+            print(f"Results written to {path}")
+
+    if not args.baseline:
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    regressions = compare(results, baseline, args.threshold, metric, higher_is_better)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}%:", file=sys.stderr)
+        for line in regressions:
+            print(f"  ↳ {line}", file=sys.stderr)
+        return 1
+    print(f"\nNo regressions beyond {args.threshold:g}% against {args.baseline}")
+    return 0
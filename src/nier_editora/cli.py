@@ -1,17 +1,51 @@
 import argparse
+import json
 import logging
+import os
+import signal
 import sys
+import time
+from contextlib import closing
 from pathlib import Path
 
-from PySide6.QtWidgets import QApplication
-
-from nier_editora.ui.main_window import NierEditoraUI
-from .logging_config import setup_logging
+from .logging_config import parse_module_levels, setup_logging
+from .core import constants
+from .core.exceptions import EditConflictError, QueryError
 from .core.save import SaveFile
 from utils import console_to_pc, pc_to_console
 
 logger = logging.getLogger(__name__)
 
+# Output prefix used by a bare --profile
+DEFAULT_PROFILE = "niereditora-profile"
+
+def _expand_profile_flag(argv: list, commands) -> list:
+    """
+    Let --profile be given without a value.
+
+    argparse would take the subcommand name as the value of a bare
+    --profile, so a --profile in front of the subcommand that is followed
+    by the subcommand, another option or nothing is rewritten to
+    --profile=DEFAULT_PROFILE before parsing. A following value is kept.
+    """
+    expanded = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg in commands:
+            return expanded + argv[i:]
+        if arg == "--profile":
+            following = argv[i + 1] if i + 1 < len(argv) else None
+            if following is None or following in commands or following.startswith("-"):
+                expanded.append(f"--profile={DEFAULT_PROFILE}")
+            else:
+                expanded += [arg, following]
+                i += 1
+        else:
+            expanded.append(arg)
+        i += 1
+    return expanded
+
 def cmd_info(args: argparse.Namespace) -> None:
     """
     Show core save metadata: player name, play time, money, and XP.
@@ -34,25 +68,25 @@ def cmd_set(args: argparse.Namespace) -> None:
     Modify one or more fields in the save file.
 
     Args:
-        args: Parsed CLI args with optional fields to set (name, time, money, xp).
+        args: Parsed CLI args with optional fields to set (name, time, money, xp)
+            and bulk inventory operations (add/remove/max items, upgrade weapons).
     """
+    from .core import fields
+
     logger.debug("Executing 'set' with args=%s", args)
-    save = SaveFile.load_from_file(args.file)
-    updated = False
+    scalars = {}
 
     if args.name is not None:
-        save.player_name = args.name[:35]
-        print(f"  ↳ name = {save.player_name}")
-        logger.info("Player name set to %s", save.player_name)
-        updated = True
+        scalars["player_name"] = args.name[:35]
+        print(f"  ↳ name = {scalars['player_name']}")
+        logger.info("Player name set to %s", scalars["player_name"])
 
     if args.time is not None:
         try:
             h, m, s = map(int, args.time.split(':'))
-            save.play_time = h * 3600 + m * 60 + s
+            scalars["play_time"] = h * 3600 + m * 60 + s
             print(f"  ↳ play_time = {args.time}")
             logger.info("Play time set to %s", args.time)
-            updated = True
         except ValueError:
             logger.error("Invalid time format '%s'; use HH:MM:SS", args.time)
             sys.exit(1)
@@ -61,24 +95,59 @@ def cmd_set(args: argparse.Namespace) -> None:
         if args.money < 0:
             logger.error("Money must be non-negative, got %d", args.money)
             sys.exit(1)
-        save.money = args.money
-        print(f"  ↳ money = {save.money}")
-        logger.info("Money set to %d", save.money)
-        updated = True
+        scalars["money"] = args.money
+        print(f"  ↳ money = {args.money}")
+        logger.info("Money set to %d", args.money)
 
     if args.xp is not None:
         if args.xp < 0:
             logger.error("XP must be non-negative, got %d", args.xp)
             sys.exit(1)
-        save.xp = args.xp
-        print(f"  ↳ xp = {save.xp}")
-        logger.info("XP set to %d", save.xp)
-        updated = True
+        scalars["xp"] = args.xp
+        print(f"  ↳ xp = {args.xp}")
+        logger.info("XP set to %d", args.xp)
 
-    if not updated:
+    inventory_ops = []
+    if args.add_items:
+        inventory_ops.append(("add items", lambda save: save.inventory.add_many(args.add_items, args.qty)))
+    if args.remove_items:
+        removed = set(args.remove_items)
+        inventory_ops.append(("remove items",
+                              lambda save: save.inventory.remove_where(lambda item: item.id in removed)))
+    if args.max_items is not None:
+        inventory_ops.append(("max items", lambda save: save.inventory.max_all(args.max_items)))
+    if args.upgrade_weapons is not None:
+        inventory_ops.append(("upgrade weapons",
+                              lambda save: save.weapons.upgrade_all_weapons(args.upgrade_weapons)))
+
+    if not scalars and not inventory_ops:
         logger.error("No fields specified to set")
         sys.exit(1)
 
+    # Scalar-only edits in place: patch the field bytes instead of re-encoding the save
+    if not inventory_ops and args.output is None:
+        try:
+            fields.write_many(args.file, scalars)
+        except ValueError as e:
+            logger.error("Cannot set fields: %s", e)
+            sys.exit(1)
+        logger.info("Patched %d field(s) of %s", len(scalars), args.file)
+        print(f"Saved to {args.file}")
+        return
+
+    save = SaveFile.load_from_file(args.file)
+    for field, value in scalars.items():
+        setattr(save, field, value)
+
+    for label, op in inventory_ops:
+        try:
+            summary = op(save)
+        except ValueError as e:
+            logger.error("Cannot %s: %s", label, e)
+            sys.exit(1)
+        print(f"  ↳ {label}: {summary}")
+        logger.info("%s: %s", label.capitalize(), summary)
+
     destination = args.output or args.file
     save.save_to_file(destination)
     logger.info("Saved updated save to %s", destination)
@@ -109,10 +178,411 @@ def cmd_convert(args: argparse.Namespace) -> None:
     destination.write_bytes(out_data)
     print(f"Converted ({direction}) and wrote to {destination}")
 
+def cmd_validate(args: argparse.Namespace) -> None:
+    """
+    Run region-level checks over save files and emit a JSON report.
+
+    Args:
+        args: CLI args (expects args.paths as a list of files/directories,
+              args.jobs, args.format and an optional args.output Path).
+    """
+    from .core.validate import validate_paths
+
+    logger.debug("Executing 'validate' with args=%s", args)
+    out = args.output.open("w", encoding="utf-8") if args.output else sys.stdout
+    total = invalid = 0
+    try:
+        if args.format == "jsonl":
+            for report in validate_paths(args.paths, jobs=args.jobs):
+                total += 1
+                invalid += not report.ok
+                out.write(json.dumps(report.to_dict()) + "\n")
+        else:
+            reports = [report.to_dict() for report in validate_paths(args.paths, jobs=args.jobs)]
+            total = len(reports)
+            invalid = sum(not r["ok"] for r in reports)
+            json.dump({"files": total, "invalid": invalid, "reports": reports}, out, indent=2)
+            out.write("\n")
+    finally:
+        if args.output:
+            out.close()
+
+    logger.info("Validated %d file(s), %d invalid", total, invalid)
+    if invalid:
+        sys.exit(1)
+
+def cmd_normalize(args: argparse.Namespace) -> None:
+    """
+    Merge, clamp, compact and sort the inventories of save files in place.
+
+    Args:
+        args: CLI args (expects args.paths, args.kinds, args.sort, args.cap,
+              args.no_merge, args.dry_run, args.jobs and args.format).
+    """
+    from .core.normalize import normalize_paths
+
+    logger.debug("Executing 'normalize' with args=%s", args)
+    kinds = [kind.strip() for kind in args.kinds.split(",") if kind.strip()]
+    unknown = sorted(set(kinds) - set(SaveFile.INVENTORY_FIELDS))
+    if unknown:
+        logger.error("Unknown inventory kind(s): %s", ", ".join(unknown))
+        sys.exit(1)
+    if args.cap < 0:
+        logger.error("Cap must be non-negative, got %d", args.cap)
+        sys.exit(1)
+
+    total = changed = failed = 0
+    for report in normalize_paths(args.paths, jobs=args.jobs, kinds=kinds, sort=args.sort, cap=args.cap,
+                                  merge=not args.no_merge, dry_run=args.dry_run):
+        total += 1
+        changed += report.changed
+        failed += report.error is not None
+        if args.format == "jsonl":
+            print(json.dumps(report.to_dict()))
+        elif report.error:
+            print(f"{report.path}: error: {report.error}")
+        elif report.changed:
+            print(report.path)
+            for result in report.results:
+                if result.changed:
+                    print(f"  ↳ {result}")
+
+    verb = "would change" if args.dry_run else "changed"
+    logger.info("Normalized %d file(s), %s %d, %d failed", total, verb, changed, failed)
+    if failed:
+        sys.exit(1)
+
+def cmd_optimize_chips(args: argparse.Namespace) -> None:
+    """
+    Print the best chip loadout of a save for a weight budget.
+
+    Args:
+        args: CLI args (expects args.file, args.budget, args.score and args.format).
+    """
+    from .core.loadout import optimize
+
+    logger.debug("Executing 'optimize-chips' with args=%s", args)
+    if args.budget < 0:
+        logger.error("Budget must be non-negative, got %d", args.budget)
+        sys.exit(1)
+    save = SaveFile.load_from_file(args.file)
+    loadout = optimize(save.chips.active, budget=args.budget, score=args.score)
+
+    if args.format == "json":
+        print(json.dumps(loadout.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print(f"Score {loadout.score:g}, weight {loadout.weight}/{loadout.budget}, {len(loadout.chips)} chip(s)")
+        for chip in loadout.chips:
+            print(f"  ↳ [{chip.index:3d}] {chip.name or chip.base_id} (+{chip.level}, weight {chip.weight})")
+    logger.info("Optimized chip loadout for %s", args.file)
+
+def cmd_index(args: argparse.Namespace) -> None:
+    """
+    Build or incrementally update an SQLite index of save files.
+
+    Args:
+        args: CLI args (expects args.paths, args.db Path, args.jobs and args.no_prune).
+    """
+    from .core.index import SaveIndex
+
+    logger.debug("Executing 'index' with args=%s", args)
+    with SaveIndex(args.db) as index:
+        stats = index.update(args.paths, jobs=args.jobs, prune=not args.no_prune)
+
+    print(f"Scanned   : {stats.scanned}")
+    print(f"Indexed   : {stats.indexed}")
+    print(f"Unchanged : {stats.unchanged}")
+    print(f"Removed   : {stats.removed}")
+    print(f"Errors    : {len(stats.errors)}")
+    for path, error in stats.errors.items():
+        print(f"  ↳ {path}: {error}")
+
+def cmd_query(args: argparse.Namespace) -> None:
+    """
+    Query an index built by 'index' and stream the results.
+
+    Args:
+        args: CLI args (expects args.db, args.table, args.where, args.group_by,
+              args.agg, args.order_by, args.limit and args.format).
+    """
+    from .core.index import connect
+    from .core.query import Query, parse_aggregate, parse_condition, run_query, write_csv, write_jsonl
+
+    logger.debug("Executing 'query' with args=%s", args)
+    if not args.db.exists():
+        logger.error("Index database not found: %s", args.db)
+        sys.exit(1)
+
+    try:
+        query = Query(
+            table=args.table,
+            where=[parse_condition(expr) for expr in args.where],
+            group_by=[col for spec in args.group_by for col in spec.split(",") if col],
+            aggregates=[parse_aggregate(spec) for spec in args.agg],
+            order_by=args.order_by,
+            descending=args.desc,
+            limit=args.limit,
+        )
+    except QueryError as e:
+        logger.error("%s", e)
+        sys.exit(1)
+
+    writer = write_csv if args.format == "csv" else write_jsonl
+    with closing(connect(args.db)) as conn:
+        try:
+            columns, rows = run_query(conn, query)
+            count = writer(columns, rows, sys.stdout)
+            sys.stdout.flush()
+        except QueryError as e:
+            logger.error("%s", e)
+            sys.exit(1)
+        except BrokenPipeError:
+            # The reader (e.g. head) stopped early; point stdout at devnull so
+            # the interpreter does not complain again when flushing it on exit
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return
+    logger.info("Query returned %d row(s)", count)
+
+def cmd_dump(args: argparse.Namespace) -> None:
+    """
+    Stream inventory records of many saves as JSON lines.
+
+    Args:
+        args: CLI args (expects args.paths, args.fields, args.kinds, args.all
+              and an optional args.output Path).
+    """
+    from .core import export
+
+    logger.debug("Executing 'dump' with args=%s", args)
+    try:
+        fields = export.parse_fields(args.fields)
+    except ValueError as e:
+        logger.error("%s", e)
+        sys.exit(1)
+    kinds = args.kinds or tuple(export.KIND_FIELDS)
+
+    rows = export.iter_dump(args.paths, fields=fields, kinds=kinds, include_inactive=args.all)
+    out = args.output.open("w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        count = export.write_jsonl(rows, out)
+    finally:
+        if args.output:
+            out.close()
+    logger.info("Dumped %d record(s)", count)
+
+def cmd_import(args: argparse.Namespace) -> None:
+    """
+    Apply a JSON or CSV document of record edits to a save in one write.
+
+    Args:
+        args: CLI args (expects args.file, args.edits and an optional args.output Path).
+    """
+    from .core.importer import import_edits
+
+    logger.debug("Executing 'import' with args=%s", args)
+    try:
+        summary = import_edits(args.file, args.edits, output=args.output)
+    except EditConflictError as e:
+        logger.error("Nothing written; %d conflict(s) found", len(e.conflicts))
+        for conflict in e.conflicts:
+            print(f"  ↳ {conflict}")
+        sys.exit(1)
+
+    destination = args.output or args.file
+    print(f"  ↳ set={summary.set} added={summary.added} removed={summary.removed}")
+    print(f"Saved to {destination}")
+
+def cmd_gen_corpus(args: argparse.Namespace) -> None:
+    """
+    Generate a reproducible corpus of synthetic saves from a template.
+
+    Args:
+        args: CLI args (expects args.out_dir, args.count, args.seed, args.template,
+              args.fill, args.formats and args.jobs).
+    """
+    from .core import corpus
+
+    logger.debug("Executing 'gen-corpus' with args=%s", args)
+    fill = {}
+    for spec in args.fill:
+        for part in filter(None, spec.split(",")):
+            kind, _, ratio = part.partition("=")
+            try:
+                fill[kind.strip()] = float(ratio)
+            except ValueError:
+                logger.error("Invalid fill ratio '%s'; use e.g. inventory=0.8", part)
+                sys.exit(1)
+    formats = [fmt for spec in args.formats for fmt in spec.split(",") if fmt] or list(corpus.FORMATS)
+
+    try:
+        paths = corpus.generate_corpus(
+            args.out_dir, args.count, seed=args.seed, template=args.template,
+            fill=fill, formats=formats, jobs=args.jobs,
+        )
+    except ValueError as e:
+        logger.error("%s", e)
+        sys.exit(1)
+    print(f"Generated {args.count} saves ({len(paths)} files) in {args.out_dir}")
+
+def _id_list(text: str) -> list:
+    """
+    Parse a comma-separated list of decimal or 0x-prefixed ids.
+    """
+    try:
+        return [int(part, 0) for part in text.split(",") if part.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid id list: {text!r}")
+
+def _interrupt(signum, frame) -> None:
+    raise KeyboardInterrupt
+
+def cmd_serve(args: argparse.Namespace) -> None:
+    """
+    Run the JSON-RPC daemon until interrupted.
+
+    Args:
+        args: CLI args (expects args.socket Path or args.host/args.port with
+              args.allow_tcp and args.token, plus args.write_root and args.cache_size).
+    """
+    from .server import SaveService, make_server
+
+    token = args.token or os.environ.get("NIEREDITORA_TOKEN")
+    if args.socket is None and not (args.allow_tcp and token):
+        logger.error("Serving over TCP needs --allow-tcp and a --token (or NIEREDITORA_TOKEN); "
+                     "use --socket for a local Unix socket")
+        sys.exit(1)
+    service = SaveService(cache_size=args.cache_size, write_root=args.write_root,
+                          token=token if args.socket is None else args.token)
+    service.warm_up()
+    address = args.socket or (args.host, args.port)
+    try:
+        server = make_server(address, service)
+    except OSError as e:
+        logger.error("Cannot listen on %s: %s", address, e)
+        sys.exit(1)
+    with server:
+        where = args.socket or "%s:%d" % server.server_address[:2]
+        print(f"Serving JSON-RPC on {where} (Ctrl+C to stop)", flush=True)
+        # Stop cleanly on SIGTERM too, so the socket file is removed
+        signal.signal(signal.SIGTERM, _interrupt)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down")
+
+def cmd_watch(args: argparse.Namespace) -> None:
+    """
+    Print change events of save files until interrupted.
+
+    Args:
+        args: CLI args (expects args.paths, args.interval, args.backend and args.format).
+    """
+    from .core.watch import SaveWatcher
+
+    try:
+        watcher = SaveWatcher(args.paths, interval=args.interval, backend=args.backend)
+    except OSError as e:
+        logger.error("Cannot watch: %s", e)
+        sys.exit(1)
+    if not watcher.paths:
+        logger.error("No save files found to watch")
+        sys.exit(1)
+    logger.info("Watching %d file(s) using %s", len(watcher.paths), watcher.backend)
+    with watcher:
+        try:
+            for event in watcher:
+                if args.format == "jsonl":
+                    print(json.dumps(event.to_dict()), flush=True)
+                else:
+                    print(f"{time.strftime('%H:%M:%S')} {event.path.name}: {event.message}", flush=True)
+        except KeyboardInterrupt:
+            pass
+
+def cmd_record(args: argparse.Namespace) -> None:
+    """
+    Append snapshots of a save to a timeline, once or on every change.
+
+    Args:
+        args: CLI args (expects args.db, args.file, args.watch and args.interval).
+    """
+    from .core.timeline import Timeline
+    from .core.watch import SaveWatcher
+
+    with Timeline(args.db) as timeline:
+        try:
+            seq = timeline.record(args.file)
+        except Exception as e:
+            logger.error("Failed to record %s: %s", args.file, e)
+            sys.exit(1)
+        if seq is None:
+            logger.info("No change since the last snapshot")
+        else:
+            logger.info("Recorded snapshot %d", seq)
+        if not args.watch:
+            return
+
+        logger.info("Recording changes of %s into %s", args.file, args.db)
+        with SaveWatcher([args.file], interval=args.interval) as watcher:
+            try:
+                while True:
+                    if not watcher.wait():
+                        continue
+                    try:
+                        seq = timeline.record(args.file)
+                    except Exception as e:
+                        logger.warning("Skipping snapshot: %s", e)
+                        continue
+                    if seq is not None:
+                        logger.info("Recorded snapshot %d", seq)
+            except KeyboardInterrupt:
+                pass
+
+def cmd_timeline(args: argparse.Namespace) -> None:
+    """
+    Query a timeline recorded with 'record'.
+
+    Args:
+        args: CLI args (expects args.db, args.series, args.first_seen and args.format).
+    """
+    from .core.timeline import Timeline
+
+    if not args.db.exists():
+        logger.error("No timeline at %s", args.db)
+        sys.exit(1)
+    with Timeline(args.db) as timeline:
+        if args.series:
+            try:
+                points = timeline.series(args.series)
+            except ValueError as e:
+                logger.error("%s", e)
+                sys.exit(1)
+        elif args.first_seen is not None:
+            point = timeline.first_seen(args.first_seen)
+            if point is None:
+                print(f"ID {args.first_seen} never appears")
+                return
+            points = [point]
+        else:
+            usage = timeline.storage()
+            print(f"{usage['snapshots']} snapshot(s), {usage['patch_bytes']} bytes of patches")
+            return
+
+    for point in points:
+        value = point.value.hex() if isinstance(point.value, bytes) else point.value
+        if args.format == "jsonl":
+            print(json.dumps({"seq": point.seq, "taken_at": point.taken_at, "value": value}))
+        else:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(point.taken_at))
+            print(f"#{point.seq:<6} {stamp}  {value}")
+
 def cmd_gui(args: argparse.Namespace) -> None:
     """
     Launch the PySide6 GUI.
     """
+    # Imported here so the batch commands don't pay for loading Qt
+    from PySide6.QtWidgets import QApplication
+    from nier_editora.ui.main_window import NierEditoraUI
+
     logger.debug("Launching GUI...")
     app = QApplication(sys.argv)
     window = NierEditoraUI()
@@ -138,6 +608,38 @@ def main() -> int:
         action="store_true",
         help="Suppress INFO messages; only show warnings and errors."
     )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Show DEBUG messages."
+    )
+    parser.add_argument(
+        "--log-level",
+        action="append",
+        default=[],
+        metavar="MODULE=LEVEL",
+        help="Override the level of one logger, e.g. nier_editora.core.save=DEBUG (repeatable)"
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="OUT",
+        help=("Run the command under cProfile and write OUT.pstats and a flamegraph-compatible "
+              f"OUT.collapsed (bare --profile: {DEFAULT_PROFILE}). Worker pools are disabled "
+              "so all work is profiled.")
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=25,
+        metavar="N",
+        help="Number of functions to print with --profile (default: 25)"
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help=("Print per-phase timings (read, conversion, decode/encode per region, disk write) "
+              "to stderr when the command finishes. Worker pools are disabled.")
+    )
     subparsers = parser.add_subparsers(dest="cmd", required=True)
 
     # info subcommand
@@ -154,6 +656,14 @@ def main() -> int:
     p_set.add_argument("--time", type=str, help="Play time as HH:MM:SS")
     p_set.add_argument("--money", type=int, help="Money (non-negative integer)")
     p_set.add_argument("--xp", type=int, help="XP (non-negative integer)")
+    p_set.add_argument("--add-items", type=_id_list, metavar="ID[,ID...]",
+                       help="Add items (decimal or 0x hex ids), stacking onto existing slots")
+    p_set.add_argument("--qty", type=int, default=1, help="Quantity per id for --add-items (default: 1)")
+    p_set.add_argument("--remove-items", type=_id_list, metavar="ID[,ID...]", help="Remove every stack of these items")
+    p_set.add_argument("--max-items", type=int, nargs="?", const=constants.MAX_ITEM_QUANTITY, metavar="CAP",
+                       help=f"Set every item's quantity to CAP (default: {constants.MAX_ITEM_QUANTITY})")
+    p_set.add_argument("--upgrade-weapons", type=int, nargs="?", const=constants.MAX_WEAPON_LEVEL, metavar="LEVEL",
+                       help=f"Raise every weapon to LEVEL (default: {constants.MAX_WEAPON_LEVEL})")
     p_set.set_defaults(func=cmd_set)
 
     # convert subcommand
@@ -168,23 +678,197 @@ def main() -> int:
                        help="Convert PC save → console format")
     p_conv.set_defaults(func=cmd_convert)
 
+    # validate subcommand
+    p_val = subparsers.add_parser("validate", help="Check save files for corrupted regions")
+    p_val.add_argument("paths", type=Path, nargs="+",
+                       help="Save files or directories (searched recursively)")
+    p_val.add_argument("-j", "--jobs", type=int,
+                       help="Number of worker processes (default: CPU count)")
+    p_val.add_argument("--format", choices=("json", "jsonl"), default="json",
+                       help="Report format: one JSON document or one line per file")
+    p_val.add_argument("-o", "--output", type=Path,
+                       help="Write the report to this path (default: stdout)")
+    p_val.set_defaults(func=cmd_validate)
+
+    # normalize subcommand
+    p_norm = subparsers.add_parser("normalize", help="Merge stacks, compact and sort inventories in place")
+    p_norm.add_argument("paths", type=Path, nargs="+", help="Save files or directories (searched recursively)")
+    p_norm.add_argument("--kinds", default=",".join(SaveFile.INVENTORY_FIELDS),
+                        help="Comma-separated inventories to normalize (default: all)")
+    p_norm.add_argument("--sort", choices=("id", "category", "name", "slot"), default="id",
+                        help="Order of the compacted records; 'slot' keeps the current order (default: id)")
+    p_norm.add_argument("--cap", type=int, default=constants.MAX_ITEM_QUANTITY,
+                        help=f"Maximum item quantity (default: {constants.MAX_ITEM_QUANTITY})")
+    p_norm.add_argument("--no-merge", action="store_true", help="Keep duplicate item stacks separate")
+    p_norm.add_argument("--dry-run", action="store_true", help="Report changes without writing files")
+    p_norm.add_argument("-j", "--jobs", type=int, help="Number of worker processes (default: CPU count)")
+    p_norm.add_argument("--format", choices=("text", "jsonl"), default="text", help="Output format")
+    p_norm.set_defaults(func=cmd_normalize)
+
+    # optimize-chips subcommand
+    p_opt = subparsers.add_parser("optimize-chips", help="Find the best chip loadout within a weight budget")
+    p_opt.add_argument("file", type=Path, help="Path to the save file")
+    p_opt.add_argument("--budget", type=int, default=128, help="Maximum total chip weight (default: 128)")
+    p_opt.add_argument("--score", choices=("level", "count"), default="level",
+                       help="Maximize summed chip levels or the number of chips (default: level)")
+    p_opt.add_argument("--format", choices=("text", "json"), default="text", help="Output format")
+    p_opt.set_defaults(func=cmd_optimize_chips)
+
+    # index subcommand
+    p_idx = subparsers.add_parser("index", help="Index save files into an SQLite database")
+    p_idx.add_argument("paths", type=Path, nargs="+",
+                       help="Save files or directories (searched recursively)")
+    p_idx.add_argument("--db", type=Path, required=True, help="SQLite database to create or update")
+    p_idx.add_argument("-j", "--jobs", type=int,
+                       help="Number of worker processes (default: CPU count)")
+    p_idx.add_argument("--no-prune", action="store_true",
+                       help="Keep entries for files that no longer exist")
+    p_idx.set_defaults(func=cmd_index)
+
+    # query subcommand
+    p_query = subparsers.add_parser(
+        "query", help="Query an index built by 'index'",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "examples:\n"
+            "  saves containing item 0x41a with quantity >= 50:\n"
+            "    niereditora query --db saves.sqlite items -w item_id=0x41a -w 'quantity>=50' --group-by path\n"
+            "  max weapon level per save:\n"
+            "    niereditora query --db saves.sqlite weapons --group-by path --agg max:level\n"
+            "  chip weight histogram:\n"
+            "    niereditora query --db saves.sqlite chips --group-by weight --agg count --format csv"
+        ),
+    )
+    p_query.add_argument("table", choices=("files", "items", "weapons", "chips"),
+                         help="Table to query; record tables are joined with their file")
+    p_query.add_argument("--db", type=Path, required=True, help="SQLite database built by 'index'")
+    p_query.add_argument("-w", "--where", action="append", default=[], metavar="EXPR",
+                         help="Condition like 'quantity>=50' (repeatable, combined with AND)")
+    p_query.add_argument("--group-by", action="append", default=[], metavar="COL",
+                         help="Group by these columns (repeatable or comma-separated)")
+    p_query.add_argument("--agg", action="append", default=[], metavar="FUNC[:COL]",
+                         help="Aggregate like 'count' or 'max:level' (repeatable)")
+    p_query.add_argument("--order-by", metavar="COL", help="Sort by an output column")
+    p_query.add_argument("--desc", action="store_true", help="Sort in descending order")
+    p_query.add_argument("--limit", type=int, help="Maximum number of rows")
+    p_query.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="Output format")
+    p_query.set_defaults(func=cmd_query)
+
+    # dump subcommand
+    p_dump = subparsers.add_parser("dump", help="Stream inventory records of many saves as JSON lines")
+    p_dump.add_argument("paths", type=Path, nargs="+",
+                        help="Save files or directories (searched recursively)")
+    p_dump.add_argument("--fields",
+                        help="Comma-separated fields to emit (default: all; an unknown name lists the others)")
+    p_dump.add_argument("--kind", dest="kinds", action="append", choices=SaveFile.INVENTORY_FIELDS,
+                        help="Inventory to dump (repeatable; default: all)")
+    p_dump.add_argument("--all", action="store_true", help="Include empty slots")
+    p_dump.add_argument("-o", "--output", type=Path, help="Write to this path (default: stdout)")
+    p_dump.set_defaults(func=cmd_dump)
+
+    # import subcommand
+    p_imp = subparsers.add_parser("import", help="Apply a JSON/CSV document of record edits to a save")
+    p_imp.add_argument("file", type=Path, help="Path to save file")
+    p_imp.add_argument("edits", type=Path,
+                       help="JSON list or CSV with columns kind, op, slot, id, quantity, level, weight, ...")
+    p_imp.add_argument("-o", "--output", type=Path,
+                       help="Write result to this path (default: overwrite input)")
+    p_imp.set_defaults(func=cmd_import)
+
+    # gen-corpus subcommand
+    p_gen = subparsers.add_parser("gen-corpus", help="Generate synthetic saves for benchmarks and fuzzing")
+    p_gen.add_argument("out_dir", type=Path, help="Directory to write the corpus into")
+    p_gen.add_argument("-n", "--count", type=int, default=100, help="Number of saves (default: 100)")
+    p_gen.add_argument("--seed", type=int, default=0, help="Corpus seed (default: 0)")
+    p_gen.add_argument("--template", type=Path, help="Save to derive from (default: bundled SlotData_0.dat)")
+    p_gen.add_argument("--fill", action="append", default=[], metavar="KIND=RATIO",
+                       help="Fraction of occupied slots, e.g. inventory=0.8,chips=0.3 "
+                            f"(kinds: {', '.join(SaveFile.INVENTORY_FIELDS)})")
+    p_gen.add_argument("--format", dest="formats", action="append", default=[],
+                       help="Formats to emit: pc, console (default: both)")
+    p_gen.add_argument("-j", "--jobs", type=int, help="Number of worker processes (default: CPU count)")
+    p_gen.set_defaults(func=cmd_gen_corpus)
+
+    # serve subcommand
+    p_serve = subparsers.add_parser(
+        "serve",
+        help="Run a JSON-RPC daemon that keeps catalogs and saves in memory",
+        description="Serve info, set, convert, diff, dump and stats as JSON-RPC 2.0, "
+                    "one JSON document per line, on a Unix socket or a localhost TCP port.",
+    )
+    p_serve.add_argument("--socket", type=Path, help="Listen on this Unix socket instead of TCP")
+    p_serve.add_argument("--host", default="127.0.0.1", help="TCP host (default: 127.0.0.1)")
+    p_serve.add_argument("--port", type=int, default=47600, help="TCP port (default: 47600)")
+    p_serve.add_argument("--allow-tcp", action="store_true",
+                         help="Serve over TCP; requires --token, since TCP clients are not authenticated otherwise")
+    p_serve.add_argument("--token", help="Token every request must pass as the 'token' param "
+                                         "(default for TCP: $NIEREDITORA_TOKEN)")
+    p_serve.add_argument("--write-root", type=Path,
+                         help="Only let set and convert write files below this directory")
+    p_serve.add_argument("--cache-size", type=int, default=64, help="Parsed saves kept in memory (default: 64)")
+    p_serve.set_defaults(func=cmd_serve)
+
+    # watch subcommand
+    p_watch = subparsers.add_parser("watch", help="Print field-level changes of save files as they are written")
+    p_watch.add_argument("paths", nargs="+", type=Path, help="Save files and/or directories")
+    p_watch.add_argument("--interval", type=float, default=0.5, help="Seconds between checks (default: 0.5)")
+    p_watch.add_argument("--backend", choices=("auto", "poll", "inotify"), default="auto",
+                         help="Change detection: stat polling, inotify, or inotify when available (default)")
+    p_watch.add_argument("--format", choices=("text", "jsonl"), default="text", help="Output format")
+    p_watch.set_defaults(func=cmd_watch)
+
+    # record subcommand
+    p_rec = subparsers.add_parser("record", help="Append snapshots of a save to a playthrough timeline")
+    p_rec.add_argument("db", type=Path, help="Timeline database (created if missing)")
+    p_rec.add_argument("file", type=Path, help="Save file to snapshot")
+    p_rec.add_argument("--watch", action="store_true", help="Keep recording every time the file changes")
+    p_rec.add_argument("--interval", type=float, default=0.5, help="Seconds between checks (default: 0.5)")
+    p_rec.set_defaults(func=cmd_record)
+
+    # timeline subcommand
+    p_tl = subparsers.add_parser("timeline", help="Query a playthrough timeline")
+    p_tl.add_argument("db", type=Path, help="Timeline database")
+    group = p_tl.add_mutually_exclusive_group()
+    group.add_argument("--series", metavar="FIELD", help="Print the values of a field over time, e.g. money")
+    group.add_argument("--first-seen", type=int, metavar="ID", help="Print when a record with this ID first appeared")
+    p_tl.add_argument("--format", choices=("text", "jsonl"), default="text", help="Output format")
+    p_tl.set_defaults(func=cmd_timeline)
+
     # gui subcommand
     p_gui = subparsers.add_parser("gui", help="Launch the Qt-based GUI")
     p_gui.set_defaults(func=cmd_gui)
 
-    args = parser.parse_args()
+    args = parser.parse_args(_expand_profile_flag(sys.argv[1:], subparsers.choices))
 
     # Configure logging
-    level = "WARNING" if args.quiet else "DEBUG"
-    setup_logging(level=level)
+    try:
+        module_levels = parse_module_levels(args.log_level)
+    except ValueError as e:
+        parser.error(str(e))
+    level = "WARNING" if args.quiet else "DEBUG" if args.verbose else "INFO"
+    setup_logging(level=level, module_levels=module_levels)
+
+    # Profiles and metrics only cover this process, so keep batch work in it
+    if (args.profile or args.metrics) and hasattr(args, "jobs"):
+        args.jobs = 1
+    if args.metrics:
+        from .core import metrics
+        metrics.enable()
 
     try:
-        args.func(args)
+        if args.profile:
+            from .profiling import profile_call
+            profile_call(args.func, args, out=Path(args.profile), top=args.profile_top)
+        else:
+            args.func(args)
     except SystemExit:
         raise
     except Exception:
         logger.exception("An unexpected error occurred")
         return 1
+    finally:
+        if args.metrics:
+            metrics.report(sys.stderr)
     return 0
 
 if __name__ == '__main__':
@@ -0,0 +1,177 @@
+# src/nier_editora/core/aio.py
+"""
+aio.py
+
+asyncio counterparts of the blocking load/save API.
+
+File I/O runs on a shared thread pool; parsing runs on a shared process
+pool (or on the thread pool with executor="thread"), so the event loop
+is never blocked by a save being read, decoded or written:
+
+    save = await SaveFile.aload(path)
+    await save.asave(path)
+
+    async for path, save in iter_saves(paths, concurrency=8):
+        ...
+
+iter_saves keeps at most `concurrency` files in flight and stops
+scheduling new ones until the consumer catches up, so a slow consumer
+never makes it read the whole corpus into memory.
+
+Parsed saves come back from the process pool pickled, which costs roughly
+half a parse on the receiving side; the thread executor avoids that copy
+at the price of running the decode under the GIL, and is what "auto"
+picks on single-CPU machines.
+"""
+
+import asyncio
+import atexit
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Deque, Iterable, Optional, Tuple
+
+from nier_editora.core.save import SaveFile, iter_save_paths
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = ("auto", "process", "thread")
+
+_pools_lock = threading.Lock()
+_io_pool: Optional[ThreadPoolExecutor] = None
+_parse_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _io_executor() -> ThreadPoolExecutor:
+    global _io_pool
+    with _pools_lock:
+        if _io_pool is None:
+            _io_pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4),
+                                          thread_name_prefix="niereditora-io")
+        return _io_pool
+
+
+def _parse_executor(executor: str) -> Executor:
+    global _parse_pool
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor {executor!r}; expected one of {', '.join(EXECUTORS)}")
+    if executor == "thread" or (executor == "auto" and (os.cpu_count() or 1) < 2):
+        return _io_executor()
+    with _pools_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        return _parse_pool
+
+
+def shutdown() -> None:
+    """
+    Shut down the shared pools; they are recreated on next use.
+    """
+    global _io_pool, _parse_pool
+    with _pools_lock:
+        pools, _io_pool, _parse_pool = (_io_pool, _parse_pool), None, None
+    for pool in pools:
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+
+atexit.register(shutdown)
+
+
+def _parse(data: bytes) -> SaveFile:
+    save = SaveFile()
+    save.load(data)
+    return save
+
+
+def _write(save: SaveFile, path: Path) -> None:
+    save.save_to_file(path)
+
+
+async def load(path: Path, executor: str = "auto") -> SaveFile:
+    """
+    Load a save file without blocking the event loop.
+
+    Args:
+        path: Path to the save file.
+        executor: "process" to parse on the shared process pool, "thread"
+            to parse on the I/O thread pool, or "auto" for the process pool
+            unless there is only one CPU.
+
+    Returns:
+        The parsed SaveFile.
+    """
+    loop = asyncio.get_running_loop()
+    parse_pool = _parse_executor(executor)
+    data = await loop.run_in_executor(_io_executor(), Path(path).read_bytes)
+    return await loop.run_in_executor(parse_pool, _parse, data)
+
+
+async def save(save_file: SaveFile, path: Path) -> None:
+    """
+    Serialize and write a save without blocking the event loop.
+
+    Encoding runs on the I/O thread pool together with the write, since
+    shipping the SaveFile to another process would cost more than the
+    encode itself.
+
+    Args:
+        save_file: Save to write.
+        path: Destination path.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_io_executor(), _write, save_file, Path(path))
+
+
+async def iter_saves(paths: Iterable[Path], concurrency: int = 4,
+                     executor: str = "auto") -> AsyncIterator[Tuple[Path, SaveFile]]:
+    """
+    Load many save files concurrently, in input order.
+
+    At most `concurrency` files are read or parsed at any time, including
+    the ones already done but not yet consumed. Files that fail to load are
+    logged and skipped.
+
+    Args:
+        paths: Files and/or directories; directories are searched recursively.
+        concurrency: Maximum number of files in flight.
+        executor: "auto", "process" or "thread", as for `load`.
+
+    Yields:
+        (path, SaveFile) pairs.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    _parse_executor(executor)
+    loop = asyncio.get_running_loop()
+    pending = await loop.run_in_executor(_io_executor(), lambda: list(iter_save_paths(Path(p) for p in paths)))
+    logger.debug("Loading %d file(s) with concurrency %d", len(pending), concurrency)
+
+    remaining = iter(pending)
+    in_flight: Deque[Tuple[Path, "asyncio.Task[SaveFile]"]] = deque()
+
+    def schedule() -> None:
+        while len(in_flight) < concurrency:
+            path = next(remaining, None)
+            if path is None:
+                return
+            in_flight.append((path, asyncio.ensure_future(load(path, executor))))
+
+    try:
+        schedule()
+        while in_flight:
+            path, task = in_flight.popleft()
+            try:
+                result = await task
+            except Exception as e:
+                logger.warning("Skipping %s: %s", path, e)
+                schedule()
+                continue
+            schedule()
+            yield path, result
+    finally:
+        for _, task in in_flight:
+            task.cancel()
@@ -0,0 +1,206 @@
+# src/nier_editora/core/cache.py
+"""
+cache.py
+
+Process-wide LRU cache of parsed save files.
+
+Entries are keyed by the resolved path plus either the file's (size,
+mtime_ns) or a hash of its content, so a file that changed on disk is
+parsed again. The cache bounds both the number of entries and their
+approximate memory use, evicting the least recently used save first.
+
+The cache keeps a snapshot of each parse, holding only captured record
+values, and callers receive snapshots of that; the cached entry itself is
+never handed out, so editing a loaded save cannot corrupt the cache.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Hashable, Optional, Tuple
+
+from nier_editora.core import constants
+from nier_editora.core.save import SaveFile
+
+logger = logging.getLogger(__name__)
+
+KEY_MODES = ("stat", "hash")
+
+# Approximate in-memory size of one parsed record (object, __dict__, ints)
+_RECORD_BYTES = 400
+_RECORDS_PER_SAVE = (
+    constants.INVENTORY_ITEM_COUNT + constants.CORPSE_INVENTORY_ITEM_COUNT
+    + constants.INVENTORY_WEAPON_COUNT + constants.INVENTORY_CHIPS_COUNT
+)
+
+
+def _entry_size(save: SaveFile) -> int:
+    return len(save._raw) + _RECORDS_PER_SAVE * _RECORD_BYTES
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters of a SaveCache.
+
+    Attributes:
+        hits: Loads served from the cache.
+        misses: Loads that had to parse the file.
+        evictions: Entries dropped to stay within the limits.
+        entries: Current number of cached saves.
+        bytes: Approximate memory held by the cached saves.
+    """
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+
+class SaveCache:
+    """
+    LRU cache of parsed saves, bounded by entry count and by bytes.
+
+    Thread-safe; files are parsed outside the lock, so concurrent loads of
+    different files do not wait for each other.
+    """
+
+    def __init__(self, max_entries: int = 32, max_bytes: int = 64 * 1024 * 1024,
+                 key: str = "stat") -> None:
+        """
+        Args:
+            max_entries: Maximum number of cached saves.
+            max_bytes: Maximum approximate memory of all cached saves.
+            key: "stat" to key entries by (path, size, mtime_ns), or "hash"
+                to key them by (path, content hash), which also catches
+                rewrites that keep size and mtime.
+
+        Raises:
+            ValueError: If key is not one of KEY_MODES.
+        """
+        if key not in KEY_MODES:
+            raise ValueError(f"Unknown cache key mode {key!r}; expected one of {', '.join(KEY_MODES)}")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.key_mode = key
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[SaveFile, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    def load(self, path: Path) -> SaveFile:
+        """
+        Load a save through the cache.
+
+        Args:
+            path: Path to the save file.
+
+        Returns:
+            A copy-on-write SaveFile the caller may modify freely.
+
+        Raises:
+            OSError: If the file cannot be read.
+            UnsupportedSaveSizeError: If the file is not a save.
+        """
+        resolved = str(Path(path).resolve())
+        data: Optional[bytes] = None
+        if self.key_mode == "stat":
+            st = os.stat(resolved)
+            key = (resolved, (st.st_size, st.st_mtime_ns))
+        else:
+            data = Path(resolved).read_bytes()
+            key = (resolved, hashlib.blake2b(data, digest_size=16).digest())
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                logger.debug("Save cache hit for %s", resolved)
+                return entry[0].snapshot()
+            self._stats.misses += 1
+
+        logger.debug("Save cache miss for %s", resolved)
+        if data is None:
+            data = Path(resolved).read_bytes()
+            st_after = os.stat(resolved)
+            if (st_after.st_size, st_after.st_mtime_ns) != key[1]:
+                # Changed while we read it: hand it out, but don't cache it
+                save = SaveFile()
+                save.load(data)
+                return save
+        save = SaveFile()
+        save.load(data)
+        self._put(key, save.snapshot())
+        return save
+
+    def _put(self, key: Tuple[str, Hashable], save: SaveFile) -> None:
+        size = _entry_size(save)
+        with self._lock:
+            # Older versions of the same file can never be hit again
+            for stale in [k for k in self._entries if k[0] == key[0]]:
+                self._bytes -= self._entries.pop(stale)[1]
+            self._entries[key] = (save, size)
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                evicted, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._stats.evictions += 1
+                logger.debug("Evicted %s from the save cache", evicted[0])
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """
+        Drop the cached parse of one file, or of all files.
+
+        Args:
+            path: File to forget; None clears the whole cache.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            resolved = str(Path(path).resolve())
+            for key in [k for k in self._entries if k[0] == resolved]:
+                self._bytes -= self._entries.pop(key)[1]
+
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._stats.hits, self._stats.misses, self._stats.evictions,
+                              len(self._entries), self._bytes)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache: Optional[SaveCache] = None
+_default_lock = threading.Lock()
+
+
+def get_cache() -> SaveCache:
+    """
+    The process-wide SaveCache, created on first use.
+    """
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = SaveCache()
+        return _default_cache
+
+
+def load_cached(path: Path) -> SaveFile:
+    """
+    Load a save through the process-wide cache.
+
+    Args:
+        path: Path to the save file.
+
+    Returns:
+        A copy-on-write SaveFile the caller may modify freely.
+    """
+    return get_cache().load(path)
@@ -87,7 +87,7 @@ class Chip:
         """
         raw = stream.read(CHIP_SIZE_WITHOUT_PADDING)
         if len(raw) != CHIP_SIZE_WITHOUT_PADDING:
-            logger.error(f"Expected {CHIP_SIZE_WITHOUT_PADDING} bytes for chip data, got {len(raw)}")
+            logger.error("Expected %d bytes for chip data, got %d", CHIP_SIZE_WITHOUT_PADDING, len(raw))
             raise SerializationError(f"Expected {CHIP_SIZE_WITHOUT_PADDING} bytes, got {len(raw)}")
 
         values = cls._STRUCT.unpack(raw)
@@ -95,7 +95,7 @@ class Chip:
 
         pad = stream.read(len(CHIP_PADDING))
         if len(pad) != len(CHIP_PADDING):
-            logger.error(f"Expected {len(CHIP_PADDING)} padding bytes, got {len(pad)}")
+            logger.error("Expected %d padding bytes, got %d", len(CHIP_PADDING), len(pad))
             raise SerializationError(f"Expected {len(CHIP_PADDING)} padding bytes, got {len(pad)}")
 
         # logger.debug(f"Read Chip(index={index}, base_id={base_id}, level={level}, type={chip_type})")
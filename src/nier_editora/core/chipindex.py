@@ -0,0 +1,170 @@
+# src/nier_editora/core/chipindex.py
+"""
+chipindex.py
+
+Secondary index over the active chips of a ChipInventory.
+
+Chips are bucketed by chip_type, and every bucket (plus one spanning all
+types) keeps its chips in two sorted arrays of (level, slot) and
+(weight, slot). A range query such as "type 27, level >= 6, weight <= 12"
+bisects the narrower of the two arrays and checks the other bound per hit,
+so it never scans the whole inventory.
+
+The index is maintained incrementally: after a slot changes, `sync(slot)`
+moves just that chip between buckets and array positions.
+"""
+
+import logging
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from nier_editora.core.chip import ChipInventory
+
+logger = logging.getLogger(__name__)
+
+# (chip_type, level, weight) of an indexed slot
+_Key = Tuple[int, int, int]
+
+
+@dataclass
+class _Bucket:
+    levels: List[Tuple[int, int]] = field(default_factory=list)
+    weights: List[Tuple[int, int]] = field(default_factory=list)
+
+    def add(self, slot: int, level: int, weight: int) -> None:
+        insort(self.levels, (level, slot))
+        insort(self.weights, (weight, slot))
+
+    def remove(self, slot: int, level: int, weight: int) -> None:
+        del self.levels[bisect_left(self.levels, (level, slot))]
+        del self.weights[bisect_left(self.weights, (weight, slot))]
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+
+def _span(pairs: List[Tuple[int, int]], low: Optional[int], high: Optional[int]) -> Tuple[int, int]:
+    # Slot numbers are non-negative, so (value, -1) sorts before every entry
+    # of that value and (value, inf) after
+    start = 0 if low is None else bisect_left(pairs, (low, -1))
+    stop = len(pairs) if high is None else bisect_right(pairs, (high, float("inf")))
+    return start, max(start, stop)
+
+
+class ChipIndex:
+    """
+    Range-queryable index of the active chips in a ChipInventory.
+
+    The index does not observe the inventory; whoever modifies a slot calls
+    `sync(slot)` afterwards (or `rebuild()` after wholesale changes).
+    """
+
+    def __init__(self, chips: ChipInventory) -> None:
+        self._chips = chips
+        self._keys: Dict[int, _Key] = {}
+        self._all = _Bucket()
+        self._buckets: Dict[int, _Bucket] = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """
+        Re-index every slot of the inventory.
+        """
+        self._keys.clear()
+        self._all = _Bucket()
+        self._buckets.clear()
+        for chip in self._chips.peek():
+            if self._chips.is_slot_active(chip):
+                self._insert(chip.index, (chip.chip_type, chip.level, chip.weight))
+        logger.debug("Indexed %d chips of %d types", len(self._keys), len(self._buckets))
+
+    def sync(self, slot: int) -> bool:
+        """
+        Bring one slot's entry up to date with the inventory.
+
+        Args:
+            slot: Slot index that may have changed.
+
+        Returns:
+            True if the index changed.
+        """
+        chip = self._chips.raw[slot]
+        key = (chip.chip_type, chip.level, chip.weight) if self._chips.is_slot_active(chip) else None
+        old = self._keys.get(slot)
+        if key == old:
+            return False
+        if old is not None:
+            self._delete(slot, old)
+        if key is not None:
+            self._insert(slot, key)
+        return True
+
+    def _insert(self, slot: int, key: _Key) -> None:
+        chip_type, level, weight = key
+        self._keys[slot] = key
+        self._all.add(slot, level, weight)
+        self._buckets.setdefault(chip_type, _Bucket()).add(slot, level, weight)
+
+    def _delete(self, slot: int, key: _Key) -> None:
+        chip_type, level, weight = key
+        del self._keys[slot]
+        self._all.remove(slot, level, weight)
+        bucket = self._buckets[chip_type]
+        bucket.remove(slot, level, weight)
+        if not bucket:
+            del self._buckets[chip_type]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, slot: int) -> bool:
+        return slot in self._keys
+
+    def types(self) -> List[int]:
+        """
+        Chip types with at least one active chip, ascending.
+        """
+        return sorted(self._buckets)
+
+    def count(self, chip_type: int) -> int:
+        """
+        Number of active chips of a type.
+        """
+        bucket = self._buckets.get(chip_type)
+        return len(bucket) if bucket else 0
+
+    def query(self, chip_type: Optional[int] = None,
+              min_level: Optional[int] = None, max_level: Optional[int] = None,
+              min_weight: Optional[int] = None, max_weight: Optional[int] = None) -> List[int]:
+        """
+        Slots of the active chips matching every given bound (inclusive).
+
+        Args:
+            chip_type: Only chips of this type (default: any type).
+            min_level: Lowest level.
+            max_level: Highest level.
+            min_weight: Lowest weight.
+            max_weight: Highest weight.
+
+        Returns:
+            Matching slot indexes, ascending.
+        """
+        bucket = self._all if chip_type is None else self._buckets.get(chip_type)
+        if not bucket:
+            return []
+        lv_start, lv_stop = _span(bucket.levels, min_level, max_level)
+        wt_start, wt_stop = _span(bucket.weights, min_weight, max_weight)
+
+        # Walk the narrower range and check the other bound per chip
+        if lv_stop - lv_start <= wt_stop - wt_start:
+            candidates = bucket.levels[lv_start:lv_stop]
+            low, high, pos = min_weight, max_weight, 2
+        else:
+            candidates = bucket.weights[wt_start:wt_stop]
+            low, high, pos = min_level, max_level, 1
+        slots = [slot for _, slot in candidates
+                 if (low is None or self._keys[slot][pos] >= low)
+                 and (high is None or self._keys[slot][pos] <= high)]
+        slots.sort()
+        return slots
@@ -21,6 +21,7 @@ OFF_CHAPTER     = 0x0002C
 OFF_PLAYER_NAME = 0x00034
 LEN_PLAYER_NAME = 70
 OFF_GAMEWORLD_STATE = 0x0007C
+LEN_GAMEWORLD_STATE = 0x304F0    # up to OFF_MONEY
 
 # Currency & XP
 OFF_MONEY       = 0x3056C
@@ -55,6 +56,11 @@ CHIP_SIZE_WITHOUT_PADDING = CHIP_SIZE - len(CHIP_PADDING)
 ITEM_SIZE = 3 * 0x4       # ID, status, quantity
 WEAPON_SIZE = 5 * 0x4     # ID level, newItem, newStory, enemiesDefeated
 
+# Sane value ranges for record fields
+MAX_ITEM_QUANTITY = 99
+MIN_WEAPON_LEVEL = 1
+MAX_WEAPON_LEVEL = 4
+
 # =============================================================================
 # XP Table (https://nierautomata.wiki.fextralife.com/EXP)
 # =============================================================================
@@ -97,3 +103,8 @@ def _load_item_list() -> dict[int, str]:
         raise FileNotFoundError(f"Item list JSON not found: {_ITEM_LIST_FILE}") from e
 
 ITEM_LIST: dict[int, str] = _load_item_list()
+
+# ITEM_LIST prefixes of the ids each inventory holds (same as the GUI add dialogs)
+ITEM_PREFIXES = ("item_", "fish_")
+WEAPON_PREFIXES = ("weapon_",)
+CHIP_PREFIXES = ("skill_psv_", "capacity_")
@@ -0,0 +1,213 @@
+# src/nier_editora/core/corpus.py
+"""
+corpus.py
+
+Generate synthetic save corpora for benchmarking and fuzzing.
+
+Every save is derived from a template: scalars (name, play time, money, XP)
+are randomized and the inventories are refilled from ITEM_LIST categories
+with a controlled fill ratio per inventory. Save i of a corpus only depends
+on (seed, i), so output is identical however the work is split across
+processes.
+"""
+
+import logging
+import os
+import random
+import string
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from nier_editora.core import constants
+from nier_editora.core.chip import Chip
+from nier_editora.core.enums import ItemStatus
+from nier_editora.core.item import Item
+from nier_editora.core.save import SaveFile
+from nier_editora.core.weapon import Weapon
+from utils import pc_to_console
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATE: Path = Path(__file__).parent.parent / "data" / "saves" / "SlotData_0.dat"
+
+DEFAULT_FILL: Dict[str, float] = {
+    "inventory": 0.5,
+    "corpse_inventory": 0.0,
+    "weapons": 0.5,
+    "chips": 0.5,
+}
+
+FORMATS = ("pc", "console")
+
+_NAME_ALPHABET = string.ascii_letters + string.digits
+
+
+def _ids_with_prefix(prefixes: Sequence[str]) -> List[int]:
+    return sorted(i for i, code in constants.ITEM_LIST.items() if code.startswith(tuple(prefixes)))
+
+
+_ITEM_IDS = _ids_with_prefix(constants.ITEM_PREFIXES)
+_WEAPON_IDS = _ids_with_prefix(constants.WEAPON_PREFIXES)
+_MAX_XP = max(constants.EXPERIENCE_TABLE.values())
+
+
+class SaveGenerator:
+    """
+    Derives randomized saves from one template.
+
+    Chips are sampled from the template's active chips, since their codes,
+    types and weights have to agree with each other.
+    """
+
+    def __init__(self, template: bytes, fill: Optional[Dict[str, float]] = None) -> None:
+        """
+        Args:
+            template: Raw bytes of a PC or console save to derive from.
+            fill: Fraction of slots to occupy per inventory kind (see DEFAULT_FILL).
+
+        Raises:
+            ValueError: If a fill ratio is unknown or outside 0..1.
+        """
+        self.fill = {**DEFAULT_FILL, **(fill or {})}
+        for kind, ratio in self.fill.items():
+            if kind not in DEFAULT_FILL:
+                raise ValueError(f"Unknown inventory kind {kind!r}")
+            if not 0.0 <= ratio <= 1.0:
+                raise ValueError(f"Fill ratio for {kind} must be within 0..1, got {ratio}")
+
+        self._template = SaveFile()
+        self._template.load(template)
+        self._template.is_console = False
+        self._chip_pool = list(self._template.chips.active)
+
+    def generate(self, seed: int, index: int) -> bytes:
+        """
+        Build save number `index` of the corpus with the given seed.
+
+        Returns:
+            Raw PC-format save bytes.
+        """
+        rng = random.Random(seed * 1_000_003 + index)
+        save = self._template
+        save.player_name = "".join(rng.choices(_NAME_ALPHABET, k=rng.randint(1, 16)))
+        save.play_time = rng.randrange(360_000)
+        save.money = rng.randrange(10_000_000)
+        save.xp = rng.randrange(_MAX_XP + 1)
+
+        for kind in ("inventory", "corpse_inventory"):
+            records = getattr(save, kind).raw
+            count = round(len(records) * self.fill[kind])
+            ids = rng.sample(_ITEM_IDS, min(count, len(_ITEM_IDS)))
+            for slot in range(len(records)):
+                if slot < len(ids):
+                    records[slot] = Item(slot, ids[slot], ItemStatus.ACTIVE,
+                                         rng.randint(1, constants.MAX_ITEM_QUANTITY))
+                else:
+                    records[slot] = Item.empty(slot)
+
+        records = save.weapons.raw
+        ids = rng.sample(_WEAPON_IDS, min(round(len(records) * self.fill["weapons"]), len(_WEAPON_IDS)))
+        for slot in range(len(records)):
+            if slot < len(ids):
+                records[slot] = Weapon(
+                    slot, ids[slot],
+                    level=rng.randint(constants.MIN_WEAPON_LEVEL, constants.MAX_WEAPON_LEVEL),
+                    is_new_item=False, is_new_story=False,
+                    enemies_defeated=rng.randrange(10_000),
+                )
+            else:
+                records[slot] = Weapon.empty(slot)
+
+        records = save.chips.raw
+        count = round(len(records) * self.fill["chips"]) if self._chip_pool else 0
+        for slot in range(len(records)):
+            if slot < count:
+                records[slot] = replace(rng.choice(self._chip_pool), index=slot)
+            else:
+                records[slot] = Chip.empty(slot)
+
+        return save.write()
+
+
+def corpus_paths(out_dir: Path, index: int) -> Dict[str, Path]:
+    """
+    Paths save number `index` is written to, per format.
+    """
+    base = out_dir / f"{index:05d}"
+    return {"pc": base / "SlotData_0.dat", "console": base / "GameData"}
+
+
+# Per-process generator, set up once by the pool initializer
+_worker: Optional[SaveGenerator] = None
+
+
+def _init_worker(template: bytes, fill: Dict[str, float]) -> None:
+    global _worker
+    _worker = SaveGenerator(template, fill)
+
+
+def _write_one(out_dir: Path, seed: int, index: int, formats: Sequence[str]) -> List[Path]:
+    data = _worker.generate(seed, index)
+    targets = corpus_paths(out_dir, index)
+    written = []
+    for fmt in formats:
+        path = targets[fmt]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data if fmt == "pc" else pc_to_console(data))
+        written.append(path)
+    return written
+
+
+def generate_corpus(
+    out_dir: Path,
+    count: int,
+    seed: int = 0,
+    template: Optional[Path] = None,
+    fill: Optional[Dict[str, float]] = None,
+    formats: Sequence[str] = FORMATS,
+    jobs: Optional[int] = None,
+) -> List[Path]:
+    """
+    Write `count` synthetic saves below out_dir.
+
+    Save i is written to out_dir/<i>/SlotData_0.dat (PC) and/or
+    out_dir/<i>/GameData (console).
+
+    Args:
+        out_dir: Directory to write the corpus into.
+        count: Number of saves.
+        seed: Corpus seed; the same seed always yields the same files.
+        template: Save to derive from (default: the bundled SlotData_0.dat).
+        fill: Fraction of slots to occupy per inventory kind.
+        formats: Any of "pc" and "console".
+        jobs: Number of worker processes (default: CPU count; 1 disables the pool).
+
+    Returns:
+        Paths of all written files.
+    """
+    unknown = set(formats) - set(FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown format(s): {', '.join(sorted(unknown))}")
+    template_bytes = (template or DEFAULT_TEMPLATE).read_bytes()
+    fill = {**DEFAULT_FILL, **(fill or {})}
+    # Built here first so a bad template or fill raises in the caller,
+    # not inside a pool initializer
+    generator = SaveGenerator(template_bytes, fill)
+    jobs = jobs or os.cpu_count() or 1
+
+    logger.info("Generating %d saves into %s (seed=%d, jobs=%d)", count, out_dir, seed, jobs)
+    indices = range(count)
+    if jobs == 1 or count < 16:
+        global _worker
+        _worker = generator
+        batches = (_write_one(out_dir, seed, i, formats) for i in indices)
+        return [path for batch in batches for path in batch]
+
+    n = len(indices)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(template_bytes, fill)) as pool:
+        batches = pool.map(_write_one, [out_dir] * n, [seed] * n, indices, [formats] * n,
+                           chunksize=max(1, n // (jobs * 4)))
+        return [path for batch in batches for path in batch]
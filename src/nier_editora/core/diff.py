@@ -0,0 +1,105 @@
+# src/nier_editora/core/diff.py
+"""
+diff.py
+
+Field-level differences between two saves.
+
+Scalars (player name, play time, chapter, money, XP) are compared
+directly; inventories are compared slot by slot, and every differing
+record field becomes one Change.
+"""
+
+from dataclasses import dataclass, fields
+from enum import Enum
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from nier_editora.core.save import SaveFile
+
+SCALAR_FIELDS = ("header_id", "player_name", "play_time", "chapter", "money", "xp")
+
+
+@dataclass(frozen=True)
+class Change:
+    """
+    One differing field.
+
+    Attributes:
+        kind: "save" for scalar fields, otherwise the inventory kind
+            ("inventory", "corpse_inventory", "weapons" or "chips").
+        field: Name of the field that differs.
+        old: Value in the first save.
+        new: Value in the second save.
+        slot: Slot index for inventory records, None for scalars.
+    """
+    kind: str
+    field: str
+    old: object
+    new: object
+    slot: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        def plain(value):
+            if isinstance(value, Enum):
+                return str(value)
+            if isinstance(value, bytes):
+                return value.hex()
+            return value
+        return {"kind": self.kind, "slot": self.slot, "field": self.field,
+                "old": plain(self.old), "new": plain(self.new)}
+
+
+_record_fields: Dict[type, Tuple[str, ...]] = {}
+
+
+def _fields_of(record) -> Tuple[str, ...]:
+    cls = type(record)
+    names = _record_fields.get(cls)
+    if names is None:
+        names = _record_fields[cls] = tuple(f.name for f in fields(cls) if f.name != "index")
+    return names
+
+
+def diff_records(kind: str, old, new) -> List[Change]:
+    """
+    List the differing fields of two records of the same slot.
+
+    Args:
+        kind: Inventory kind the records belong to.
+        old: Record before.
+        new: Record after.
+
+    Returns:
+        One Change per differing field (the slot index is not compared).
+    """
+    if old == new:
+        return []
+    return [
+        Change(kind, name, getattr(old, name), getattr(new, name), old.index)
+        for name in _fields_of(old)
+        if getattr(old, name) != getattr(new, name)
+    ]
+
+
+def diff_saves(old: SaveFile, new: SaveFile,
+               kinds: Sequence[str] = SaveFile.INVENTORY_FIELDS) -> List[Change]:
+    """
+    List every field that differs between two saves.
+
+    Args:
+        old: First save.
+        new: Second save.
+        kinds: Inventories to compare.
+
+    Returns:
+        Scalar changes first, then record changes by inventory and slot.
+    """
+    changes = [
+        Change("save", name, getattr(old, name), getattr(new, name))
+        for name in SCALAR_FIELDS
+        if getattr(old, name) != getattr(new, name)
+    ]
+    for kind in kinds:
+        for a, b in zip(getattr(old, kind).peek(), getattr(new, kind).peek()):
+            if a != b:
+                changes.extend(diff_records(kind, a, b))
+    return changes
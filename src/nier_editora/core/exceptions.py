@@ -32,6 +32,21 @@ class InventoryFullError(InventoryError):
 class SlotIndexError(InventoryError):
     """Raised when a given slot index is out of the valid range"""
 
+class EditConflictError(InventoryError):
+    """
+    Raised when a batch of record edits cannot be applied.
+
+    Attributes:
+        conflicts: Every problem found in the batch, one message each.
+    """
+    def __init__(self, conflicts: list) -> None:
+        super().__init__(f"{len(conflicts)} conflicting edit(s):\n" + "\n".join(conflicts))
+        self.conflicts = conflicts
+
 # Translation errors
 class TranslationError(SaveEditorError):
     """Base exception for all translation-related operations"""
+
+# Corpus query errors
+class QueryError(SaveEditorError):
+    """Raised when a corpus query refers to unknown tables, columns or operators"""
@@ -0,0 +1,171 @@
+# src/nier_editora/core/export.py
+"""
+export.py
+
+Streaming export of inventory records across many save files.
+
+The pipeline is a chain of generators (paths → saves → records → rows), so
+only one SaveFile is alive at a time and memory stays flat regardless of
+how many files are dumped. Each output field has its own getter and only
+the selected ones are evaluated; in particular item names are translated
+only when the "name" field is requested.
+"""
+
+import json
+import logging
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Sequence, TextIO, Tuple
+
+from nier_editora.core.inventory import SlotManager
+from nier_editora.core.save import SaveFile, iter_save_paths
+
+logger = logging.getLogger(__name__)
+
+Getter = Callable[[object], object]
+
+_ITEM_FIELDS: Dict[str, Getter] = {
+    "id": attrgetter("id"),
+    "status": lambda item: item.status.value,
+    "quantity": attrgetter("quantity"),
+    "name": attrgetter("name"),
+}
+_WEAPON_FIELDS: Dict[str, Getter] = {
+    "id": attrgetter("id"),
+    "level": attrgetter("level"),
+    "is_new_item": attrgetter("is_new_item"),
+    "is_new_story": attrgetter("is_new_story"),
+    "enemies_defeated": attrgetter("enemies_defeated"),
+    "name": attrgetter("name"),
+}
+_CHIP_FIELDS: Dict[str, Getter] = {
+    "id": attrgetter("base_id"),
+    "base_code": attrgetter("base_code"),
+    "chip_type": attrgetter("chip_type"),
+    "level": attrgetter("level"),
+    "weight": attrgetter("weight"),
+    "slot_a": attrgetter("slot_a"),
+    "slot_b": attrgetter("slot_b"),
+    "slot_c": attrgetter("slot_c"),
+    "name": attrgetter("name"),
+}
+
+# Inventory kinds, named after the SaveFile attributes holding them
+KIND_FIELDS: Dict[str, Dict[str, Getter]] = {
+    "inventory": _ITEM_FIELDS,
+    "corpse_inventory": _ITEM_FIELDS,
+    "weapons": _WEAPON_FIELDS,
+    "chips": _CHIP_FIELDS,
+}
+COMMON_FIELDS = ("path", "kind", "slot")
+ALL_FIELDS: Tuple[str, ...] = COMMON_FIELDS + (
+    "id", "name", "status", "quantity", "level", "weight", "chip_type", "base_code",
+    "enemies_defeated", "is_new_item", "is_new_story", "slot_a", "slot_b", "slot_c",
+)
+
+
+def iter_saves(paths: Iterable[Path]) -> Iterator[Tuple[Path, SaveFile]]:
+    """
+    Lazily load save files one by one.
+
+    Files that fail to load are logged and skipped.
+
+    Args:
+        paths: Files and/or directories; directories are searched recursively.
+
+    Yields:
+        (path, SaveFile) pairs.
+    """
+    for path in iter_save_paths(paths):
+        try:
+            save = SaveFile.load_from_file(path)
+        except Exception as e:
+            logger.warning("Skipping %s: %s", path, e)
+            continue
+        yield path, save
+
+
+def iter_records(
+    path: Path,
+    save: SaveFile,
+    fields: Sequence[str] = ALL_FIELDS,
+    kinds: Sequence[str] = tuple(KIND_FIELDS),
+    include_inactive: bool = False,
+) -> Iterator[dict]:
+    """
+    Yield one row per record of the selected inventories of a save.
+
+    Args:
+        path: Path the save was loaded from.
+        save: The loaded save.
+        fields: Fields to include; fields a kind doesn't have are omitted.
+        kinds: Inventory kinds to include.
+        include_inactive: Also yield empty slots.
+
+    Yields:
+        A dict per record with the selected fields.
+    """
+    path_str = str(path)
+    for kind in kinds:
+        manager: SlotManager = getattr(save, kind)
+        getters = KIND_FIELDS[kind]
+        selected = [(name, getters[name]) for name in fields if name in getters]
+        with_path, with_kind, with_slot = (name in fields for name in COMMON_FIELDS)
+        for record in manager.raw:
+            if not include_inactive and not manager.is_slot_active(record):
+                continue
+            row = {}
+            if with_path:
+                row["path"] = path_str
+            if with_kind:
+                row["kind"] = kind
+            if with_slot:
+                row["slot"] = record.index
+            for name, getter in selected:
+                row[name] = getter(record)
+            yield row
+
+
+def iter_dump(
+    paths: Iterable[Path],
+    fields: Sequence[str] = ALL_FIELDS,
+    kinds: Sequence[str] = tuple(KIND_FIELDS),
+    include_inactive: bool = False,
+) -> Iterator[dict]:
+    """
+    Yield record rows for every save found under the given paths.
+
+    See iter_records for the meaning of the arguments.
+    """
+    for path, save in iter_saves(paths):
+        yield from iter_records(path, save, fields, kinds, include_inactive)
+
+
+def parse_fields(spec: Optional[str]) -> Tuple[str, ...]:
+    """
+    Parse a comma-separated field list, defaulting to all fields.
+
+    Raises:
+        ValueError: If an unknown field is named.
+    """
+    if not spec:
+        return ALL_FIELDS
+    fields = tuple(name.strip() for name in spec.split(",") if name.strip())
+    unknown = [name for name in fields if name not in ALL_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown field(s): {', '.join(unknown)}; known: {', '.join(ALL_FIELDS)}")
+    return fields
+
+
+def write_jsonl(rows: Iterable[dict], out: TextIO) -> int:
+    """
+    Write rows as JSON lines.
+
+    Returns:
+        Number of rows written.
+    """
+    count = 0
+    for row in rows:
+        out.write(json.dumps(row, ensure_ascii=False) + "\n")
+        count += 1
+    return count
@@ -0,0 +1,182 @@
+# src/nier_editora/core/fields.py
+"""
+fields.py
+
+Read and write single scalar fields of a save file in place, without
+loading it into a SaveFile.
+
+Only the bytes of the field are touched: the file size tells PC from
+console format, the PC offset is shifted to its console position when
+needed, and the field is read or written with one positioned read/write
+(os.pread/os.pwrite where the platform has them).
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Dict, NamedTuple, Union
+
+from nier_editora.core import constants
+from nier_editora.core.exceptions import UnsupportedSaveSizeError
+
+logger = logging.getLogger(__name__)
+
+Value = Union[int, str]
+
+
+def _decode_int(raw: bytes) -> int:
+    return int.from_bytes(raw, "little", signed=True)
+
+
+def _encode_int(value: int) -> bytes:
+    try:
+        return int(value).to_bytes(4, "little", signed=True)
+    except OverflowError as e:
+        raise ValueError(f"{value} does not fit in a signed 32-bit field") from e
+
+
+def _decode_name(raw: bytes) -> str:
+    return raw.decode("utf-16-le").rstrip("\x00")
+
+
+def _encode_name(value: str) -> bytes:
+    # Same truncation and padding as SaveFile.write
+    return value.encode("utf-16-le")[:constants.LEN_PLAYER_NAME].ljust(constants.LEN_PLAYER_NAME, b"\x00")
+
+
+class Field(NamedTuple):
+    offset: int
+    length: int
+    decode: Callable[[bytes], Value]
+    encode: Callable[[Value], bytes]
+
+
+# Offsets are in PC layout; names match the SaveFile attributes. header_id is
+# left out: it overlaps the PC-only header, so console files do not store it
+FIELDS: Dict[str, Field] = {
+    "play_time": Field(constants.OFF_PLAYTIME, 4, _decode_int, _encode_int),
+    "chapter": Field(constants.OFF_CHAPTER, 4, _decode_int, _encode_int),
+    "player_name": Field(constants.OFF_PLAYER_NAME, constants.LEN_PLAYER_NAME, _decode_name, _encode_name),
+    "money": Field(constants.OFF_MONEY, 4, _decode_int, _encode_int),
+    "xp": Field(constants.OFF_EXPERIENCE, 4, _decode_int, _encode_int),
+}
+
+
+def file_offset(pc_offset: int, is_console: bool) -> int:
+    """
+    Position in the file of a PC-layout offset.
+
+    Console files lack the PC header and the duplicated block at
+    DUPLICATION_OFFSET (see utils.console_to_pc).
+
+    Raises:
+        ValueError: If the offset lies in the PC-only header.
+    """
+    if not is_console:
+        return pc_offset
+    if pc_offset < constants.CONSOLE_HEADER_SIZE:
+        raise ValueError(f"Offset {pc_offset:#x} has no console equivalent")
+    if pc_offset >= constants.DUPLICATION_OFFSET + constants.DUPLICATION_LENGTH:
+        return pc_offset - constants.CONSOLE_HEADER_SIZE - constants.DUPLICATION_LENGTH
+    return pc_offset - constants.CONSOLE_HEADER_SIZE
+
+
+def _lookup(field: str) -> Field:
+    try:
+        return FIELDS[field]
+    except KeyError:
+        raise ValueError(f"Unknown field {field!r}; expected one of {', '.join(FIELDS)}") from None
+
+
+def _locate(fd: int, spec: Field, path: Path) -> int:
+    size = os.fstat(fd).st_size
+    if size == constants.PC_SAVE_SIZE:
+        return file_offset(spec.offset, False)
+    if size == constants.CONSOLE_SAVE_SIZE:
+        return file_offset(spec.offset, True)
+    logger.error("Unexpected save size of %s: %#x", path, size)
+    raise UnsupportedSaveSizeError(f"Unexpected save size: {hex(size)}")
+
+
+def _pread(fd: int, length: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, length, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, length)
+
+
+def _pwrite(fd: int, data: bytes, offset: int) -> int:
+    if hasattr(os, "pwrite"):
+        return os.pwrite(fd, data, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.write(fd, data)
+
+
+def read(path: Path, field: str) -> Value:
+    """
+    Read one field of a PC or console save.
+
+    Args:
+        path: Save file.
+        field: One of FIELDS, e.g. "money".
+
+    Returns:
+        The decoded value (int, or str for player_name).
+
+    Raises:
+        ValueError: If the field is unknown.
+        UnsupportedSaveSizeError: If the file is neither PC nor console size.
+    """
+    spec = _lookup(field)
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        raw = _pread(fd, spec.length, _locate(fd, spec, path))
+    finally:
+        os.close(fd)
+    value = spec.decode(raw)
+    logger.debug("Read %s=%r from %s", field, value, path)
+    return value
+
+
+def write(path: Path, field: str, value: Value) -> None:
+    """
+    Overwrite one field of a PC or console save in place.
+
+    Args:
+        path: Save file.
+        field: One of FIELDS, e.g. "money".
+        value: New value; player names are truncated and padded like SaveFile.write.
+
+    Raises:
+        ValueError: If the field is unknown or the value does not fit.
+        UnsupportedSaveSizeError: If the file is neither PC nor console size.
+        OSError: If the write was short.
+    """
+    write_many(path, {field: value})
+
+
+def write_many(path: Path, values: Dict[str, Value]) -> None:
+    """
+    Overwrite several fields through one open file.
+
+    Every value is encoded before anything is written, so a bad value
+    leaves the file untouched.
+
+    Raises:
+        ValueError: If a field is unknown or a value does not fit.
+        UnsupportedSaveSizeError: If the file is neither PC nor console size.
+        OSError: If a write was short.
+    """
+    patches = []
+    for field, value in values.items():
+        spec = _lookup(field)
+        patches.append((field, spec, spec.encode(value)))
+    fd = os.open(path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+    try:
+        for field, spec, data in patches:
+            written = _pwrite(fd, data, _locate(fd, spec, path))
+            if written != len(data):
+                raise OSError(f"Short write of {field} to {path}: {written} of {len(data)} bytes")
+    finally:
+        os.close(fd)
+    logger.info("Wrote %s to %s", ", ".join(f"{field}={value!r}" for field, value in values.items()), path)
@@ -0,0 +1,176 @@
+# src/nier_editora/core/gameworld.py
+"""
+gameworld.py
+
+Bit-level view of the game world state region (OFF_GAMEWORLD_STATE up to
+OFF_MONEY).
+
+The region is treated as a little-endian bitset: bit i is bit (i % 8) of
+byte (i // 8). Its layout is only partly understood; in the bundled sample
+save the first part holds the game's ASCII scene/action dump rather than
+packed flags, so bit counts over the whole region include text bytes.
+Flags whose meaning is known are named in data/constants/gameworld_flags.json
+as {"name": bit}.
+
+The view wraps a memoryview without copying, and whole-region operations
+(popcount, set difference) go through Python ints and 64-bit words rather
+than per-bit loops.
+"""
+
+import json
+import logging
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterator, List, Union
+
+from nier_editora.core import constants
+
+logger = logging.getLogger(__name__)
+
+_FLAGS_FILE: Path = Path(__file__).parent.parent / "data" / "constants" / "gameworld_flags.json"
+
+_WORD = 8
+
+
+@lru_cache(maxsize=None)
+def load_flag_names(path: Path = _FLAGS_FILE) -> Dict[str, int]:
+    """
+    Load a flag name table; read once per path.
+
+    Returns:
+        A mapping from flag name to bit number.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            return {str(name): int(bit) for name, bit in json.load(f).items()}
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Game world flag table not found: {path}") from e
+
+
+def _popcount(value: int) -> int:
+    return value.bit_count() if hasattr(value, "bit_count") else bin(value).count("1")
+
+
+def _set_bits(value: int, length: int) -> Iterator[int]:
+    # Walk 64-bit words and only descend into non-zero ones
+    words = struct.iter_unpack("<Q", value.to_bytes(length, "little"))
+    for n, (word,) in enumerate(words):
+        while word:
+            low = word & -word
+            yield n * 64 + low.bit_length() - 1
+            word ^= low
+
+
+class GameworldState:
+    """
+    Read/write bitset over a memoryview of the game world state region.
+
+    Bits can be addressed by number or by a name from the flag table.
+    Writing requires a writable buffer (e.g. a bytearray).
+    """
+
+    def __init__(self, buf: Union[bytes, bytearray, memoryview],
+                 names: Union[Dict[str, int], None] = None) -> None:
+        """
+        Args:
+            buf: The region bytes; its length must be a multiple of 8.
+            names: Flag name table (default: the bundled one, loaded on first use).
+
+        Raises:
+            ValueError: If the length is not a multiple of 8.
+        """
+        view = memoryview(buf)
+        if view.nbytes % _WORD:
+            raise ValueError(f"Bitset length must be a multiple of {_WORD} bytes, got {view.nbytes}")
+        self.view = view.cast("B")
+        self._names = names
+
+    @classmethod
+    def from_raw(cls, raw: Union[bytes, bytearray]) -> "GameworldState":
+        """
+        View over the region of PC-format save bytes.
+
+        A bytearray is viewed in place; read-only bytes have just the region copied.
+        """
+        start, stop = constants.OFF_GAMEWORLD_STATE, constants.OFF_GAMEWORLD_STATE + constants.LEN_GAMEWORLD_STATE
+        if isinstance(raw, bytearray):
+            return cls(memoryview(raw)[start:stop])
+        return cls(bytearray(raw[start:stop]))
+
+    @property
+    def names(self) -> Dict[str, int]:
+        if self._names is None:
+            self._names = load_flag_names()
+        return self._names
+
+    def bit(self, key: Union[int, str]) -> int:
+        """
+        Bit number of a flag.
+
+        Raises:
+            KeyError: If a name is not in the flag table.
+            IndexError: If the bit is outside the region.
+        """
+        bit = self.names[key] if isinstance(key, str) else key
+        if not 0 <= bit < len(self):
+            raise IndexError(f"Bit {bit} out of range (0..{len(self) - 1})")
+        return bit
+
+    def __len__(self) -> int:
+        return self.view.nbytes * 8
+
+    def __getitem__(self, key: Union[int, str]) -> bool:
+        bit = self.bit(key)
+        return bool(self.view[bit >> 3] >> (bit & 7) & 1)
+
+    def __setitem__(self, key: Union[int, str], value: bool) -> None:
+        bit = self.bit(key)
+        if value:
+            self.view[bit >> 3] |= 1 << (bit & 7)
+        else:
+            self.view[bit >> 3] &= ~(1 << (bit & 7)) & 0xFF
+
+    def flags(self) -> Dict[str, bool]:
+        """
+        State of every named flag.
+        """
+        return {name: self[bit] for name, bit in self.names.items()}
+
+    def as_int(self) -> int:
+        return int.from_bytes(self.view, "little")
+
+    def popcount(self) -> int:
+        """
+        Number of set bits in the region.
+        """
+        return _popcount(self.as_int())
+
+    def set_bits(self) -> Iterator[int]:
+        """
+        Numbers of the set bits, ascending.
+        """
+        return _set_bits(self.as_int(), self.view.nbytes)
+
+    def difference(self, other: "GameworldState") -> List[int]:
+        """
+        Bits set here but not in `other` (e.g. flags a later save gained).
+
+        Raises:
+            ValueError: If the regions differ in length.
+        """
+        if len(other) != len(self):
+            raise ValueError(f"Bitset lengths differ: {len(self)} != {len(other)}")
+        return list(_set_bits(self.as_int() & ~other.as_int(), self.view.nbytes))
+
+    def __sub__(self, other: "GameworldState") -> List[int]:
+        return self.difference(other)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, GameworldState):
+            return NotImplemented
+        return self.view == other.view
+
+    def __reduce__(self):
+        # memoryviews do not pickle; ship the bytes
+        return type(self), (bytearray(self.view), self._names)
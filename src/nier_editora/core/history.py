@@ -0,0 +1,313 @@
+# src/nier_editora/core/history.py
+"""
+history.py
+
+Undo/redo journal for save edits.
+
+Every edit is a reversible Command applied through a History:
+
+    history = History(save)
+    history.push(SetField("money", save.money, 500))
+    history.push(SetRecord.edit(save, "inventory", 3, quantity=99))
+    history.undo()
+    history.redo()
+
+Commands store only the values they change, so undo and redo are O(1)
+and never re-read the save. Edits of the same target pushed within
+`coalesce_window` seconds of each other are merged into one command, so
+holding a spin box arrow or typing a name undoes in a single step.
+
+Records are updated in place, so views holding references to them stay
+valid; the `on_change` callback tells a view exactly which field or slot
+to refresh.
+"""
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, List, Optional
+
+from nier_editora.core.save import SaveFile
+
+logger = logging.getLogger(__name__)
+
+
+class Command(ABC):
+    """
+    A reversible edit of a save.
+    """
+    label: str
+
+    @abstractmethod
+    def apply(self, save: SaveFile) -> None:
+        """
+        Apply the edit to `save`.
+        """
+
+    @abstractmethod
+    def revert(self, save: SaveFile) -> None:
+        """
+        Undo the edit on `save`.
+        """
+
+    def merge(self, other: "Command") -> bool:
+        """
+        Absorb a later command on the same target.
+
+        Returns:
+            True if `other` was merged into this command.
+        """
+        return False
+
+    @property
+    def is_noop(self) -> bool:
+        return False
+
+
+@dataclass
+class SetField(Command):
+    """
+    Change of a scalar field (player_name, money, xp, play_time, ...).
+    """
+    name: str
+    old: object
+    new: object
+    label: str = ""
+
+    def __post_init__(self) -> None:
+        if not self.label:
+            self.label = f"Set {self.name.replace('_', ' ')}"
+
+    def apply(self, save: SaveFile) -> None:
+        setattr(save, self.name, self.new)
+
+    def revert(self, save: SaveFile) -> None:
+        setattr(save, self.name, self.old)
+
+    def merge(self, other: Command) -> bool:
+        if not isinstance(other, SetField) or other.name != self.name:
+            return False
+        self.new = other.new
+        return True
+
+    @property
+    def is_noop(self) -> bool:
+        return self.old == self.new
+
+
+@dataclass
+class SetRecord(Command):
+    """
+    Change of one inventory slot: adding, removing or editing a record.
+
+    `old` and `new` map record attribute names to values; only the
+    attributes that change are stored.
+    """
+    kind: str
+    slot: int
+    old: dict
+    new: dict
+    label: str = ""
+
+    @classmethod
+    def edit(cls, save: SaveFile, kind: str, slot: int, label: str = "", **values) -> "SetRecord":
+        """
+        Build the command setting some attributes of a slot's record.
+        """
+        record = getattr(save, kind).raw[slot]
+        old = {name: getattr(record, name) for name in values}
+        return cls(kind, slot, old, dict(values), label or f"Edit {kind} slot {slot}")
+
+    @classmethod
+    def replace(cls, save: SaveFile, kind: str, new_record, label: str = "") -> "SetRecord":
+        """
+        Build the command replacing a slot's record with `new_record`
+        (an added record, or an empty one to remove it).
+        """
+        slot = new_record.index
+        current = vars(getattr(save, kind).raw[slot])
+        new = {name: value for name, value in vars(new_record).items() if current[name] != value}
+        return cls(kind, slot, {name: current[name] for name in new}, new,
+                   label or f"Replace {kind} slot {slot}")
+
+    def _set(self, save: SaveFile, values: dict) -> None:
+        record = getattr(save, self.kind).raw[self.slot]
+        for name, value in values.items():
+            setattr(record, name, value)
+
+    def apply(self, save: SaveFile) -> None:
+        self._set(save, self.new)
+
+    def revert(self, save: SaveFile) -> None:
+        self._set(save, self.old)
+
+    def merge(self, other: Command) -> bool:
+        if not isinstance(other, SetRecord) or (other.kind, other.slot) != (self.kind, self.slot):
+            return False
+        for name, value in other.old.items():
+            self.old.setdefault(name, value)
+        self.new.update(other.new)
+        return True
+
+    @property
+    def is_noop(self) -> bool:
+        return all(self.old.get(name) == value for name, value in self.new.items())
+
+
+@dataclass
+class Batch(Command):
+    """
+    Several commands undone and redone as one step.
+    """
+    commands: List[Command]
+    label: str = "Batch edit"
+
+    @classmethod
+    def from_snapshot(cls, save: SaveFile, edited: SaveFile, kinds, label: str) -> "Batch":
+        """
+        Build the commands turning `save` into `edited`, a snapshot of it
+        that was modified, one SetRecord per differing slot.
+        """
+        commands = []
+        for kind in kinds:
+            for old, new in zip(getattr(save, kind).peek(), getattr(edited, kind).peek()):
+                if old != new:
+                    commands.append(SetRecord.replace(save, kind, new))
+        return cls(commands, label)
+
+    def apply(self, save: SaveFile) -> None:
+        for command in self.commands:
+            command.apply(save)
+
+    def revert(self, save: SaveFile) -> None:
+        for command in reversed(self.commands):
+            command.revert(save)
+
+    @property
+    def is_noop(self) -> bool:
+        return all(command.is_noop for command in self.commands)
+
+
+@dataclass
+class _Entry:
+    command: Command
+    pushed_at: float = field(default_factory=time.monotonic)
+
+
+class History:
+    """
+    Undo and redo stacks of Commands applied to one save.
+    """
+
+    def __init__(self, save: Optional[SaveFile] = None, limit: int = 1000, coalesce_window: float = 1.0,
+                 on_change: Optional[Callable[[Command], None]] = None) -> None:
+        """
+        Args:
+            save: Save the commands apply to (see reset).
+            limit: Maximum number of undo steps kept.
+            coalesce_window: Seconds within which edits of the same target
+                are merged into one undo step; 0 disables merging.
+            on_change: Called with each command after it is applied,
+                undone or redone.
+        """
+        self.save = save
+        self.coalesce_window = coalesce_window
+        self.on_change = on_change
+        self._undo: Deque[_Entry] = deque(maxlen=limit)
+        self._redo: Deque[Command] = deque(maxlen=limit)
+
+    def reset(self, save: Optional[SaveFile]) -> None:
+        """
+        Forget all steps and start journaling `save`.
+        """
+        self.save = save
+        self._undo.clear()
+        self._redo.clear()
+
+    def push(self, command: Command, coalesce: bool = True) -> bool:
+        """
+        Apply a command and record it as an undo step.
+
+        Args:
+            command: Command to apply.
+            coalesce: Whether it may merge into the previous step.
+
+        Returns:
+            False if the command changed nothing and was dropped.
+        """
+        if command.is_noop:
+            return False
+        command.apply(self.save)
+        self._redo.clear()
+
+        now = time.monotonic()
+        top = self._undo[-1] if self._undo else None
+        if (coalesce and top is not None and now - top.pushed_at <= self.coalesce_window
+                and top.command.merge(command)):
+            top.pushed_at = now
+            if top.command.is_noop:
+                self._undo.pop()
+            logger.debug("Merged %s", command.label)
+        else:
+            self._undo.append(_Entry(command, now))
+            logger.debug("Pushed %s", command.label)
+        self._notify(command)
+        return True
+
+    def undo(self) -> Optional[Command]:
+        """
+        Revert the last step.
+
+        Returns:
+            The reverted command, or None if there was nothing to undo.
+        """
+        if not self._undo:
+            return None
+        command = self._undo.pop().command
+        command.revert(self.save)
+        self._redo.append(command)
+        if self._undo:
+            # The next edit starts a new step rather than merging into this one
+            self._undo[-1].pushed_at = float("-inf")
+        logger.debug("Undid %s", command.label)
+        self._notify(command)
+        return command
+
+    def redo(self) -> Optional[Command]:
+        """
+        Re-apply the last undone step.
+
+        Returns:
+            The re-applied command, or None if there was nothing to redo.
+        """
+        if not self._redo:
+            return None
+        command = self._redo.pop()
+        command.apply(self.save)
+        # A redone step never merges with the next edit
+        self._undo.append(_Entry(command, float("-inf")))
+        logger.debug("Redid %s", command.label)
+        self._notify(command)
+        return command
+
+    def _notify(self, command: Command) -> None:
+        if self.on_change is not None:
+            self.on_change(command)
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    @property
+    def undo_label(self) -> Optional[str]:
+        return self._undo[-1].command.label if self._undo else None
+
+    @property
+    def redo_label(self) -> Optional[str]:
+        return self._redo[-1].label if self._redo else None
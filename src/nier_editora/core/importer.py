@@ -0,0 +1,341 @@
+# src/nier_editora/core/importer.py
+"""
+importer.py
+
+Apply a batch of record edits from a JSON or CSV document to a save.
+
+Each edit targets one inventory ("kind") and either a slot index or an item
+id, and sets, adds or removes a record. The whole batch is first planned
+against a lightweight slot → id map of each inventory: IDs are checked
+against the ITEM_LIST category of their inventory, free slots are
+precomputed, and every conflict is collected. Only a conflict-free plan is applied, so the
+save is loaded once and written once.
+"""
+
+import csv
+import json
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from nier_editora.core import constants
+from nier_editora.core.chip import Chip
+from nier_editora.core.enums import ItemStatus
+from nier_editora.core.exceptions import EditConflictError
+from nier_editora.core.item import Item
+from nier_editora.core.save import SaveFile
+from nier_editora.core.weapon import Weapon
+
+logger = logging.getLogger(__name__)
+
+OPS = ("set", "add", "remove")
+
+# Record class, id attribute and editable fields per inventory kind
+_KINDS = {
+    "inventory": (Item, "id", ("quantity",)),
+    "corpse_inventory": (Item, "id", ("quantity",)),
+    "weapons": (Weapon, "id", ("level", "enemies_defeated")),
+    "chips": (Chip, "base_id", ("level", "weight", "chip_type", "base_code")),
+}
+
+# Id label and ITEM_LIST code prefixes per inventory kind
+_ID_CATEGORIES = {
+    "inventory": ("item", constants.ITEM_PREFIXES),
+    "corpse_inventory": ("item", constants.ITEM_PREFIXES),
+    "weapons": ("weapon", constants.WEAPON_PREFIXES),
+    "chips": ("chip", constants.CHIP_PREFIXES),
+}
+
+# Accepted (min, max) per inventory kind and field; None means unbounded
+_ITEM_RANGES = {"quantity": (0, constants.MAX_ITEM_QUANTITY)}
+_RANGES: Dict[str, Dict[str, Tuple[int, Optional[int]]]] = {
+    "inventory": _ITEM_RANGES,
+    "corpse_inventory": _ITEM_RANGES,
+    "weapons": {
+        "level": (constants.MIN_WEAPON_LEVEL, constants.MAX_WEAPON_LEVEL),
+        "enemies_defeated": (0, None),
+    },
+    "chips": {"level": (0, None), "weight": (0, None)},
+}
+
+
+@dataclass
+class RecordEdit:
+    """
+    One requested change to an inventory record.
+
+    Attributes:
+        line: Position of the edit in its source document (1-based).
+        kind: Inventory kind (a SaveFile attribute name).
+        op: One of "set", "add" or "remove"; chips cannot be added.
+        slot: Target slot index, if given.
+        id: Item id; selects the target for set/remove, or the new record for add.
+        values: Field values to assign.
+    """
+    line: int
+    kind: str = "inventory"
+    op: str = "set"
+    slot: Optional[int] = None
+    id: Optional[int] = None
+    values: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class ImportSummary:
+    """
+    Counts of applied edits per operation.
+    """
+    set: int = 0
+    added: int = 0
+    removed: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.set + self.added + self.removed
+
+
+def _to_int(value) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, int):
+        return value
+    return int(str(value).strip(), 0)
+
+
+def _edit_from_mapping(line: int, row: dict) -> RecordEdit:
+    row = {k.strip(): v for k, v in row.items() if k}
+    edit = RecordEdit(
+        line=line,
+        kind=(row.pop("kind", None) or "inventory").strip(),
+        op=(row.pop("op", None) or "set").strip().lower(),
+    )
+    edit.slot = _to_int(row.pop("slot", None))
+    edit.id = _to_int(row.pop("id", None))
+    for name, value in row.items():
+        number = _to_int(value)
+        if number is not None:
+            edit.values[name] = number
+    return edit
+
+
+def load_edits(path: Path) -> List[RecordEdit]:
+    """
+    Read record edits from a JSON or CSV document.
+
+    JSON documents hold a list of objects (or {"edits": [...]}); CSV files
+    have a header row. Recognised keys are kind, op, slot, id and the
+    editable fields (quantity, level, weight, enemies_defeated, chip_type,
+    base_code). Integers accept any base prefix, e.g. 0x41a.
+
+    Args:
+        path: Path to a .json or .csv file.
+
+    Returns:
+        The parsed edits, in document order.
+
+    Raises:
+        EditConflictError: If the document or any of its rows cannot be parsed.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() == ".csv":
+        rows = list(csv.DictReader(text.splitlines()))
+    else:
+        try:
+            data = json.loads(text)
+            rows = data["edits"] if isinstance(data, dict) else data
+        except json.JSONDecodeError as e:
+            raise EditConflictError([f"{path}: invalid JSON: {e}"]) from e
+        except KeyError:
+            raise EditConflictError([f'{path}: expected a list of edits or an object with "edits"']) from None
+        if not isinstance(rows, list):
+            raise EditConflictError([f"{path}: edits must be a list, got {type(rows).__name__}"])
+
+    edits, errors = [], []
+    for line, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append(f"edit {line}: expected an object, got {row!r}")
+            continue
+        try:
+            edits.append(_edit_from_mapping(line, row))
+        except (TypeError, ValueError, AttributeError) as e:
+            errors.append(f"edit {line}: cannot parse {row!r}: {e}")
+    if errors:
+        raise EditConflictError(errors)
+    return edits
+
+
+def plan_edits(save: SaveFile, edits: List[RecordEdit]) -> List[Tuple[RecordEdit, int]]:
+    """
+    Resolve every edit to a concrete slot without touching the save.
+
+    Args:
+        save: The loaded save the edits apply to.
+        edits: Edits in the order they should be applied.
+
+    Returns:
+        (edit, slot) pairs ready for apply_edits.
+
+    Raises:
+        EditConflictError: Listing every conflict found in the batch.
+    """
+    conflicts: List[str] = []
+
+    # slot -> id of each inventory, updated as the plan progresses
+    occupancy: Dict[str, Dict[int, int]] = {}
+    free: Dict[str, List[int]] = {}
+    plan: List[Tuple[RecordEdit, int]] = []
+
+    for edit in edits:
+        where = f"edit {edit.line}"
+        if edit.kind not in _KINDS:
+            conflicts.append(f"{where}: unknown kind {edit.kind!r}")
+            continue
+        if edit.op not in OPS:
+            conflicts.append(f"{where}: unknown op {edit.op!r}")
+            continue
+        _, id_attr, editable = _KINDS[edit.kind]
+        ranges = _RANGES[edit.kind]
+        label, prefixes = _ID_CATEGORIES[edit.kind]
+        if edit.id is not None and not constants.ITEM_LIST.get(edit.id, "").startswith(prefixes):
+            conflicts.append(f"{where}: unknown {label} id {edit.id:#x}")
+            continue
+        extra = set(edit.values) - set(editable)
+        if extra:
+            conflicts.append(f"{where}: field(s) {', '.join(sorted(extra))} not editable for {edit.kind}")
+            continue
+        bad = [
+            f"{name}={value}" for name, value in edit.values.items()
+            if name in ranges and not (
+                ranges[name][0] <= value and (ranges[name][1] is None or value <= ranges[name][1])
+            )
+        ]
+        if bad:
+            conflicts.append(f"{where}: value(s) out of range: {', '.join(bad)}")
+            continue
+
+        if edit.kind not in occupancy:
+            manager = getattr(save, edit.kind)
+            occupancy[edit.kind] = {
+                slot.index: getattr(slot, id_attr) for slot in manager.raw if manager.is_slot_active(slot)
+            }
+            free[edit.kind] = sorted(set(range(manager.SLOT_COUNT)) - occupancy[edit.kind].keys(), reverse=True)
+        slots, empty = occupancy[edit.kind], free[edit.kind]
+        count = getattr(save, edit.kind).SLOT_COUNT
+
+        if edit.slot is not None and not 0 <= edit.slot < count:
+            conflicts.append(f"{where}: slot {edit.slot} out of range 0..{count - 1}")
+            continue
+
+        if edit.op == "add":
+            if edit.kind == "chips":
+                # A chip also needs its base code, type and slot data, which
+                # cannot be imported; the editors do not create chips either
+                conflicts.append(f"{where}: adding chips is not supported")
+                continue
+            if edit.id is None:
+                conflicts.append(f"{where}: add needs an id")
+                continue
+            if edit.slot is not None:
+                if edit.slot in slots:
+                    conflicts.append(f"{where}: slot {edit.slot} of {edit.kind} is occupied")
+                    continue
+                empty.remove(edit.slot)
+                target = edit.slot
+            elif empty:
+                target = empty.pop()
+            else:
+                conflicts.append(f"{where}: {edit.kind} has no free slot")
+                continue
+            slots[target] = edit.id
+        else:
+            if edit.slot is not None:
+                target = edit.slot
+                if target not in slots:
+                    conflicts.append(f"{where}: slot {target} of {edit.kind} is empty")
+                    continue
+                if edit.id is not None and slots[target] != edit.id:
+                    conflicts.append(f"{where}: slot {target} holds id {slots[target]:#x}, not {edit.id:#x}")
+                    continue
+            elif edit.id is not None:
+                target = next((s for s, i in sorted(slots.items()) if i == edit.id), None)
+                if target is None:
+                    conflicts.append(f"{where}: id {edit.id:#x} not present in {edit.kind}")
+                    continue
+            else:
+                conflicts.append(f"{where}: {edit.op} needs a slot or an id")
+                continue
+            if edit.op == "remove":
+                del slots[target]
+                empty.append(target)
+                empty.sort(reverse=True)
+        plan.append((edit, target))
+
+    if conflicts:
+        raise EditConflictError(conflicts)
+    return plan
+
+
+def apply_edits(save: SaveFile, edits: List[RecordEdit]) -> ImportSummary:
+    """
+    Validate and apply a batch of edits to a loaded save, all or nothing.
+
+    Args:
+        save: The loaded save to modify in place.
+        edits: Edits in the order they should be applied.
+
+    Returns:
+        An ImportSummary of what was changed.
+
+    Raises:
+        EditConflictError: If any edit conflicts; the save is left untouched.
+    """
+    plan = plan_edits(save, edits)
+    summary = ImportSummary()
+    for edit, slot in plan:
+        record_cls, id_attr, _ = _KINDS[edit.kind]
+        records = getattr(save, edit.kind).raw
+        if edit.op == "remove":
+            records[slot] = record_cls.empty(slot)
+            summary.removed += 1
+            continue
+        if edit.op == "add":
+            record = record_cls.empty(slot)
+            setattr(record, id_attr, edit.id)
+            if record_cls is Item:
+                record.status = ItemStatus.ACTIVE
+                record.quantity = 1
+            records[slot] = record
+            summary.added += 1
+        else:
+            summary.set += 1
+        for name, value in edit.values.items():
+            setattr(records[slot], name, value)
+
+    logger.info(
+        "Applied %d edit(s): %d set, %d added, %d removed",
+        summary.total, summary.set, summary.added, summary.removed,
+    )
+    return summary
+
+
+def import_edits(save_path: Path, edits_path: Path, output: Optional[Path] = None) -> ImportSummary:
+    """
+    Load a save, apply a document of edits and write it back once.
+
+    Args:
+        save_path: Save file to edit.
+        edits_path: JSON or CSV document of edits.
+        output: Where to write the result (default: overwrite save_path).
+
+    Returns:
+        An ImportSummary of what was changed.
+
+    Raises:
+        EditConflictError: If the document has conflicts; nothing is written.
+    """
+    edits = load_edits(edits_path)
+    save = SaveFile.load_from_file(save_path)
+    summary = apply_edits(save, edits)
+    save.save_to_file(output or save_path)
+    return summary
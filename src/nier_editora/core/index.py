@@ -0,0 +1,357 @@
+# src/nier_editora/core/index.py
+"""
+index.py
+
+Incremental SQLite index of a corpus of save files.
+
+Each indexed file contributes one row to `files` (header metadata and scalar
+fields) plus one row per active record to `items`, `weapons` and `chips`.
+Files are only re-parsed when their size or mtime changed and their content
+hash no longer matches the stored one.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from nier_editora.core.save import SaveFile, iter_save_paths
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id          INTEGER PRIMARY KEY,
+    path        TEXT NOT NULL UNIQUE,
+    size        INTEGER NOT NULL,
+    mtime_ns    INTEGER NOT NULL,
+    hash        TEXT NOT NULL,
+    is_console  INTEGER NOT NULL,
+    header_id   BLOB,
+    player_name TEXT,
+    play_time   INTEGER,
+    chapter     INTEGER,
+    money       INTEGER,
+    xp          INTEGER
+);
+CREATE TABLE IF NOT EXISTS items (
+    file_id   INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    inventory TEXT NOT NULL,
+    slot      INTEGER NOT NULL,
+    item_id   INTEGER NOT NULL,
+    status    INTEGER NOT NULL,
+    quantity  INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS weapons (
+    file_id          INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    slot             INTEGER NOT NULL,
+    weapon_id        INTEGER NOT NULL,
+    level            INTEGER NOT NULL,
+    is_new_item      INTEGER NOT NULL,
+    is_new_story     INTEGER NOT NULL,
+    enemies_defeated INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chips (
+    file_id   INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    slot      INTEGER NOT NULL,
+    base_code INTEGER NOT NULL,
+    base_id   INTEGER NOT NULL,
+    chip_type INTEGER NOT NULL,
+    level     INTEGER NOT NULL,
+    weight    INTEGER NOT NULL,
+    slot_a    INTEGER NOT NULL,
+    slot_b    INTEGER NOT NULL,
+    slot_c    INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_file ON items(file_id);
+CREATE INDEX IF NOT EXISTS idx_items_id_qty ON items(item_id, quantity);
+CREATE INDEX IF NOT EXISTS idx_weapons_file ON weapons(file_id);
+CREATE INDEX IF NOT EXISTS idx_weapons_id_level ON weapons(weapon_id, level);
+CREATE INDEX IF NOT EXISTS idx_chips_file ON chips(file_id);
+CREATE INDEX IF NOT EXISTS idx_chips_type_level_weight ON chips(chip_type, level, weight);
+CREATE INDEX IF NOT EXISTS idx_chips_base_id ON chips(base_id);
+"""
+
+_FILE_COLUMNS = (
+    "path", "size", "mtime_ns", "hash", "is_console", "header_id",
+    "player_name", "play_time", "chapter", "money", "xp",
+)
+_INSERT_FILE = (
+    f"INSERT INTO files ({', '.join(_FILE_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_FILE_COLUMNS))})"
+)
+_INSERT_ITEM = "INSERT INTO items VALUES (?, ?, ?, ?, ?, ?)"
+_INSERT_WEAPON = "INSERT INTO weapons VALUES (?, ?, ?, ?, ?, ?, ?)"
+_INSERT_CHIP = "INSERT INTO chips VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+
+@dataclass
+class ParsedSave:
+    """
+    Everything the index stores about one save file.
+
+    Attributes:
+        file: Values for the `files` table, keyed by column name.
+        items: Rows for `items` (without file_id).
+        weapons: Rows for `weapons` (without file_id).
+        chips: Rows for `chips` (without file_id).
+    """
+    file: Dict[str, object]
+    items: List[tuple] = field(default_factory=list)
+    weapons: List[tuple] = field(default_factory=list)
+    chips: List[tuple] = field(default_factory=list)
+
+
+@dataclass
+class IndexStats:
+    """
+    Counters describing one index update.
+
+    Attributes:
+        scanned: Save files found on disk.
+        unchanged: Files skipped because size/mtime or hash matched.
+        indexed: Files (re)parsed and stored.
+        removed: Index entries dropped because the file disappeared.
+        errors: Mapping of path to error message for files that failed to parse.
+    """
+    scanned: int = 0
+    unchanged: int = 0
+    indexed: int = 0
+    removed: int = 0
+    errors: Dict[str, str] = field(default_factory=dict)
+
+
+def file_digest(data: bytes) -> str:
+    """
+    Content hash used to detect changed files.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def parse_for_index(path: str, known_hash: Optional[str] = None) -> Tuple[str, object]:
+    """
+    Read and parse one save file into index rows.
+
+    Runs inside worker processes, so it only takes and returns picklable values.
+
+    Args:
+        path: Path of the save file.
+        known_hash: Hash currently stored for this path, if any.
+
+    Returns:
+        ("unchanged", (size, mtime_ns)) if the content hash equals known_hash,
+        ("parsed", ParsedSave) on success, or ("error", message) on failure.
+    """
+    try:
+        st = os.stat(path)
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = file_digest(data)
+        if digest == known_hash:
+            return "unchanged", (st.st_size, st.st_mtime_ns)
+
+        save = SaveFile()
+        save.load(data)
+    except Exception as e:
+        return "error", f"{type(e).__name__}: {e}"
+
+    parsed = ParsedSave(file={
+        "path": path,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "hash": digest,
+        "is_console": int(save.is_console),
+        "header_id": save.header_id,
+        "player_name": save.player_name,
+        "play_time": save.play_time,
+        "chapter": save.chapter,
+        "money": save.money,
+        "xp": save.xp,
+    })
+    for kind, inventory in (("inventory", save.inventory), ("corpse_inventory", save.corpse_inventory)):
+        parsed.items.extend(
+            (kind, it.index, it.id, it.status.value, it.quantity) for it in inventory.active
+        )
+    parsed.weapons.extend(
+        (w.index, w.id, w.level, int(w.is_new_item), int(w.is_new_story), w.enemies_defeated)
+        for w in save.weapons.active
+    )
+    parsed.chips.extend(
+        (c.index, c.base_code, c.base_id, c.chip_type, c.level, c.weight, c.slot_a, c.slot_b, c.slot_c)
+        for c in save.chips.active
+    )
+    return "parsed", parsed
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """
+    Open (and if needed create) an index database.
+
+    Args:
+        db_path: Path of the SQLite database file.
+
+    Returns:
+        A connection with foreign keys enabled and the schema in place.
+    """
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.executescript(_SCHEMA)
+    conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    return conn
+
+
+class SaveIndex:
+    """
+    SQLite index over a corpus of save files.
+
+    Usage:
+        with SaveIndex(Path("saves.sqlite")) as index:
+            stats = index.update([Path("archive/")])
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self.conn = connect(db_path)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SaveIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def update(
+        self,
+        paths: Iterable[Path],
+        jobs: Optional[int] = None,
+        batch_size: int = 64,
+        prune: bool = True,
+    ) -> IndexStats:
+        """
+        Bring the index up to date with the given files and directories.
+
+        Args:
+            paths: Files and/or directories; directories are searched recursively.
+            jobs: Number of worker processes (default: CPU count; 1 disables the pool).
+            batch_size: Number of parsed files written per transaction.
+            prune: Drop entries for files that vanished from the given directories.
+
+        Returns:
+            IndexStats describing what was done.
+        """
+        paths = list(paths)
+        stats = IndexStats()
+        known = {
+            path: (size, mtime_ns, digest)
+            for path, size, mtime_ns, digest in self.conn.execute(
+                "SELECT path, size, mtime_ns, hash FROM files"
+            )
+        }
+
+        seen = set()
+        todo: List[Tuple[str, Optional[str]]] = []
+        for path in iter_save_paths(paths):
+            key = str(path.resolve())
+            seen.add(key)
+            stats.scanned += 1
+            try:
+                st = os.stat(key)
+            except OSError as e:
+                stats.errors[key] = str(e)
+                continue
+            entry = known.get(key)
+            if entry and entry[:2] == (st.st_size, st.st_mtime_ns):
+                stats.unchanged += 1
+                continue
+            todo.append((key, entry[2] if entry else None))
+
+        logger.info("Index scan: %d files, %d to check", stats.scanned, len(todo))
+
+        batch: List[ParsedSave] = []
+        touched: List[Tuple[int, int, str]] = []
+        for (key, _), (status, payload) in zip(todo, self._parse_all(todo, jobs)):
+            if status == "parsed":
+                batch.append(payload)
+                if len(batch) >= batch_size:
+                    self._store(batch)
+                    stats.indexed += len(batch)
+                    batch = []
+            elif status == "unchanged":
+                size, mtime_ns = payload
+                touched.append((size, mtime_ns, key))
+                stats.unchanged += 1
+            else:
+                logger.warning("Failed to index %s: %s", key, payload)
+                stats.errors[key] = payload
+        if batch:
+            self._store(batch)
+            stats.indexed += len(batch)
+        if touched:
+            with self.conn:
+                self.conn.executemany("UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?", touched)
+
+        if prune:
+            stats.removed = self._prune(paths, known.keys() - seen)
+
+        logger.info(
+            "Index update: %d indexed, %d unchanged, %d removed, %d errors",
+            stats.indexed, stats.unchanged, stats.removed, len(stats.errors),
+        )
+        return stats
+
+    @staticmethod
+    def _parse_all(todo: List[Tuple[str, Optional[str]]], jobs: Optional[int]) -> Iterator[Tuple[str, object]]:
+        jobs = jobs or os.cpu_count() or 1
+        if not todo:
+            return iter(())
+        keys, hashes = zip(*todo)
+        if jobs == 1 or len(todo) < 4:
+            return map(parse_for_index, keys, hashes)
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        chunksize = max(1, len(todo) // (jobs * 4))
+
+        def results() -> Iterator[Tuple[str, object]]:
+            with pool:
+                yield from pool.map(parse_for_index, keys, hashes, chunksize=chunksize)
+
+        return results()
+
+    def _store(self, batch: List[ParsedSave]) -> None:
+        """
+        Replace the rows of every file in the batch in a single transaction.
+        """
+        with self.conn:
+            self.conn.executemany(
+                "DELETE FROM files WHERE path = ?", [(p.file["path"],) for p in batch]
+            )
+            items, weapons, chips = [], [], []
+            for parsed in batch:
+                cur = self.conn.execute(_INSERT_FILE, [parsed.file[c] for c in _FILE_COLUMNS])
+                file_id = cur.lastrowid
+                items.extend((file_id, *row) for row in parsed.items)
+                weapons.extend((file_id, *row) for row in parsed.weapons)
+                chips.extend((file_id, *row) for row in parsed.chips)
+            self.conn.executemany(_INSERT_ITEM, items)
+            self.conn.executemany(_INSERT_WEAPON, weapons)
+            self.conn.executemany(_INSERT_CHIP, chips)
+
+    def _prune(self, roots: List[Path], missing: Iterable[str]) -> int:
+        """
+        Delete entries under the scanned directories whose files are gone.
+        """
+        prefixes = tuple(str(root.resolve()) + os.sep for root in roots if root.is_dir())
+        gone = [(path,) for path in missing if path.startswith(prefixes)]
+        if gone:
+            with self.conn:
+                self.conn.executemany("DELETE FROM files WHERE path = ?", gone)
+        return len(gone)
@@ -1,14 +1,184 @@
 import io
 import logging
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, List, Iterator
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generic, Iterable, TypeVar, List, Iterator, Tuple, Union
 
+from nier_editora.core.constants import ITEM_LIST
 from nier_editora.core.exceptions import SlotIndexError
 
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class ChangeSummary:
+    """
+    Slots touched by a bulk inventory operation.
+
+    Attributes:
+        added: Slots that received a new record.
+        changed: Slots whose record was modified.
+        removed: Slots that were emptied.
+        skipped: Ids that could not be added.
+    """
+    added: List[int] = field(default_factory=list)
+    changed: List[int] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+    skipped: List[int] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __str__(self) -> str:
+        text = f"{len(self.added)} added, {len(self.changed)} changed, {len(self.removed)} removed"
+        return f"{text}, {len(self.skipped)} skipped" if self.skipped else text
+
+
+def check_ids(ids: Iterable[int], prefixes: Tuple[str, ...], label: str = "item") -> List[int]:
+    """
+    Materialize ids to add and make sure every one belongs to an inventory.
+
+    Args:
+        ids: Ids to check.
+        prefixes: ITEM_LIST code prefixes the inventory accepts, e.g.
+            WEAPON_PREFIXES.
+        label: Name of the id kind, for the error message.
+
+    Returns:
+        The ids, as a list.
+
+    Raises:
+        ValueError: Listing every id that is unknown, negative or of
+            another category.
+    """
+    ids = list(ids)
+    unknown = sorted({item_id for item_id in ids if not ITEM_LIST.get(item_id, "").startswith(prefixes)})
+    if unknown:
+        raise ValueError(f"unknown {label} id(s): {', '.join(str(item_id) for item_id in unknown)}")
+    return ids
+
+
+def _build(cls, values: dict):
+    record = object.__new__(cls)
+    record.__dict__.update(values)
+    return record
+
+
+# Record class -> its read-only view class, and back
+_VIEW_CLASSES: Dict[type, type] = {}
+_RECORD_CLASSES: Dict[type, type] = {}
+
+
+def _copy_record(record: T) -> T:
+    # Records are plain dataclasses of immutable values
+    cls = type(record)
+    return _build(_RECORD_CLASSES.get(cls, cls), record.__dict__)
+
+
+def _view_class(cls: type) -> type:
+    """
+    Read-only subclass of a record class, used to look at captured values.
+
+    Instances share the captured value dict instead of copying it. They
+    compare equal to records of the base class with the same values, and
+    constructing one (e.g. through `empty()` or `dataclasses.replace`)
+    yields a regular, writable record.
+    """
+    view_cls = _VIEW_CLASSES.get(cls)
+    if view_cls is None:
+        def __new__(view, *args, **kwargs):
+            return cls(*args, **kwargs)
+
+        def __setattr__(self, name, value):
+            raise AttributeError(f"{cls.__name__} from peek() is read-only; fetch it through raw to modify it")
+
+        def __eq__(self, other):
+            if not isinstance(other, cls):
+                return NotImplemented
+            return self.__dict__ == other.__dict__
+
+        def __reduce__(self):
+            return _build, (cls, dict(self.__dict__))
+
+        view_cls = _VIEW_CLASSES[cls] = type(cls.__name__, (cls,), {
+            "__slots__": (), "__qualname__": cls.__qualname__, "__module__": cls.__module__,
+            "__new__": __new__, "__setattr__": __setattr__, "__delattr__": __setattr__,
+            "__eq__": __eq__, "__hash__": None, "__reduce__": __reduce__,
+        })
+        _RECORD_CLASSES[view_cls] = cls
+    return view_cls
+
+
+def _view(cls: type, values: dict):
+    view = object.__new__(_view_class(cls))
+    object.__setattr__(view, "__dict__", values)
+    return view
+
+
+class _CowSlots(list):
+    """
+    Slot list of a snapshot whose records are built on first access.
+
+    Taking a snapshot only captures the field values of every record
+    (`pending`); a record object is created from them the first time its
+    slot is fetched through `raw`. `peek()` instead yields read-only views
+    sharing the captured values, which stay pending, so reading a snapshot
+    (writing it out, listing active or free slots, diffing it) copies no
+    record. Nothing is shared with the
+    manager the snapshot was taken from, so edits on either side, including
+    through records or slot lists fetched before the snapshot, never reach
+    the other.
+    """
+    __slots__ = ("pending",)
+
+    def __init__(self, pending: Dict[int, Union[Tuple[type, dict], object]]) -> None:
+        super().__init__([None] * len(pending))
+        self.pending = pending
+
+    def _own(self, index: int):
+        state = self.pending.pop(index, None)
+        if state is None:
+            return list.__getitem__(self, index)
+        record = _build(*state) if type(state) is tuple else _copy_record(state)
+        list.__setitem__(self, index, record)
+        return record
+
+    def peek(self) -> Iterator:
+        pending = self.pending
+        for index, record in enumerate(list.__iter__(self)):
+            state = pending.get(index)
+            if state is None:
+                yield record
+            elif type(state) is tuple:
+                # Keep the view: it is immutable, so later peeks and
+                # snapshots of this snapshot can share it
+                view = pending[index] = _view(*state)
+                yield view
+            else:
+                yield state
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._own(i) for i in range(*index.indices(len(self)))]
+        return self._own(index + len(self) if index < 0 else index)
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice):
+            raise TypeError("slice assignment is not supported on inventory slots")
+        index = index + len(self) if index < 0 else index
+        list.__setitem__(self, index, value)
+        self.pending.pop(index, None)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._own(index)
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
 class SlotManager(Generic[T], ABC):
     """
     Base class for managing a fixed number of slots of type T.
@@ -28,12 +198,12 @@ class SlotManager(Generic[T], ABC):
             NotImplementedError: If subclass does not define SLOT_COUNT.
             SlotIndexError: If raw_slots length != SLOT_COUNT.
         """
-        logger.debug(f"Initializing {self.__class__.__name__} with {len(raw_slots)} slots")
+        logger.debug("Initializing %s with %d slots", type(self).__name__, len(raw_slots))
         if not hasattr(self, "SLOT_COUNT"):
             logger.error("Subclasses must define SLOT_COUNT")
             raise NotImplementedError("Subclasses must define SLOT_COUNT")
         if len(raw_slots) != self.SLOT_COUNT:
-            logger.error(f"Expected {self.SLOT_COUNT} slots, got {len(raw_slots)}")
+            logger.error("Expected %d slots, got %d", self.SLOT_COUNT, len(raw_slots))
             raise SlotIndexError(f"Expected {self.SLOT_COUNT} slots, got {len(raw_slots)}")
         self._slots = list(raw_slots)
 
@@ -45,8 +215,21 @@ class SlotManager(Generic[T], ABC):
         Returns:
             List of all slots.
         """
+        if type(self._slots) is _CowSlots and not self._slots.pending:
+            self._slots = list(list.__iter__(self._slots))
         return self._slots
 
+    def peek(self) -> Iterator[T]:
+        """
+        Iterate over all slots for reading only.
+
+        Yields:
+            Slot objects in slot order.
+        """
+        if type(self._slots) is _CowSlots:
+            return self._slots.peek()
+        return list.__iter__(self._slots)
+
     @abstractmethod
     def is_slot_active(self, slot: T) -> bool:
         """
@@ -68,8 +251,9 @@ class SlotManager(Generic[T], ABC):
         Returns:
             List of slots where is_slot_active(slot) is True.
         """
-        active_slots = [slot for slot in self._slots if self.is_slot_active(slot)]
-        logger.debug(f"Computed active slots: {len(active_slots)} of {self.SLOT_COUNT}")
+        slots = self._slots
+        active_slots = [slots[idx] for idx, slot in enumerate(self.peek()) if self.is_slot_active(slot)]
+        logger.debug("Computed active slots: %d of %d", len(active_slots), self.SLOT_COUNT)
         return active_slots
 
     def __iter__(self) -> Iterator[T]:
@@ -91,14 +275,90 @@ class SlotManager(Generic[T], ABC):
         Returns:
             True if the item was added; False if no inactive slots were available.
         """
-        for idx, slot in enumerate(self._slots):
+        for idx, slot in enumerate(self.peek()):
             if not self.is_slot_active(slot):
                 self._slots[idx] = item
-                logger.info(f"Added item to slot index {idx}")
+                logger.info("Added item to slot index %d", idx)
                 return True
-        logger.warning(f"No inactive slot available to add item: {item}")
+        logger.warning("No inactive slot available to add item: %s", item)
         return False
 
+    def free_slots(self) -> List[int]:
+        """
+        Indexes of the inactive slots, in ascending order.
+        """
+        return [idx for idx, slot in enumerate(self.peek()) if not self.is_slot_active(slot)]
+
+    def remove_where(self, pred: Callable[[T], bool]) -> ChangeSummary:
+        """
+        Empty every active slot matching a predicate, in one pass.
+
+        Args:
+            pred: Called with each active record; must not modify it.
+
+        Returns:
+            Summary listing the emptied slots.
+        """
+        summary = ChangeSummary()
+        for idx, slot in enumerate(self.peek()):
+            if self.is_slot_active(slot) and pred(slot):
+                self._slots[idx] = type(slot).empty(idx)
+                summary.removed.append(idx)
+        logger.debug("remove_where on %s: %s", type(self).__name__, summary)
+        return summary
+
+    def _update_where(self, pred: Callable[[T], bool], **values) -> ChangeSummary:
+        """
+        Set attributes of every active record matching `pred`, in one pass.
+        """
+        summary = ChangeSummary()
+        for idx, slot in enumerate(self.peek()):
+            if (self.is_slot_active(slot) and pred(slot)
+                    and any(getattr(slot, name) != value for name, value in values.items())):
+                record = self._slots[idx]
+                for name, value in values.items():
+                    setattr(record, name, value)
+                summary.changed.append(idx)
+        logger.debug("Updated %s where predicate matched: %s", type(self).__name__, summary)
+        return summary
+
+    def copy(self) -> "SlotManager[T]":
+        """
+        Independent copy holding copies of every slot record.
+
+        Returns:
+            A manager of the same type whose records can be modified freely.
+        """
+        clone = object.__new__(type(self))
+        clone._slots = [_copy_record(slot) for slot in self.peek()]
+        return clone
+
+    def snapshot(self) -> "SlotManager[T]":
+        """
+        Copy-on-access copy of this manager.
+
+        Only the field values of each record are captured now; the
+        snapshot builds a record the first time its slot is fetched through
+        `raw`, and reads through `peek()` build none. This manager, its slot
+        list and its records are left untouched, and the two sides never
+        share a writable record.
+
+        Returns:
+            A manager of the same type, equal to this one.
+        """
+        slots = self._slots
+        if type(slots) is _CowSlots:
+            # Pending values and views are never modified, so they can be shared
+            pending = dict(slots.pending)
+            for idx, record in enumerate(list.__iter__(slots)):
+                if idx not in pending:
+                    pending[idx] = (type(record), record.__dict__.copy())
+        else:
+            pending = {idx: (type(record), record.__dict__.copy()) for idx, record in enumerate(slots)}
+        clone = object.__new__(type(self))
+        clone._slots = _CowSlots(pending)
+        return clone
+
     def write(self, buf: io.BytesIO) -> None:
         """
         Serialize all slots to the given buffer.
@@ -107,6 +367,6 @@ class SlotManager(Generic[T], ABC):
             buf: A BytesIO buffer to write each slot into.
         """
         logger.debug("Writing all slots to buffer")
-        for slot in self._slots:
+        for slot in self.peek():
             slot.write(buf)
-        logger.info(f"Wrote {len(self._slots)} slots to buffer")
+        logger.debug("Wrote %d slots to buffer", len(self._slots))
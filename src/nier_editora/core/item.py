@@ -10,13 +10,15 @@ import io
 import logging
 import struct
 from dataclasses import dataclass
-from typing import ClassVar, Optional
+from typing import Callable, ClassVar, Iterable, Optional
 
-from nier_editora.core.constants import ITEM_LIST, ITEM_SIZE, INVENTORY_ITEM_COUNT
+from nier_editora.core.constants import (
+    ITEM_LIST, ITEM_PREFIXES, ITEM_SIZE, INVENTORY_ITEM_COUNT, MAX_ITEM_QUANTITY,
+)
 from nier_editora.core.enums import ItemStatus
 from nier_editora.core.exceptions import SerializationError
 from nier_editora.core.i18n import translate_item
-from nier_editora.core.inventory import SlotManager
+from nier_editora.core.inventory import ChangeSummary, SlotManager, check_ids
 
 logger = logging.getLogger(__name__)
 
@@ -69,14 +71,14 @@ class Item:
         """
         raw = stream.read(ITEM_SIZE)
         if len(raw) != ITEM_SIZE:
-            logger.error(f"Expected {ITEM_SIZE} bytes for item data, got {len(raw)}")
+            logger.error("Expected %d bytes for item data, got %d", ITEM_SIZE, len(raw))
             raise SerializationError(f"Expected {ITEM_SIZE} bytes, got {len(raw)}")
 
         ID, status_val, quantity = cls._STRUCT.unpack(raw)
         try:
             status = ItemStatus(status_val)
         except ValueError:
-            logger.warning(f"Unknown status {status_val} for item ID {ID}; defaulting to INACTIVE")
+            logger.warning("Unknown status %d for item ID %d; defaulting to INACTIVE", status_val, ID)
             status = ItemStatus.INACTIVE
 
         # logger.debug(f"Read Item(index={index}, id={ID}, status={status}, quantity={quantity})")
@@ -138,4 +140,86 @@ class ItemInventory(SlotManager[Item]):
         """
         active = slot.id != -1
         # logger.debug(f"Slot index={slot.index} active={active}")
-        return active
\ No newline at end of file
+        return active
+
+    def add_many(self, ids: Iterable[int], qty: int = 1, cap: int = MAX_ITEM_QUANTITY) -> ChangeSummary:
+        """
+        Add `qty` of each item id in one pass.
+
+        Ids already in the inventory are stacked onto their existing slot;
+        new ids take the lowest free slots. Quantities never exceed `cap`.
+
+        Args:
+            ids: Item ids to add; repeated ids are added repeatedly.
+            qty: Quantity added per id.
+            cap: Maximum quantity per slot.
+
+        Returns:
+            Summary of added and changed slots; ids that did not fit are
+            listed as skipped.
+
+        Raises:
+            ValueError: If qty is less than 1 or an id is not an item or fish id;
+                nothing is added then.
+        """
+        if qty < 1:
+            raise ValueError(f"Quantity must be at least 1, got {qty}")
+        ids = check_ids(ids, ITEM_PREFIXES)
+        summary = ChangeSummary()
+        stacks = {}
+        free = []
+        for idx, slot in enumerate(self.peek()):
+            if self.is_slot_active(slot):
+                stacks.setdefault(slot.id, idx)
+            else:
+                free.append(idx)
+        free.reverse()  # pop() hands out the lowest slot first
+        added = set()
+
+        for item_id in ids:
+            idx = stacks.get(item_id)
+            if idx is None:
+                if not free:
+                    summary.skipped.append(item_id)
+                    continue
+                idx = stacks[item_id] = free.pop()
+                self._slots[idx] = Item(idx, item_id, ItemStatus.ACTIVE, min(qty, cap))
+                summary.added.append(idx)
+                added.add(idx)
+                continue
+            record = self._slots[idx]
+            quantity = min(cap, record.quantity + qty)
+            if quantity != record.quantity:
+                record.quantity = quantity
+                if idx not in added and idx not in summary.changed:
+                    summary.changed.append(idx)
+
+        logger.debug("add_many: %s", summary)
+        return summary
+
+    def set_quantity_where(self, pred: Callable[[Item], bool], qty: int) -> ChangeSummary:
+        """
+        Set the quantity of every active item matching a predicate.
+
+        Args:
+            pred: Called with each active item; must not modify it.
+            qty: New quantity.
+
+        Returns:
+            Summary listing the changed slots.
+
+        Raises:
+            ValueError: If qty is negative.
+        """
+        if qty < 0:
+            raise ValueError(f"Quantity must be non-negative, got {qty}")
+        return self._update_where(pred, quantity=qty)
+
+    def max_all(self, cap: int = MAX_ITEM_QUANTITY) -> ChangeSummary:
+        """
+        Set every active item's quantity to `cap`.
+
+        Returns:
+            Summary listing the changed slots.
+        """
+        return self.set_quantity_where(lambda item: True, cap)
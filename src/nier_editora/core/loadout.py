@@ -0,0 +1,146 @@
+# src/nier_editora/core/loadout.py
+"""
+loadout.py
+
+Chip loadout optimizer.
+
+Picks at most one chip per chip_type so that the total weight stays within
+a budget and the total score is maximal. This is a grouped 0/1 knapsack,
+solved by dynamic programming over the weight budget:
+
+  - within each type, chips dominated by another chip of that type (no
+    better score for no less weight) are pruned first, leaving a short
+    Pareto front per type;
+  - the table then holds, for every weight w <= budget, the best score of
+    the types seen so far, and each type is folded in with one pass over
+    its front.
+
+With ~50 types, fronts of a few chips and a budget around 128, a full
+256-slot inventory solves in well under a few milliseconds.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Union
+
+from nier_editora.core.chip import Chip
+
+logger = logging.getLogger(__name__)
+
+# Chip capacity of a fully upgraded character
+DEFAULT_BUDGET = 128
+
+Score = Callable[[Chip], float]
+
+SCORES: Dict[str, Score] = {
+    # Levels start at +0, so every chip is worth at least 1
+    "level": lambda chip: chip.level + 1,
+    "count": lambda chip: 1,
+}
+
+
+@dataclass
+class Loadout:
+    """
+    An optimal chip selection.
+
+    Attributes:
+        chips: Chosen chips, one per chip_type, in slot order.
+        score: Total score of the chosen chips.
+        weight: Total weight of the chosen chips.
+        budget: Weight budget the selection was made for.
+    """
+    chips: List[Chip]
+    score: float
+    weight: int
+    budget: int
+
+    def to_dict(self) -> dict:
+        return {
+            "score": self.score, "weight": self.weight, "budget": self.budget,
+            "chips": [{"index": chip.index, "name": chip.name, "chip_type": chip.chip_type,
+                       "level": chip.level, "weight": chip.weight} for chip in self.chips],
+        }
+
+
+def pareto_front(chips: Iterable[Chip], score: Score) -> List[Chip]:
+    """
+    Chips not dominated by another chip of lower or equal weight.
+
+    Returns:
+        The front, ordered by increasing weight and strictly increasing score.
+    """
+    front: List[Chip] = []
+    best = float("-inf")
+    for chip in sorted(chips, key=lambda c: (max(c.weight, 0), -score(c))):
+        value = score(chip)
+        if value > best:
+            front.append(chip)
+            best = value
+    return front
+
+
+def optimize(chips: Iterable[Chip], budget: int = DEFAULT_BUDGET,
+             score: Union[str, Score] = "level") -> Loadout:
+    """
+    Best selection of at most one chip per type within a weight budget.
+
+    Args:
+        chips: Candidate chips, e.g. `save.chips.active`.
+        budget: Maximum total weight.
+        score: Name from SCORES or a function of a chip; chips scoring 0 or
+            less are never chosen.
+
+    Returns:
+        The optimal Loadout (ties keep the lighter selection).
+
+    Raises:
+        ValueError: If the budget is negative or the score name is unknown.
+    """
+    if budget < 0:
+        raise ValueError(f"Budget must be non-negative, got {budget}")
+    if isinstance(score, str):
+        if score not in SCORES:
+            raise ValueError(f"Unknown score {score!r}; expected one of {', '.join(SCORES)}")
+        score = SCORES[score]
+
+    by_type: Dict[int, List[Chip]] = defaultdict(list)
+    for chip in chips:
+        if max(chip.weight, 0) <= budget and score(chip) > 0:
+            by_type[chip.chip_type].append(chip)
+    fronts = [pareto_front(group, score) for group in by_type.values()]
+
+    # best[w]: best score with total weight <= w over the types folded so far
+    best = [0.0] * (budget + 1)
+    choices: List[List[int]] = []
+    for front in fronts:
+        values = [(max(chip.weight, 0), score(chip)) for chip in front]
+        nxt = best[:]
+        chosen = [-1] * (budget + 1)
+        for w in range(budget + 1):
+            for k, (weight, value) in enumerate(values):
+                if weight > w:
+                    break
+                candidate = best[w - weight] + value
+                if candidate > nxt[w]:
+                    nxt[w] = candidate
+                    chosen[w] = k
+        best = nxt
+        choices.append(chosen)
+
+    # Walk the choices back from the lightest weight reaching the optimum
+    w = min(range(budget + 1), key=lambda x: (-best[x], x))
+    total = best[w]
+    picked: List[Chip] = []
+    for front, chosen in zip(reversed(fronts), reversed(choices)):
+        k = chosen[w]
+        if k >= 0:
+            picked.append(front[k])
+            w -= max(front[k].weight, 0)
+
+    picked.sort(key=lambda chip: chip.index)
+    loadout = Loadout(picked, total, sum(max(chip.weight, 0) for chip in picked), budget)
+    logger.debug("Optimized %d chip type(s) for budget %d: score %s, weight %d",
+                 len(fronts), budget, total, loadout.weight)
+    return loadout
@@ -0,0 +1,190 @@
+# src/nier_editora/core/metrics.py
+"""
+metrics.py
+
+Lightweight in-process phase timing.
+
+Code marks phases with `span`:
+
+    with metrics.span("save.decode.inventory"):
+        ...
+
+or decorate whole functions with `timed`. While metrics are disabled (the
+default) `span` returns a shared no-op context manager, so instrumented
+code pays only for one function call.
+Once enabled, every span adds its duration to an in-memory registry keyed
+by name, which can be read with `snapshot` or printed with `report`.
+"""
+
+import functools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, TextIO, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+_enabled = False
+_lock = threading.Lock()
+_registry: Dict[str, "PhaseStats"] = {}
+
+
+@dataclass
+class PhaseStats:
+    """
+    Accumulated timings of one named phase.
+
+    Attributes:
+        count: Number of completed spans.
+        total: Total time in seconds.
+        min: Shortest span in seconds.
+        max: Longest span in seconds.
+    """
+    count: int = 0
+    total: float = 0.0
+    min: float = float("inf")
+    max: float = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed < self.min:
+            self.min = elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total * 1000,
+            "mean_us": self.mean * 1e6,
+            "min_us": self.min * 1e6 if self.count else 0.0,
+            "max_us": self.max * 1e6,
+        }
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            stats = _registry.get(self.name)
+            if stats is None:
+                stats = _registry[self.name] = PhaseStats()
+            stats.add(elapsed)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str):
+    """
+    Time the enclosed block as phase `name`.
+
+    Args:
+        name: Dotted phase name, e.g. "save.load.chips".
+
+    Returns:
+        A context manager; a shared no-op one while metrics are disabled.
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorator form of `span`: time every call of the function as phase `name`.
+    """
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable() -> None:
+    """
+    Start recording spans.
+    """
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """
+    Stop recording spans; already recorded timings are kept.
+    """
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """
+    Drop all recorded timings.
+    """
+    with _lock:
+        _registry.clear()
+
+
+def snapshot() -> Dict[str, PhaseStats]:
+    """
+    Copy of the registry, phase name → PhaseStats.
+    """
+    with _lock:
+        return {name: PhaseStats(s.count, s.total, s.min, s.max) for name, s in _registry.items()}
+
+
+def report(stream: Optional[TextIO] = None) -> str:
+    """
+    Format the recorded phases as a table, slowest total first.
+
+    Args:
+        stream: If given, the table is also written to it.
+
+    Returns:
+        The formatted table.
+    """
+    phases = sorted(snapshot().items(), key=lambda kv: kv[1].total, reverse=True)
+    grand_total = sum(s.total for _, s in phases) or 1.0
+    width = max([len(name) for name, _ in phases] + [5])
+    lines = [f"{'phase':<{width}}{'count':>9}{'total':>12}{'share':>8}{'mean':>11}{'max':>11}"]
+    for name, s in phases:
+        lines.append(
+            f"{name:<{width}}{s.count:>9}{s.total * 1000:>10.1f}ms{s.total / grand_total:>8.1%}"
+            f"{s.mean * 1e6:>9.1f}us{s.max * 1e6:>9.1f}us"
+        )
+    text = "\n".join(lines)
+    if stream is not None:
+        print(text, file=stream)
+    return text
@@ -0,0 +1,217 @@
+# src/nier_editora/core/normalize.py
+"""
+normalize.py
+
+Inventory normalization: one pass per inventory that
+  - merges item stacks sharing an id and clamps quantities to a cap,
+  - compacts active records to the front,
+  - sorts them by id, category or translated name,
+  - rewrites every slot's `index` to match its new position.
+
+Slots whose record ends up unchanged are not written back. The pass still
+reads every slot and works on copies of the item stacks, so it costs
+O(slots) even on an already normal inventory; on a snapshot, the slots it
+leaves alone stay pending (see SlotManager.snapshot).
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from nier_editora.core import constants
+from nier_editora.core.exceptions import SaveEditorError
+from nier_editora.core.item import ItemInventory
+from nier_editora.core.save import SaveFile, iter_save_paths
+
+logger = logging.getLogger(__name__)
+
+# Below this many files the cost of spawning workers outweighs the gain
+_MIN_PARALLEL_FILES = 4
+
+
+def _record_id(record) -> int:
+    return record.base_id if hasattr(record, "base_id") else record.id
+
+
+def _category_key(record):
+    # Chips group by type; items and weapons by their internal name, whose
+    # prefix is the game's category (item_recovery_, item_material_, fish_, ...)
+    if hasattr(record, "chip_type"):
+        return record.chip_type, record.base_id, record.level
+    return constants.ITEM_LIST.get(record.id, ""), record.id
+
+
+SORT_KEYS: Dict[str, Optional[Callable]] = {
+    "slot": None,
+    "id": _record_id,
+    "category": _category_key,
+    "name": lambda record: ((record.name or "").casefold(), _record_id(record)),
+}
+
+
+@dataclass
+class NormalizeResult:
+    """
+    What normalizing one inventory changed.
+
+    Attributes:
+        kind: Inventory kind.
+        merged: Stacks folded into an earlier stack of the same id.
+        clamped: Stacks whose quantity was cut to the cap.
+        changed: Slots whose record was rewritten.
+    """
+    kind: str
+    merged: int = 0
+    clamped: int = 0
+    changed: List[int] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        return (f"{self.kind}: {self.merged} merged, {self.clamped} clamped, "
+                f"{len(self.changed)} slot(s) rewritten")
+
+
+def normalize_inventory(manager, kind: str, sort: str = "id", cap: int = constants.MAX_ITEM_QUANTITY,
+                        merge: bool = True) -> NormalizeResult:
+    """
+    Normalize one inventory in place.
+
+    Args:
+        manager: ItemInventory, WeaponInventory or ChipInventory.
+        kind: Inventory kind, for the result.
+        sort: One of SORT_KEYS; "slot" keeps the current order.
+        cap: Maximum item quantity (items only).
+        merge: Whether to merge item stacks sharing an id (items only).
+
+    Returns:
+        What changed.
+
+    Raises:
+        ValueError: If sort is unknown or cap is negative.
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key {sort!r}; expected one of {', '.join(SORT_KEYS)}")
+    if cap < 0:
+        raise ValueError(f"Cap must be non-negative, got {cap}")
+    result = NormalizeResult(kind)
+    old = list(manager.peek())
+    records = [record for record in old if manager.is_slot_active(record)]
+
+    if isinstance(manager, ItemInventory):
+        stacks = {}
+        for record in records:
+            top = stacks.get(record.id) if merge else None
+            if top is None:
+                stacks[record.id if merge else len(stacks)] = replace(record)
+            else:
+                top.quantity += record.quantity
+                result.merged += 1
+        records = list(stacks.values())
+        for record in records:
+            if record.quantity > cap:
+                record.quantity = cap
+                result.clamped += 1
+
+    key = SORT_KEYS[sort]
+    if key is not None:
+        records.sort(key=key)
+
+    slots = manager.raw
+    record_cls = type(old[0])
+    for idx, previous in enumerate(old):
+        if idx < len(records):
+            record = records[idx]
+            if record.index != idx:
+                record = replace(record, index=idx)
+        else:
+            if not manager.is_slot_active(previous):
+                continue
+            record = record_cls.empty(idx)
+        if record != previous:
+            slots[idx] = record
+            result.changed.append(idx)
+
+    logger.debug("Normalized %s", result)
+    return result
+
+
+def normalize_save(save: SaveFile, kinds: Sequence[str] = SaveFile.INVENTORY_FIELDS, sort: str = "id",
+                   cap: int = constants.MAX_ITEM_QUANTITY, merge: bool = True) -> List[NormalizeResult]:
+    """
+    Normalize several inventories of a save in place.
+
+    Returns:
+        One NormalizeResult per inventory, in `kinds` order.
+    """
+    return [normalize_inventory(getattr(save, kind), kind, sort, cap, merge) for kind in kinds]
+
+
+@dataclass
+class NormalizeReport:
+    """
+    Outcome of normalizing one save file.
+
+    Attributes:
+        path: The file.
+        results: Per-inventory results (empty if the file failed).
+        error: Error message if the file could not be read or written.
+    """
+    path: str
+    results: List[NormalizeResult] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        return any(result.changed for result in self.results)
+
+    def to_dict(self) -> dict:
+        return {"path": self.path, "changed": self.changed, "error": self.error,
+                "results": [asdict(result) for result in self.results]}
+
+
+def normalize_file(path: Path, kinds: Sequence[str] = SaveFile.INVENTORY_FIELDS, sort: str = "id",
+                   cap: int = constants.MAX_ITEM_QUANTITY, merge: bool = True,
+                   dry_run: bool = False) -> NormalizeReport:
+    """
+    Normalize a save file on disk, rewriting it only if something changed.
+
+    Returns:
+        A NormalizeReport; I/O and parse errors are reported rather than raised.
+    """
+    report = NormalizeReport(str(path))
+    try:
+        save = SaveFile.load_from_file(path)
+        report.results = normalize_save(save, kinds, sort, cap, merge)
+        if report.changed and not dry_run:
+            save.save_to_file(path)
+    except (OSError, SaveEditorError) as e:
+        report.error = str(e)
+    return report
+
+
+def normalize_paths(paths: Iterable[Path], jobs: Optional[int] = None, **options) -> Iterator[NormalizeReport]:
+    """
+    Normalize save files and directories, spreading the work over processes.
+
+    Args:
+        paths: Files and/or directories; directories are searched recursively.
+        jobs: Number of worker processes (default: CPU count; 1 disables the pool).
+        **options: Passed to normalize_file.
+
+    Yields:
+        One NormalizeReport per save file, in input order.
+    """
+    files: Sequence[Path] = list(iter_save_paths(paths))
+    work = partial(normalize_file, **options)
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) < _MIN_PARALLEL_FILES:
+        yield from map(work, files)
+        return
+
+    chunksize = max(1, len(files) // (jobs * 4))
+    logger.debug("Normalizing %d files with %d workers", len(files), jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(work, files, chunksize=chunksize)
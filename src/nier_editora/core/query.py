@@ -0,0 +1,236 @@
+# src/nier_editora/core/query.py
+"""
+query.py
+
+Compile corpus questions into SQL over a save index built by index.py.
+
+A query names one table (files, items, weapons or chips), a list of
+conditions such as "item_id=0x41a" or "quantity>=50", and optionally
+group-by columns and aggregates such as "max:level" or "count". Record
+tables are joined with `files`, so file columns (path, money, ...) can be
+used in conditions and groupings too.
+"""
+
+import csv
+import json
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+from nier_editora.core.exceptions import QueryError
+
+logger = logging.getLogger(__name__)
+
+FILE_COLUMNS = (
+    "path", "size", "mtime_ns", "hash", "is_console", "player_name",
+    "play_time", "chapter", "money", "xp",
+)
+TABLE_COLUMNS = {
+    "files": (),
+    "items": ("inventory", "slot", "item_id", "status", "quantity"),
+    "weapons": ("slot", "weapon_id", "level", "is_new_item", "is_new_story", "enemies_defeated"),
+    "chips": ("slot", "base_code", "base_id", "chip_type", "level", "weight", "slot_a", "slot_b", "slot_c"),
+}
+AGGREGATES = ("count", "min", "max", "sum", "avg")
+OPERATORS = ("=", "!=", "<", "<=", ">", ">=")
+
+_CONDITION_RE = re.compile(r"^\s*([a-z_]+)\s*(>=|<=|!=|=|<|>)\s*(.*?)\s*$")
+
+
+@dataclass(frozen=True)
+class Condition:
+    """
+    A single `column op value` filter.
+    """
+    column: str
+    op: str
+    value: Union[int, str]
+
+
+@dataclass(frozen=True)
+class Aggregate:
+    """
+    An aggregate function over a column (or over rows, for count).
+    """
+    func: str
+    column: Optional[str] = None
+
+    @property
+    def alias(self) -> str:
+        return self.func if self.column is None else f"{self.func}_{self.column}"
+
+
+def parse_condition(expr: str) -> Condition:
+    """
+    Parse a condition such as "quantity>=50" or "item_id=0x41a".
+
+    Integer literals accept any base prefix understood by int(x, 0).
+
+    Raises:
+        QueryError: If the expression cannot be parsed.
+    """
+    match = _CONDITION_RE.match(expr)
+    if not match:
+        raise QueryError(f"Cannot parse condition {expr!r}; expected e.g. 'quantity>=50'")
+    column, op, raw = match.groups()
+    try:
+        value: Union[int, str] = int(raw, 0)
+    except ValueError:
+        value = raw
+    return Condition(column, op, value)
+
+
+def parse_aggregate(spec: str) -> Aggregate:
+    """
+    Parse an aggregate such as "count" or "max:level".
+
+    Raises:
+        QueryError: If the function is unknown, or is not "count" and has
+            no column.
+    """
+    func, _, column = spec.partition(":")
+    func = func.strip().lower()
+    column = column.strip() or None
+    if func not in AGGREGATES:
+        raise QueryError(f"Unknown aggregate {func!r}; choose from {', '.join(AGGREGATES)}")
+    if column is None and func != "count":
+        raise QueryError(f"Aggregate {func!r} needs a column, e.g. '{func}:level'")
+    return Aggregate(func, column)
+
+
+@dataclass
+class Query:
+    """
+    A corpus query over one index table.
+
+    Attributes:
+        table: One of TABLE_COLUMNS.
+        where: Conditions, combined with AND.
+        group_by: Columns to group by.
+        aggregates: Aggregates to compute (per group, or over all rows).
+        order_by: Output column to sort by.
+        descending: Sort order_by in descending order.
+        limit: Maximum number of rows to return.
+    """
+    table: str
+    where: List[Condition] = field(default_factory=list)
+    group_by: List[str] = field(default_factory=list)
+    aggregates: List[Aggregate] = field(default_factory=list)
+    order_by: Optional[str] = None
+    descending: bool = False
+    limit: Optional[int] = None
+
+    def _column(self, name: str) -> str:
+        """
+        Resolve a user-facing column name to a qualified SQL column.
+        """
+        if name in TABLE_COLUMNS[self.table]:
+            return f"r.{name}"
+        if name in FILE_COLUMNS:
+            return f"f.{name}"
+        known = ", ".join(TABLE_COLUMNS[self.table] + FILE_COLUMNS)
+        raise QueryError(f"Unknown column {name!r} for table {self.table!r}; known: {known}")
+
+    def to_sql(self) -> Tuple[str, List[Union[int, str]]]:
+        """
+        Compile the query to a parameterized SQL statement.
+
+        Returns:
+            The SQL text and its parameters.
+
+        Raises:
+            QueryError: If the query refers to unknown tables, columns or operators.
+        """
+        if self.table not in TABLE_COLUMNS:
+            raise QueryError(f"Unknown table {self.table!r}; choose from {', '.join(TABLE_COLUMNS)}")
+
+        if self.table == "files":
+            source = "files f"
+        else:
+            source = f"{self.table} r JOIN files f ON f.id = r.file_id"
+
+        if self.group_by or self.aggregates:
+            select = [f"{self._column(col)} AS {col}" for col in self.group_by]
+            for agg in self.aggregates:
+                target = "*" if agg.column is None else self._column(agg.column)
+                select.append(f"{agg.func.upper()}({target}) AS {agg.alias}")
+            outputs = list(self.group_by) + [agg.alias for agg in self.aggregates]
+        else:
+            columns = TABLE_COLUMNS[self.table] + FILE_COLUMNS
+            select = [f"{self._column(col)} AS {col}" for col in columns]
+            outputs = list(columns)
+
+        sql = [f"SELECT {', '.join(select)} FROM {source}"]
+        params: List[Union[int, str]] = []
+        if self.where:
+            clauses = []
+            for cond in self.where:
+                if cond.op not in OPERATORS:
+                    raise QueryError(f"Unknown operator {cond.op!r}")
+                clauses.append(f"{self._column(cond.column)} {cond.op} ?")
+                params.append(cond.value)
+            sql.append("WHERE " + " AND ".join(clauses))
+        if self.group_by:
+            sql.append("GROUP BY " + ", ".join(self._column(col) for col in self.group_by))
+
+        if self.order_by:
+            if self.order_by not in outputs:
+                raise QueryError(f"Cannot order by {self.order_by!r}; not an output column")
+            sql.append(f"ORDER BY {self.order_by} {'DESC' if self.descending else 'ASC'}")
+        elif self.group_by:
+            sql.append("ORDER BY " + ", ".join(self.group_by))
+        if self.limit is not None:
+            sql.append("LIMIT ?")
+            params.append(self.limit)
+
+        return " ".join(sql), params
+
+
+def run_query(conn: sqlite3.Connection, query: Query) -> Tuple[List[str], Iterator[tuple]]:
+    """
+    Execute a query against an index database.
+
+    Args:
+        conn: Connection to an index database.
+        query: The query to run.
+
+    Returns:
+        The output column names and a lazy iterator over result rows.
+    """
+    sql, params = query.to_sql()
+    logger.debug("Running query: %s %s", sql, params)
+    cursor = conn.execute(sql, params)
+    columns = [desc[0] for desc in cursor.description]
+    return columns, iter(cursor)
+
+
+def write_jsonl(columns: Sequence[str], rows: Iterator[tuple], out: TextIO) -> int:
+    """
+    Stream rows as one JSON object per line.
+
+    Returns:
+        Number of rows written.
+    """
+    count = 0
+    for row in rows:
+        out.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def write_csv(columns: Sequence[str], rows: Iterator[tuple], out: TextIO) -> int:
+    """
+    Stream rows as CSV with a header line.
+
+    Returns:
+        Number of rows written.
+    """
+    writer = csv.writer(out)
+    writer.writerow(columns)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
@@ -1,9 +1,10 @@
 import io
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 
 from nier_editora.core.exceptions import UnsupportedSaveSizeError
+from nier_editora.core import metrics
 from nier_editora.core import (
     Item,
     ItemInventory,
@@ -16,8 +17,37 @@ from nier_editora.core import (
 from nier_editora.logging_config import setup_logging
 from utils import console_to_pc, pc_to_console
 
+if TYPE_CHECKING:
+    from nier_editora.core.gameworld import GameworldState
+
 logger = logging.getLogger(__name__)
 
+# File name patterns of PC and console save files
+SAVE_FILE_PATTERNS = ("SlotData_*.dat", "GameData")
+
+
+def iter_save_paths(paths: Iterable[Path]) -> Iterator[Path]:
+    """
+    Expand a mix of files and directories into individual save file paths.
+
+    Files are yielded as given; directories are searched recursively for
+    names matching SAVE_FILE_PATTERNS, in sorted order.
+
+    Args:
+        paths: Files and/or directories to expand.
+
+    Yields:
+        Paths of save files.
+    """
+    for path in paths:
+        if path.is_dir():
+            found = set()
+            for pattern in SAVE_FILE_PATTERNS:
+                found.update(p for p in path.rglob(pattern) if p.is_file())
+            yield from sorted(found)
+        else:
+            yield path
+
 
 class SaveFile:
     """
@@ -27,6 +57,9 @@ class SaveFile:
     and write changes back in the original format.
     """
 
+    # Record inventories, in file order
+    INVENTORY_FIELDS = ("inventory", "corpse_inventory", "weapons", "chips")
+
     def __init__(self) -> None:
         """
         Initialize an empty SaveFile instance.
@@ -71,12 +104,31 @@ class SaveFile:
         Returns:
             An instance of SaveFile with parsed data.
         """
-        logger.debug(f"Loading save file from {path}")
-        data = path.read_bytes()
+        logger.debug("Loading save file from %s", path)
+        with metrics.span("save.read"):
+            data = path.read_bytes()
         inst = cls()
         inst.load(data)
         return inst
 
+    @classmethod
+    async def aload(cls, path: Path, executor: str = "auto") -> "SaveFile":
+        """
+        Load a save file without blocking the event loop.
+
+        Reading runs on a thread pool and parsing on a process pool; see
+        nier_editora.core.aio.
+
+        Args:
+            path: Path to the save file.
+            executor: "auto", "process" or "thread" pool for parsing.
+
+        Returns:
+            An instance of SaveFile with parsed data.
+        """
+        from nier_editora.core import aio
+        return await aio.load(path, executor)
+
     def load(self, save_data: bytes) -> None:
         """
         Parse save data bytes into object fields.
@@ -90,78 +142,78 @@ class SaveFile:
             UnsupportedSaveSizeError: If data length is neither console nor PC size.
         """
         length = len(save_data)
-        logger.debug(f"Loading save, raw size={length}")
+        logger.debug("Loading save, raw size=%d", length)
 
         if length == constants.CONSOLE_SAVE_SIZE:
             self.is_console = True
-            logger.info("Detected console-format save; converting to PC format")
+            logger.debug("Detected console-format save; converting to PC format")
             save_data = console_to_pc(save_data)
         elif length != constants.PC_SAVE_SIZE:
-            logger.error(f"Unexpected save size: {hex(length)}")
+            logger.error("Unexpected save size: %#x", length)
             raise UnsupportedSaveSizeError(f"Unexpected save size: {hex(length)}")
 
         self._raw = save_data
+        self.__dict__.pop("_gameworld", None)
         buf = io.BytesIO(self._raw)
 
-        # Header ID
-        buf.seek(constants.OFF_HEADER_ID)
-        self.header_id = buf.read(constants.LEN_HEADER_ID)
+        with metrics.span("save.decode.header"):
+            # Header ID
+            buf.seek(constants.OFF_HEADER_ID)
+            self.header_id = buf.read(constants.LEN_HEADER_ID)
 
-        # Play time
-        buf.seek(constants.OFF_PLAYTIME)
-        self.play_time = int.from_bytes(buf.read(4), "little", signed=True)
+            # Play time
+            buf.seek(constants.OFF_PLAYTIME)
+            self.play_time = int.from_bytes(buf.read(4), "little", signed=True)
 
-        # Chapter
-        buf.seek(constants.OFF_CHAPTER)
-        self.chapter = int.from_bytes(buf.read(4), "little", signed=True)
+            # Chapter
+            buf.seek(constants.OFF_CHAPTER)
+            self.chapter = int.from_bytes(buf.read(4), "little", signed=True)
 
-        # Player name (UTF-16-LE)
-        buf.seek(constants.OFF_PLAYER_NAME)
-        raw_name = buf.read(constants.LEN_PLAYER_NAME)
-        self.player_name = raw_name.decode("utf-16-le").rstrip("\x00")
+            # Player name (UTF-16-LE)
+            buf.seek(constants.OFF_PLAYER_NAME)
+            raw_name = buf.read(constants.LEN_PLAYER_NAME)
+            self.player_name = raw_name.decode("utf-16-le").rstrip("\x00")
 
-        logger.info(
-            f"Parsed save: header_id={self.header_id!r}, player='{self.player_name}', "
-            f"play_time={self.play_time}s, chapter={self.chapter}"
+        logger.debug(
+            "Parsed save: header_id=%r, player='%s', play_time=%ds, chapter=%d",
+            self.header_id, self.player_name, self.play_time, self.chapter,
         )
 
         # Currency and XP
-        buf.seek(constants.OFF_MONEY)
-        self.money = int.from_bytes(buf.read(4), "little", signed=True)
-        buf.seek(constants.OFF_EXPERIENCE)
-        self.xp = int.from_bytes(buf.read(4), "little", signed=True)
+        with metrics.span("save.decode.money_xp"):
+            buf.seek(constants.OFF_MONEY)
+            self.money = int.from_bytes(buf.read(4), "little", signed=True)
+            buf.seek(constants.OFF_EXPERIENCE)
+            self.xp = int.from_bytes(buf.read(4), "little", signed=True)
 
         # Inventories
-        buf.seek(constants.OFF_INVENTORY)
-        items = [Item.read(buf, i) for i in range(constants.INVENTORY_ITEM_COUNT)]
-        self.inventory = ItemInventory(items)
-        logger.debug(
-            f"Loaded inventory: total={len(self.inventory.raw)}, "
-            f"active={len(self.inventory.active)}"
-        )
-
-        buf.seek(constants.OFF_CORPSE_INV)
-        corpses = [Item.read(buf, i) for i in range(constants.CORPSE_INVENTORY_ITEM_COUNT)]
-        self.corpse_inventory = ItemInventory(corpses)
-        logger.debug(
-            f"Loaded corpse inventory: total={len(self.corpse_inventory.raw)}, "
-            f"active={len(self.corpse_inventory.active)}"
-        )
-
-        buf.seek(constants.OFF_WEAPONS)
-        weapons = [Weapon.read(buf, i) for i in range(constants.INVENTORY_WEAPON_COUNT)]
-        self.weapons = WeaponInventory(weapons)
-        logger.debug(
-            f"Loaded weapons: total={len(self.weapons.raw)}, "
-            f"active={len(self.weapons.active)}"
-        )
-
-        buf.seek(constants.OFF_CHIPS)
-        chips = [Chip.read(buf, i) for i in range(constants.INVENTORY_CHIPS_COUNT)]
-        self.chips = ChipInventory(chips)
-        logger.debug(
-            f"Loaded chips: total={len(self.chips.raw)}, active={len(self.chips.active)}"
-        )
+        with metrics.span("save.decode.inventory"):
+            buf.seek(constants.OFF_INVENTORY)
+            items = [Item.read(buf, i) for i in range(constants.INVENTORY_ITEM_COUNT)]
+            self.inventory = ItemInventory(items)
+
+        with metrics.span("save.decode.corpse_inventory"):
+            buf.seek(constants.OFF_CORPSE_INV)
+            corpses = [Item.read(buf, i) for i in range(constants.CORPSE_INVENTORY_ITEM_COUNT)]
+            self.corpse_inventory = ItemInventory(corpses)
+
+        with metrics.span("save.decode.weapons"):
+            buf.seek(constants.OFF_WEAPONS)
+            weapons = [Weapon.read(buf, i) for i in range(constants.INVENTORY_WEAPON_COUNT)]
+            self.weapons = WeaponInventory(weapons)
+
+        with metrics.span("save.decode.chips"):
+            buf.seek(constants.OFF_CHIPS)
+            chips = [Chip.read(buf, i) for i in range(constants.INVENTORY_CHIPS_COUNT)]
+            self.chips = ChipInventory(chips)
+
+        # Counting active slots walks every inventory, so only do it when it is logged
+        if logger.isEnabledFor(logging.DEBUG):
+            for label, inventory in (("inventory", self.inventory),
+                                     ("corpse inventory", self.corpse_inventory),
+                                     ("weapons", self.weapons), ("chips", self.chips)):
+                logger.debug("Loaded %s: total=%d, active=%d",
+                             label, len(inventory.raw), len(inventory.active))
 
     def write(self) -> bytes:
         """
@@ -180,48 +232,59 @@ class SaveFile:
             raise ValueError("No save data to write from")
 
         logger.debug("Writing save data to bytes buffer")
-        base = bytearray(self._raw)
-        buf = io.BytesIO(base)
-
-        # Header ID
-        buf.seek(constants.OFF_HEADER_ID)
-        buf.write(self.header_id)
-
-        # Play time, chapter, name
-        buf.seek(constants.OFF_PLAYTIME)
-        buf.write(self.play_time.to_bytes(4, "little", signed=True))
-        buf.seek(constants.OFF_CHAPTER)
-        buf.write(self.chapter.to_bytes(4, "little", signed=True))
-
-        buf.seek(constants.OFF_PLAYER_NAME)
-        encoded = self.player_name.encode("utf-16-le")
-        if len(encoded) > constants.LEN_PLAYER_NAME:
-            encoded = encoded[:constants.LEN_PLAYER_NAME]
-        encoded = encoded.ljust(constants.LEN_PLAYER_NAME, b'\x00')
-        buf.write(encoded)
+        with metrics.span("save.encode.header"):
+            base = bytearray(self._raw)
+            buf = io.BytesIO(base)
+
+            # Header ID
+            buf.seek(constants.OFF_HEADER_ID)
+            buf.write(self.header_id)
+
+            # Play time, chapter, name
+            buf.seek(constants.OFF_PLAYTIME)
+            buf.write(self.play_time.to_bytes(4, "little", signed=True))
+            buf.seek(constants.OFF_CHAPTER)
+            buf.write(self.chapter.to_bytes(4, "little", signed=True))
+
+            buf.seek(constants.OFF_PLAYER_NAME)
+            encoded = self.player_name.encode("utf-16-le")
+            if len(encoded) > constants.LEN_PLAYER_NAME:
+                encoded = encoded[:constants.LEN_PLAYER_NAME]
+            encoded = encoded.ljust(constants.LEN_PLAYER_NAME, b'\x00')
+            buf.write(encoded)
 
         # Money and XP
-        buf.seek(constants.OFF_MONEY)
-        buf.write(self.money.to_bytes(4, "little", signed=True))
-        buf.seek(constants.OFF_EXPERIENCE)
-        buf.write(self.xp.to_bytes(4, "little", signed=True))
+        with metrics.span("save.encode.money_xp"):
+            buf.seek(constants.OFF_MONEY)
+            buf.write(self.money.to_bytes(4, "little", signed=True))
+            buf.seek(constants.OFF_EXPERIENCE)
+            buf.write(self.xp.to_bytes(4, "little", signed=True))
 
         # Write inventories
-        buf.seek(constants.OFF_INVENTORY)
-        self.inventory.write(buf)
-        buf.seek(constants.OFF_CORPSE_INV)
-        self.corpse_inventory.write(buf)
-        buf.seek(constants.OFF_WEAPONS)
-        self.weapons.write(buf)
-        buf.seek(constants.OFF_CHIPS)
-        self.chips.write(buf)
-
-        result = buf.getvalue()
+        with metrics.span("save.encode.inventory"):
+            buf.seek(constants.OFF_INVENTORY)
+            self.inventory.write(buf)
+        with metrics.span("save.encode.corpse_inventory"):
+            buf.seek(constants.OFF_CORPSE_INV)
+            self.corpse_inventory.write(buf)
+        with metrics.span("save.encode.weapons"):
+            buf.seek(constants.OFF_WEAPONS)
+            self.weapons.write(buf)
+        with metrics.span("save.encode.chips"):
+            buf.seek(constants.OFF_CHIPS)
+            self.chips.write(buf)
+        gameworld = self.__dict__.get("_gameworld")
+        if gameworld is not None:
+            buf.seek(constants.OFF_GAMEWORLD_STATE)
+            buf.write(gameworld.view)
+
+        with metrics.span("save.encode.finalize"):
+            result = buf.getvalue()
         if self.is_console:
-            logger.info("Converting PC data back to console format")
+            logger.debug("Converting PC data back to console format")
             result = pc_to_console(result)
 
-        logger.info(f"Write complete: output size={len(result)} bytes")
+        logger.debug("Write complete: output size=%d bytes", len(result))
         return result
 
     def save_to_file(self, path: Path) -> None:
@@ -231,9 +294,81 @@ class SaveFile:
         Args:
             path: Destination path for the save file.
         """
-        logger.debug(f"Saving save file to {path}")
-        path.write_bytes(self.write())
-        logger.info(f"Save written to {path}")
+        logger.debug("Saving save file to %s", path)
+        data = self.write()
+        with metrics.span("save.disk_write"):
+            path.write_bytes(data)
+        logger.info("Save written to %s", path)
+
+    async def asave(self, path: Path) -> None:
+        """
+        Write the save to disk without blocking the event loop.
+
+        Args:
+            path: Destination path for the save file.
+        """
+        from nier_editora.core import aio
+        await aio.save(self, path)
+
+    def copy(self) -> "SaveFile":
+        """
+        Independent copy of this save, taken now.
+
+        Same as snapshot(): inventories capture their record values at
+        call time and build records on first access, so later edits to
+        this save never reach the copy and vice versa.
+
+        Returns:
+            A SaveFile equal to this one.
+        """
+        return self.snapshot()
+
+    def snapshot(self) -> "SaveFile":
+        """
+        Copy-on-access snapshot sharing the raw buffer.
+
+        Each inventory captures the field values of its records; the
+        snapshot builds a record only when its slot is first fetched, so
+        taking a snapshot and editing a few slots costs a few record
+        objects. This save is left untouched, and neither side can see
+        edits made through the other.
+
+        Returns:
+            A SaveFile equal to this one.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(
+            (key, value) for key, value in self.__dict__.items()
+            if key not in self.INVENTORY_FIELDS and key != "_gameworld"
+        )
+        self._copy_gameworld(clone)
+        for name in self.INVENTORY_FIELDS:
+            inventory = getattr(self, name)
+            setattr(clone, name, inventory.snapshot() if inventory is not None else None)
+        return clone
+
+    @property
+    def gameworld(self) -> "GameworldState":
+        """
+        Read/write bitset view of the game world state region.
+
+        Built on first access (copying just that region), so loads that
+        never look at it do not pay for it; changes are written back by
+        write().
+        """
+        gameworld = self.__dict__.get("_gameworld")
+        if gameworld is None:
+            if not self._raw:
+                raise ValueError("No save data loaded")
+            from nier_editora.core.gameworld import GameworldState
+            gameworld = self._gameworld = GameworldState.from_raw(self._raw)
+        return gameworld
+
+    def _copy_gameworld(self, clone: "SaveFile") -> None:
+        # The view is mutable, so copies get their own bytes
+        gameworld = self.__dict__.get("_gameworld")
+        if gameworld is not None:
+            clone._gameworld = type(gameworld)(bytearray(gameworld.view), gameworld._names)
 
     def __str__(self) -> str:
         """
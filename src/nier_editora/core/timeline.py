@@ -0,0 +1,331 @@
+# src/nier_editora/core/timeline.py
+"""
+timeline.py
+
+Compact time series of one save slot across a playthrough.
+
+A timeline is an SQLite file holding the first snapshot in full (zlib
+compressed) and, for every later snapshot, only what changed since the
+previous one:
+  - a compressed byte patch of the changed 64-byte blocks, so any snapshot
+    can be rebuilt exactly;
+  - the decoded scalar fields that changed (money, XP, play time, ...);
+  - the decoded records whose bytes changed (id, active, quantity, level,
+    weight per inventory slot).
+
+The decoded deltas are indexed, so questions like "money over time" or
+"when did item N first appear" are answered by SQL alone, without
+rebuilding or decoding any snapshot.
+"""
+
+import logging
+import os
+import sqlite3
+import struct
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Set, Tuple, Union
+
+from nier_editora.core.save import SaveFile
+from nier_editora.core.watch import _SCALAR_LAYOUT, diff_raw
+from utils import console_to_pc
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 1
+
+SCALAR_FIELDS = tuple(_SCALAR_LAYOUT)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    seq      INTEGER PRIMARY KEY,
+    taken_at REAL NOT NULL,
+    source   TEXT,
+    patch    BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS scalars (
+    field TEXT NOT NULL,
+    seq   INTEGER NOT NULL REFERENCES snapshots(seq),
+    value,
+    PRIMARY KEY (field, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS records (
+    kind      TEXT NOT NULL,
+    slot      INTEGER NOT NULL,
+    seq       INTEGER NOT NULL REFERENCES snapshots(seq),
+    record_id INTEGER NOT NULL,
+    active    INTEGER NOT NULL,
+    quantity  INTEGER,
+    level     INTEGER,
+    weight    INTEGER,
+    PRIMARY KEY (kind, slot, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_records_id ON records (record_id, active, seq);
+"""
+
+# Patches cover changed blocks of this many bytes
+_BLOCK = 64
+_COARSE_BLOCK = 4096
+_RUN = struct.Struct("<IH")
+
+
+def make_patch(old: bytes, new: bytes) -> bytes:
+    """
+    Encode the blocks of `new` that differ from `old`.
+
+    Returns:
+        zlib-compressed runs of (offset, length, bytes).
+    """
+    old_view, new_view = memoryview(old), memoryview(new)
+    runs = bytearray()
+    run_start = run_end = -1
+
+    def flush() -> None:
+        if run_start >= 0:
+            runs.extend(_RUN.pack(run_start, run_end - run_start))
+            runs.extend(new_view[run_start:run_end])
+
+    for coarse in range(0, len(new), _COARSE_BLOCK):
+        coarse_end = min(coarse + _COARSE_BLOCK, len(new))
+        if old_view[coarse:coarse_end] == new_view[coarse:coarse_end]:
+            continue
+        for start in range(coarse, coarse_end, _BLOCK):
+            end = min(start + _BLOCK, len(new))
+            if old_view[start:end] == new_view[start:end]:
+                continue
+            if start == run_end and end - run_start <= 0xFFFF:
+                run_end = end
+            else:
+                flush()
+                run_start, run_end = start, end
+    flush()
+    return zlib.compress(bytes(runs))
+
+
+def apply_patch(buf: bytearray, patch: bytes) -> None:
+    """
+    Apply a patch made by make_patch in place.
+    """
+    runs = zlib.decompress(patch)
+    pos = 0
+    while pos < len(runs):
+        offset, length = _RUN.unpack_from(runs, pos)
+        pos += _RUN.size
+        buf[offset:offset + length] = runs[pos:pos + length]
+        pos += length
+
+
+def _record_row(kind: str, manager, slot: int, seq: int) -> tuple:
+    record = manager.raw[slot]
+    record_id = record.base_id if kind == "chips" else record.id
+    return (
+        kind, slot, seq, record_id, int(manager.is_slot_active(record)),
+        getattr(record, "quantity", None), getattr(record, "level", None), getattr(record, "weight", None),
+    )
+
+
+@dataclass
+class Point:
+    """
+    One value of a series.
+
+    Attributes:
+        seq: Snapshot number (0 is the first snapshot).
+        taken_at: Snapshot time, seconds since the epoch.
+        value: Value from this snapshot on.
+    """
+    seq: int
+    taken_at: float
+    value: object
+
+
+class Timeline:
+    """
+    Append-only series of snapshots of one save slot.
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """
+        Args:
+            db_path: Timeline database; created if missing.
+        """
+        self.conn = sqlite3.connect(str(db_path))
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._raw: Optional[bytes] = None
+        self._save: Optional[SaveFile] = None
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "Timeline":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def _rebuild(self, upto: Optional[int] = None) -> Tuple[int, Optional[bytes]]:
+        rows = self.conn.execute(
+            "SELECT seq, patch FROM snapshots WHERE seq <= ? ORDER BY seq",
+            (upto if upto is not None else 2 ** 62,),
+        )
+        seq, buf = -1, None
+        for seq, patch in rows:
+            if buf is None:
+                buf = bytearray(zlib.decompress(patch))
+            else:
+                apply_patch(buf, patch)
+        return seq, bytes(buf) if buf is not None else None
+
+    def snapshot(self, seq: int) -> SaveFile:
+        """
+        Rebuild snapshot `seq` exactly.
+
+        Raises:
+            KeyError: If there is no such snapshot.
+        """
+        found, raw = self._rebuild(seq)
+        if found != seq:
+            raise KeyError(f"No snapshot {seq}")
+        save = SaveFile()
+        save.load(raw)
+        return save
+
+    def record(self, source: Union[Path, SaveFile], taken_at: Optional[float] = None) -> Optional[int]:
+        """
+        Append a snapshot.
+
+        Args:
+            source: Save file path or loaded SaveFile.
+            taken_at: Snapshot time (default: the file's mtime, or now).
+
+        Returns:
+            The new snapshot number, or None if nothing changed since the
+            previous snapshot.
+        """
+        if isinstance(source, SaveFile):
+            raw, label = source.write(), None
+            if source.is_console:
+                raw = console_to_pc(raw)
+            taken_at = time.time() if taken_at is None else taken_at
+        else:
+            save = SaveFile.load_from_file(source)
+            raw, label = save._raw, str(source)
+            taken_at = os.stat(source).st_mtime if taken_at is None else taken_at
+
+        if self._save is None:
+            last_seq, last_raw = self._rebuild()
+            if last_raw is not None:
+                self._save = SaveFile()
+                self._save.load(last_raw)
+                self._raw = last_raw
+        else:
+            last_seq = self.conn.execute("SELECT MAX(seq) FROM snapshots").fetchone()[0]
+
+        with self.conn:
+            if self._raw is None:
+                seq = 0
+                self._save = SaveFile()
+                self._save.load(raw)
+                self.conn.execute("INSERT INTO snapshots VALUES (?, ?, ?, ?)",
+                                  (seq, taken_at, label, zlib.compress(raw)))
+                self.conn.executemany("INSERT INTO scalars VALUES (?, ?, ?)",
+                                      [(name, seq, getattr(self._save, name)) for name in SCALAR_FIELDS])
+                touched: Set[Tuple[str, int]] = {
+                    (kind, record.index)
+                    for kind in SaveFile.INVENTORY_FIELDS
+                    for record in getattr(self._save, kind).raw
+                    if getattr(self._save, kind).is_slot_active(record)
+                }
+            else:
+                if raw == self._raw:
+                    return None
+                seq = last_seq + 1
+                events = diff_raw(Path(label or ""), self._save, self._raw, raw)
+                self.conn.execute("INSERT INTO snapshots VALUES (?, ?, ?, ?)",
+                                  (seq, taken_at, label, make_patch(self._raw, raw)))
+                self.conn.executemany(
+                    "INSERT INTO scalars VALUES (?, ?, ?)",
+                    [(e.field, seq, e.new) for e in events if e.kind == "save"],
+                )
+                touched = {(e.kind, e.slot) for e in events if e.kind != "save"}
+            self.conn.executemany(
+                "INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [_record_row(kind, getattr(self._save, kind), slot, seq) for kind, slot in sorted(touched)],
+            )
+        self._raw = raw
+        logger.debug("Recorded snapshot %d (%d record change(s))", seq, len(touched))
+        return seq
+
+    def series(self, field: str) -> List[Point]:
+        """
+        Values of a scalar field over time, e.g. series("money").
+
+        Only snapshots where the value changed are returned; the value holds
+        until the next point.
+
+        Raises:
+            ValueError: If field is not one of SCALAR_FIELDS.
+        """
+        if field not in SCALAR_FIELDS:
+            raise ValueError(f"Unknown field {field!r}; expected one of {', '.join(SCALAR_FIELDS)}")
+        rows = self.conn.execute(
+            "SELECT s.seq, n.taken_at, s.value FROM scalars s JOIN snapshots n ON n.seq = s.seq "
+            "WHERE s.field = ? ORDER BY s.seq", (field,),
+        )
+        return [Point(*row) for row in rows]
+
+    def first_seen(self, record_id: int,
+                   kinds: Sequence[str] = SaveFile.INVENTORY_FIELDS) -> Optional[Point]:
+        """
+        First snapshot in which a record with this id was present.
+
+        Args:
+            record_id: Item/weapon id or chip base id.
+            kinds: Inventories to search.
+
+        Returns:
+            The snapshot (value: the inventory kind), or None if never seen.
+        """
+        placeholders = ",".join("?" * len(kinds))
+        row = self.conn.execute(
+            f"SELECT r.seq, n.taken_at, r.kind FROM records r JOIN snapshots n ON n.seq = r.seq "
+            f"WHERE r.record_id = ? AND r.active = 1 AND r.kind IN ({placeholders}) "
+            f"ORDER BY r.seq LIMIT 1",
+            (record_id, *kinds),
+        ).fetchone()
+        return Point(*row) if row else None
+
+    def record_history(self, kind: str, slot: int) -> List[Point]:
+        """
+        States of one inventory slot over time.
+
+        Returns:
+            Points whose value is a dict of record_id, active, quantity,
+            level and weight.
+        """
+        rows = self.conn.execute(
+            "SELECT r.seq, n.taken_at, r.record_id, r.active, r.quantity, r.level, r.weight "
+            "FROM records r JOIN snapshots n ON n.seq = r.seq "
+            "WHERE r.kind = ? AND r.slot = ? ORDER BY r.seq", (kind, slot),
+        )
+        return [
+            Point(seq, taken_at, {"record_id": rid, "active": bool(active), "quantity": qty,
+                                  "level": level, "weight": weight})
+            for seq, taken_at, rid, active, qty, level, weight in rows
+        ]
+
+    def storage(self) -> dict:
+        """
+        Snapshot count and bytes stored, for comparison with full copies.
+        """
+        count, patch_bytes = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(patch)), 0) FROM snapshots").fetchone()
+        return {"snapshots": count, "patch_bytes": patch_bytes}
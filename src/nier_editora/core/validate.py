@@ -0,0 +1,283 @@
+# src/nier_editora/core/validate.py
+"""
+validate.py
+
+Region-level sanity checks for save files.
+
+Checks run directly over the raw PC-layout buffer: each inventory region is
+decoded once into an int32 array and its fields are inspected as strided
+columns with set operations, so no Item/Weapon/Chip objects are built and
+individual slots are only visited when a region is known to be bad.
+"""
+
+import logging
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from nier_editora.core import constants
+from nier_editora.core.enums import ItemStatus
+from nier_editora.core.save import iter_save_paths
+from utils import console_to_pc
+
+logger = logging.getLogger(__name__)
+
+_VALID_IDS = frozenset(constants.ITEM_LIST)
+_STATUS_VALUES = frozenset(status.value for status in ItemStatus)
+_EMPTY_ID = -1
+
+# Below this many files the cost of spawning workers outweighs the gain
+_MIN_PARALLEL_FILES = 4
+
+
+@dataclass(frozen=True)
+class Issue:
+    """
+    A single problem found in a save file.
+
+    Attributes:
+        region: Name of the region the problem was found in.
+        code: Short machine-readable problem identifier.
+        message: Human-readable description.
+        slot: Slot index within the region, if applicable.
+        offset: Absolute offset in the PC layout, if applicable.
+        severity: "error" for corruption, "warning" for suspicious values.
+    """
+    region: str
+    code: str
+    message: str
+    slot: Optional[int] = None
+    offset: Optional[int] = None
+    severity: str = "error"
+
+    def __str__(self) -> str:
+        where = self.region if self.slot is None else f"{self.region}[{self.slot}]"
+        return f"{self.severity}: {where}: {self.message}"
+
+
+@dataclass
+class ValidationReport:
+    """
+    Result of validating a single save file.
+
+    Attributes:
+        path: Path of the validated file, if it came from disk.
+        size: Size of the input in bytes.
+        is_console: Whether the input was in console format.
+        issues: Problems found, in region order.
+    """
+    path: Optional[str] = None
+    size: int = 0
+    is_console: bool = False
+    issues: List[Issue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if no error-level issue was found."""
+        return not any(issue.severity == "error" for issue in self.issues)
+
+    def to_dict(self) -> dict:
+        """
+        Convert the report to a JSON-serializable dict.
+        """
+        data = asdict(self)
+        data["ok"] = self.ok
+        return data
+
+
+def _int32_array(data: bytes, offset: int, length: int) -> array:
+    """
+    Decode a little-endian int32 region of the buffer in one go.
+    """
+    ints = array("i")
+    ints.frombytes(data[offset:offset + length])
+    if sys.byteorder != "little":
+        ints.byteswap()
+    return ints
+
+
+def _check_items(data: bytes, region: str, offset: int, count: int,
+                 issues: List[Issue]) -> None:
+    width = constants.ITEM_SIZE // 4
+    ints = _int32_array(data, offset, count * constants.ITEM_SIZE)
+    ids, statuses, quantities = ints[0::width], ints[1::width], ints[2::width]
+
+    if (
+        set(ids) - _VALID_IDS - {_EMPTY_ID}
+        or set(statuses) - _STATUS_VALUES
+        or min(quantities) < 0
+        or max(quantities) > constants.MAX_ITEM_QUANTITY
+    ):
+        for slot, (id_, status, qty) in enumerate(zip(ids, statuses, quantities)):
+            where = dict(region=region, slot=slot, offset=offset + slot * constants.ITEM_SIZE)
+            if id_ != _EMPTY_ID and id_ not in _VALID_IDS:
+                issues.append(Issue(code="unknown_id", message=f"unknown item id {id_}", **where))
+            if status not in _STATUS_VALUES:
+                issues.append(Issue(code="bad_status", message=f"unknown status {status:#x}", **where))
+            if not 0 <= qty <= constants.MAX_ITEM_QUANTITY:
+                issues.append(Issue(
+                    code="bad_quantity", severity="warning",
+                    message=f"quantity {qty} outside 0..{constants.MAX_ITEM_QUANTITY}", **where,
+                ))
+
+    active = ItemStatus.ACTIVE.value
+    if any((id_ != _EMPTY_ID) != (status == active) for id_, status in zip(ids, statuses)):
+        for slot, (id_, status) in enumerate(zip(ids, statuses)):
+            if (id_ != _EMPTY_ID) != (status == active) and status in _STATUS_VALUES:
+                issues.append(Issue(
+                    region=region, slot=slot, offset=offset + slot * constants.ITEM_SIZE,
+                    code="status_mismatch", severity="warning",
+                    message=f"item id {id_} with status {ItemStatus(status)}",
+                ))
+
+
+def _check_weapons(data: bytes, issues: List[Issue]) -> None:
+    region, offset = "weapons", constants.OFF_WEAPONS
+    width = constants.WEAPON_SIZE // 4
+    ints = _int32_array(data, offset, constants.INVENTORY_WEAPON_COUNT * constants.WEAPON_SIZE)
+    ids, levels = ints[0::width], ints[1::width]
+
+    active_levels = {lvl for id_, lvl in zip(ids, levels) if id_ != _EMPTY_ID}
+    if (
+        set(ids) - _VALID_IDS - {_EMPTY_ID}
+        or (active_levels and (min(active_levels) < constants.MIN_WEAPON_LEVEL
+                               or max(active_levels) > constants.MAX_WEAPON_LEVEL))
+    ):
+        for slot, (id_, level) in enumerate(zip(ids, levels)):
+            if id_ == _EMPTY_ID:
+                continue
+            where = dict(region=region, slot=slot, offset=offset + slot * constants.WEAPON_SIZE)
+            if id_ not in _VALID_IDS:
+                issues.append(Issue(code="unknown_id", message=f"unknown weapon id {id_}", **where))
+            if not constants.MIN_WEAPON_LEVEL <= level <= constants.MAX_WEAPON_LEVEL:
+                issues.append(Issue(
+                    code="bad_level", severity="warning",
+                    message=(f"level {level} outside "
+                             f"{constants.MIN_WEAPON_LEVEL}..{constants.MAX_WEAPON_LEVEL}"),
+                    **where,
+                ))
+
+
+def _check_chips(data: bytes, issues: List[Issue]) -> None:
+    region, offset = "chips", constants.OFF_CHIPS
+    width = constants.CHIP_SIZE // 4
+    ints = _int32_array(data, offset, constants.INVENTORY_CHIPS_COUNT * constants.CHIP_SIZE)
+    base_ids = ints[1::width]
+
+    if set(base_ids) - _VALID_IDS - {_EMPTY_ID}:
+        for slot, base_id in enumerate(base_ids):
+            if base_id != _EMPTY_ID and base_id not in _VALID_IDS:
+                issues.append(Issue(
+                    region=region, slot=slot, offset=offset + slot * constants.CHIP_SIZE,
+                    code="unknown_id", message=f"unknown chip id {base_id}",
+                ))
+
+    # The trailing padding words must match CHIP_PADDING in every slot
+    pad_start = constants.CHIP_SIZE_WITHOUT_PADDING // 4
+    padding = array("i", constants.CHIP_PADDING)
+    if sys.byteorder != "little":
+        padding.byteswap()
+    bad_slots = set()
+    for col, expected in enumerate(padding, start=pad_start):
+        column = ints[col::width]
+        if column.count(expected) != len(column):
+            bad_slots.update(slot for slot, value in enumerate(column) if value != expected)
+    for slot in sorted(bad_slots):
+        issues.append(Issue(
+            region=region, slot=slot,
+            offset=offset + slot * constants.CHIP_SIZE + constants.CHIP_SIZE_WITHOUT_PADDING,
+            code="bad_padding", message="chip padding bytes do not match CHIP_PADDING",
+        ))
+
+
+def _check_duplication(data: bytes, issues: List[Issue]) -> None:
+    start = constants.DUPLICATION_OFFSET
+    length = constants.DUPLICATION_LENGTH
+    if data[start:start + length] != data[start + length:start + 2 * length]:
+        issues.append(Issue(
+            region="duplication", offset=start, code="broken_duplication",
+            message=f"{length}-byte block at {start:#x} is not duplicated",
+        ))
+
+
+def validate_bytes(data: bytes, path: Optional[str] = None) -> ValidationReport:
+    """
+    Run all region checks over a raw save buffer.
+
+    Args:
+        data: Raw bytes of a PC or console save.
+        path: Optional source path to record in the report.
+
+    Returns:
+        A ValidationReport listing every issue found.
+    """
+    report = ValidationReport(path=path, size=len(data))
+    issues = report.issues
+
+    if report.size == constants.CONSOLE_SAVE_SIZE:
+        report.is_console = True
+        data = console_to_pc(data)
+    elif report.size != constants.PC_SAVE_SIZE:
+        issues.append(Issue(
+            region="file", code="bad_size", message=f"unexpected save size {report.size:#x}",
+        ))
+        return report
+
+    _check_items(data, "inventory", constants.OFF_INVENTORY,
+                 constants.INVENTORY_ITEM_COUNT, issues)
+    _check_items(data, "corpse_inventory", constants.OFF_CORPSE_INV,
+                 constants.CORPSE_INVENTORY_ITEM_COUNT, issues)
+    _check_weapons(data, issues)
+    _check_chips(data, issues)
+    # Console saves get their duplicated block rebuilt by console_to_pc
+    if not report.is_console:
+        _check_duplication(data, issues)
+
+    logger.debug("Validated %s: %d issue(s)", path or "<buffer>", len(issues))
+    return report
+
+
+def validate_file(path: Path) -> ValidationReport:
+    """
+    Validate a single save file on disk.
+
+    Args:
+        path: Path to the save file.
+
+    Returns:
+        A ValidationReport; unreadable files are reported rather than raised.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        report = ValidationReport(path=str(path))
+        report.issues.append(Issue(region="file", code="io_error", message=str(e)))
+        return report
+    return validate_bytes(data, path=str(path))
+
+
+def validate_paths(paths: Iterable[Path], jobs: Optional[int] = None) -> Iterator[ValidationReport]:
+    """
+    Validate save files and directories, spreading the work over processes.
+
+    Args:
+        paths: Files and/or directories; directories are searched recursively.
+        jobs: Number of worker processes (default: CPU count; 1 disables the pool).
+
+    Yields:
+        One ValidationReport per save file, in input order.
+    """
+    files: Sequence[Path] = list(iter_save_paths(paths))
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(files) < _MIN_PARALLEL_FILES:
+        yield from map(validate_file, files)
+        return
+
+    chunksize = max(1, len(files) // (jobs * 4))
+    logger.debug("Validating %d files with %d workers", len(files), jobs)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(validate_file, files, chunksize=chunksize)
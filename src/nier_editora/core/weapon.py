@@ -2,12 +2,19 @@ import io
 import logging
 import struct
 from dataclasses import dataclass
-from typing import ClassVar, Optional
-
-from nier_editora.core.constants import WEAPON_SIZE, ITEM_LIST, INVENTORY_WEAPON_COUNT
+from typing import ClassVar, Iterable, Optional
+
+from nier_editora.core.constants import (
+    WEAPON_SIZE,
+    ITEM_LIST,
+    WEAPON_PREFIXES,
+    INVENTORY_WEAPON_COUNT,
+    MIN_WEAPON_LEVEL,
+    MAX_WEAPON_LEVEL,
+)
 from nier_editora.core.exceptions import SerializationError
 from nier_editora.core.i18n import translate_item
-from nier_editora.core.inventory import SlotManager
+from nier_editora.core.inventory import ChangeSummary, SlotManager, check_ids
 
 logger = logging.getLogger(__name__)
 
@@ -67,7 +74,7 @@ class Weapon:
         """
         raw = stream.read(WEAPON_SIZE)
         if len(raw) != WEAPON_SIZE:
-            logger.error(f"Expected {WEAPON_SIZE} bytes for weapon data, got {len(raw)}")
+            logger.error("Expected %d bytes for weapon data, got %d", WEAPON_SIZE, len(raw))
             raise SerializationError(f"Expected {WEAPON_SIZE} bytes, got {len(raw)}")
 
         values = cls._STRUCT.unpack(raw)
@@ -154,3 +161,64 @@ class WeaponInventory(SlotManager[Weapon]):
         active = slot.id != -1
         # logger.debug(f"Slot index={slot.index} active={active}")
         return active
+
+    def add_many(self, ids: Iterable[int], level: int = MIN_WEAPON_LEVEL) -> ChangeSummary:
+        """
+        Add each weapon id to the lowest free slots in one pass.
+
+        Args:
+            ids: Weapon ids to add.
+            level: Level of the added weapons.
+
+        Returns:
+            Summary of added slots; ids already owned or that did not fit
+            are listed as skipped.
+
+        Raises:
+            ValueError: If level is outside MIN_WEAPON_LEVEL..MAX_WEAPON_LEVEL
+                or an id is not a weapon id; nothing is added then.
+        """
+        _check_level(level)
+        ids = check_ids(ids, WEAPON_PREFIXES, "weapon")
+        summary = ChangeSummary()
+        owned = set()
+        free = []
+        for idx, slot in enumerate(self.peek()):
+            if self.is_slot_active(slot):
+                owned.add(slot.id)
+            else:
+                free.append(idx)
+        free.reverse()  # pop() hands out the lowest slot first
+
+        for weapon_id in ids:
+            if weapon_id in owned or not free:
+                summary.skipped.append(weapon_id)
+                continue
+            idx = free.pop()
+            weapon = Weapon.empty(idx)
+            weapon.id = weapon_id
+            weapon.level = level
+            self._slots[idx] = weapon
+            owned.add(weapon_id)
+            summary.added.append(idx)
+
+        logger.debug("add_many: %s", summary)
+        return summary
+
+    def upgrade_all_weapons(self, level: int = MAX_WEAPON_LEVEL) -> ChangeSummary:
+        """
+        Raise every active weapon below `level` to `level`.
+
+        Returns:
+            Summary listing the upgraded slots.
+
+        Raises:
+            ValueError: If level is outside MIN_WEAPON_LEVEL..MAX_WEAPON_LEVEL.
+        """
+        _check_level(level)
+        return self._update_where(lambda weapon: weapon.level < level, level=level)
+
+
+def _check_level(level: int) -> None:
+    if not MIN_WEAPON_LEVEL <= level <= MAX_WEAPON_LEVEL:
+        raise ValueError(f"Weapon level must be {MIN_WEAPON_LEVEL}..{MAX_WEAPON_LEVEL}, got {level}")
@@ -7,9 +7,14 @@ from tkinter import ttk, filedialog, messagebox, simpledialog
 from typing import Optional, Union
 
 from nier_editora.core import Item, Weapon, Chip
+from nier_editora.core.cache import load_cached
 from nier_editora.core.constants import ITEM_LIST
+from nier_editora.core.history import Batch, History, SetField, SetRecord
 from nier_editora.core.i18n import translate_item
+from nier_editora.core.item import ItemStatus
+from nier_editora.core.normalize import normalize_save
 from nier_editora.core.save import SaveFile
+from nier_editora.core.validate import validate_file
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,7 @@ class NierEditoraGUI(tk.Tk):
         self.savefile: Optional[SaveFile] = None
         self.file_path: Optional[Path] = None
         self._has_unsaved: bool = False
+        self.history = History(on_change=self._on_history_change)
 
         # Tk variables
         self.playtime_var   = tk.StringVar()
@@ -70,6 +76,15 @@ class NierEditoraGUI(tk.Tk):
         file_menu.add_command(label="Exit",       command=self.destroy)
         menubar.add_cascade(label="File", menu=file_menu)
 
+        # Edit menu
+        edit_menu = tk.Menu(menubar, tearoff=False)
+        edit_menu.add_command(label="Undo", command=self.undo, accelerator="Ctrl+Z", state="disabled")
+        edit_menu.add_command(label="Redo", command=self.redo, accelerator="Ctrl+Y", state="disabled")
+        menubar.add_cascade(label="Edit", menu=edit_menu)
+        self.bind_all("<Control-z>", lambda e: self.undo())
+        self.bind_all("<Control-y>", lambda e: self.redo())
+        self.bind_all("<Control-Z>", lambda e: self.redo())
+
         # Tools menu
         tools_menu = tk.Menu(menubar, tearoff=False)
         tools_menu.add_command(label="Validate Save", command=self._validate_save, state="disabled")
@@ -79,6 +94,11 @@ class NierEditoraGUI(tk.Tk):
         tools_menu.add_separator()
         tools_menu.add_command(label="Export as PC Save...", command=self._export_pc, state="disabled")
         tools_menu.add_command(label="Export as Console Save...", command=self._export_console, state="disabled")
+        tools_menu.add_separator()
+        normalize_menu = tk.Menu(tools_menu, tearoff=False)
+        for sort, label in (("id", "By ID"), ("category", "By Category"), ("name", "By Name")):
+            normalize_menu.add_command(label=label, command=lambda sort=sort: self._normalize_inventories(sort))
+        tools_menu.add_cascade(label="Normalize Inventories", menu=normalize_menu, state="disabled")
         menubar.add_cascade(label="Tools", menu=tools_menu)
 
         # Help menu
@@ -88,6 +108,7 @@ class NierEditoraGUI(tk.Tk):
 
         self.config(menu=menubar)
         self._file_menu = file_menu
+        self._edit_menu = edit_menu
         self._tools_menu = tools_menu
 
         # Player Name
@@ -169,6 +190,11 @@ class NierEditoraGUI(tk.Tk):
         self.entry_playtime.bind("<KeyRelease>", lambda e: self._mark_dirty())
         self.entry_xp.bind("<KeyRelease>", lambda e: self._mark_dirty())
 
+        # Journal field edits when the user leaves or confirms a field
+        for entry in (self.entry_name, self.entry_money, self.entry_playtime, self.entry_xp):
+            entry.bind("<FocusOut>", lambda e: self._commit_fields(), add=True)
+            entry.bind("<Return>", lambda e: self._commit_fields(), add=True)
+
     def _make_tree(self, parent, cols):
         tree = ttk.Treeview(parent, columns=tuple(c[0] for c in cols), show="headings", height=8)
         for i, (col, heading, width) in enumerate(cols, start=1):
@@ -202,7 +228,7 @@ class NierEditoraGUI(tk.Tk):
             self.file_path = path
 
         try:
-            self.savefile = SaveFile.load_from_file(self.file_path)
+            self.savefile = load_cached(self.file_path)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load save:\n{e}")
             return
@@ -222,6 +248,8 @@ class NierEditoraGUI(tk.Tk):
         self._populate_items()
         self._populate_weapons()
         self._populate_chips()
+        self.history.reset(self.savefile)
+        self._update_undo_menu()
 
         # Enable editing & saving
         for w in (
@@ -235,7 +263,8 @@ class NierEditoraGUI(tk.Tk):
                                  "Backup Current Save...": "normal",
                                  "Restore Last Backup": "normal",
                                  "Export as PC Save...": "normal",
-                                 "Export as Console Save...": "normal"
+                                 "Export as Console Save...": "normal",
+                                 "Normalize Inventories": "normal",
                              })
 
         self._has_unsaved = False
@@ -278,12 +307,14 @@ class NierEditoraGUI(tk.Tk):
 
     # Tool menu actions
     def _validate_save(self):
-        try:
-            raw = self.file_path.read_bytes()
-            SaveFile().load(raw)
+        report = validate_file(self.file_path)
+        details = "\n".join(str(issue) for issue in report.issues[:20])
+        if report.ok and not report.issues:
             messagebox.showinfo("Validate", "Save file is valid.")
-        except Exception as e:
-            messagebox.showerror("Validate Error", f"Validation failed:\n{e}")
+        elif report.ok:
+            messagebox.showwarning("Validate", f"Save file is valid, with warnings:\n{details}")
+        else:
+            messagebox.showerror("Validate Error", f"Validation failed:\n{details}")
 
     def _backup_save(self):
         dst = self.file_path.with_suffix(self.file_path.suffix + f".{int(time.time())}.bak")
@@ -327,6 +358,18 @@ class NierEditoraGUI(tk.Tk):
             logger.exception("Export failed")
             messagebox.showerror("Export Error", str(e))
 
+    def _normalize_inventories(self, sort: str) -> None:
+        if not self.savefile:
+            return
+        edited = self.savefile.snapshot()
+        results = normalize_save(edited, sort=sort)
+        batch = Batch.from_snapshot(self.savefile, edited, SaveFile.INVENTORY_FIELDS,
+                                    f"Normalize inventories by {sort}")
+        if self.history.push(batch, coalesce=False):
+            self._mark_dirty()
+        merged = sum(result.merged for result in results)
+        self.status.config(text=f"Normalized: {len(batch.commands)} slot(s) rewritten, {merged} stack(s) merged")
+
     def _export_pc(self): self._export(to_console=False)
 
     def _export_console(self): self._export(to_console=True)
@@ -381,9 +424,8 @@ class NierEditoraGUI(tk.Tk):
         if new_qty is None or new_qty == item.quantity:
             return
 
-        self.savefile.inventory.raw[index].quantity = new_qty
-        self.tree_items.item(row_id, values=(item.index, item.name, new_qty))
-
+        self.history.push(SetRecord.edit(self.savefile, "inventory", index, f"Edit {item.name} quantity",
+                                         quantity=new_qty))
         self._mark_dirty()
 
     def _on_weapon_double_click(self, event):
@@ -405,9 +447,8 @@ class NierEditoraGUI(tk.Tk):
         if new_lvl is None or new_lvl == weapon.level:
             return
 
-        self.savefile.weapons.raw[index].level = new_lvl
-        self.tree_weapons.item(row_id, values=(weapon.index, weapon.name, new_lvl))
-
+        self.history.push(SetRecord.edit(self.savefile, "weapons", index, f"Edit {weapon.name} level",
+                                         level=new_lvl))
         self._mark_dirty()
 
     def _on_chip_double_click(self, event):
@@ -429,9 +470,8 @@ class NierEditoraGUI(tk.Tk):
         if new_wgt is None or new_wgt == chip.weight:
             return
 
-        self.savefile.chips.raw[index].weight = new_wgt
-        self.tree_chips.item(row_id, values=(chip.index, chip.name, chip.level, new_wgt))
-
+        self.history.push(SetRecord.edit(self.savefile, "chips", index, f"Edit {chip.name} weight",
+                                         weight=new_wgt))
         self._mark_dirty()
 
     def _on_add_click(self):
@@ -581,11 +621,12 @@ class NierEditoraGUI(tk.Tk):
 
         new_slot = Item.empty(idx)
         new_slot.id = new_id
+        new_slot.status = ItemStatus.ACTIVE
         new_slot.quantity = 1
-        self.savefile.inventory.raw[idx] = new_slot
+        self.history.push(SetRecord.replace(self.savefile, "inventory", new_slot, f"Add {new_slot.name}"),
+                          coalesce=False)
 
-        self.status.config(text=f"Added {self.savefile.inventory.raw[idx].name} at slot {idx}")
-        self._populate_items()
+        self.status.config(text=f"Added {new_slot.name} at slot {idx}")
         self._mark_dirty()
 
     def _remove_item(self):
@@ -600,10 +641,8 @@ class NierEditoraGUI(tk.Tk):
         idx = int(sel[0])
 
         # Replace with an empty slot
-        self.savefile.inventory.raw[idx] = Item.empty(idx)
-
-        # Refresh & mark dirty
-        self._populate_items()
+        self.history.push(SetRecord.replace(self.savefile, "inventory", Item.empty(idx),
+                                            f"Remove {self.savefile.inventory.raw[idx].name}"), coalesce=False)
         self._mark_dirty()
 
     def _add_weapon(self):
@@ -624,10 +663,10 @@ class NierEditoraGUI(tk.Tk):
 
         new_slot = Weapon.empty(idx)
         new_slot.id = new_id
-        self.savefile.weapons.raw[idx] = new_slot
+        self.history.push(SetRecord.replace(self.savefile, "weapons", new_slot, f"Add {new_slot.name}"),
+                          coalesce=False)
 
-        self.status.config(text=f"Added {self.savefile.inventory.raw[idx].name} at slot {idx}")
-        self._populate_items()
+        self.status.config(text=f"Added {new_slot.name} at slot {idx}")
         self._mark_dirty()
 
     def _remove_weapon(self):
@@ -642,10 +681,8 @@ class NierEditoraGUI(tk.Tk):
         idx = int(sel[0])
 
         # Replace with an empty slot
-        self.savefile.weapons.raw[idx] = Weapon.empty(idx)
-
-        # Refresh & mark dirty
-        self._populate_items()
+        self.history.push(SetRecord.replace(self.savefile, "weapons", Weapon.empty(idx),
+                                            f"Remove {self.savefile.weapons.raw[idx].name}"), coalesce=False)
         self._mark_dirty()
 
     def _add_chip(self):
@@ -665,10 +702,8 @@ class NierEditoraGUI(tk.Tk):
         idx = int(sel[0])
 
         # Replace with an empty slot
-        self.savefile.chips.raw[idx] = Chip.empty(idx)
-
-        # Refresh & mark dirty
-        self._populate_items()
+        self.history.push(SetRecord.replace(self.savefile, "chips", Chip.empty(idx),
+                                            f"Remove {self.savefile.chips.raw[idx].name}"), coalesce=False)
         self._mark_dirty()
 
     def _mark_dirty(self):
@@ -679,28 +714,112 @@ class NierEditoraGUI(tk.Tk):
         if not self.savefile:
             return
 
-        self.savefile.player_name = self.player_name_var.get()
-        self.savefile.money = self.money_var.get()
-        self.savefile.xp = self.xp_var.get()
+        self._commit_fields()
+
+        # Disable saving until next change
+        self._file_menu.entryconfig("Save", state="disabled")
+        self._file_menu.entryconfig("Save As...", state="disabled")
+
+        self.status.config(text="Unsaved changes")
+
+    def _commit_fields(self) -> None:
+        """
+        Journal the entry fields that differ from the save.
+        """
+        if not self.savefile:
+            return
+
+        values = {"player_name": self.player_name_var.get()}
+        for name, var in (("money", self.money_var), ("xp", self.xp_var)):
+            try:
+                values[name] = var.get()
+            except tk.TclError:
+                pass  # empty entry; keep the current value
 
         # parse playtime HH:MM:SS → seconds
         try:
             pt = self.playtime_var.get().split(":")
             h, m, s = map(int, pt)
-            total_seconds = h * 3600 + m * 60 + s
-            self.savefile.play_time = total_seconds
+            values["play_time"] = h * 3600 + m * 60 + s
         except ValueError:
             messagebox.showwarning("Invalid Time", "Playtime must be in HH:MM:SS format")
-            total = self.savefile.play_time
-            h, rem = divmod(total, 3600)
+            self._show_field("play_time")
+
+        for name, value in values.items():
+            self.history.push(SetField(name, getattr(self.savefile, name), value))
+
+    # Undo/redo
+    def undo(self) -> None:
+        if not self.savefile:
+            return
+        self._commit_fields()
+        command = self.history.undo()
+        if command:
+            self._mark_dirty()
+            self.status.config(text=f"Undid {command.label}")
+
+    def redo(self) -> None:
+        if not self.savefile:
+            return
+        command = self.history.redo()
+        if command:
+            self._mark_dirty()
+            self.status.config(text=f"Redid {command.label}")
+
+    def _on_history_change(self, command) -> None:
+        for command in command.commands if isinstance(command, Batch) else [command]:
+            if isinstance(command, SetField):
+                self._show_field(command.name)
+            else:
+                self._refresh_row(command.kind, command.slot)
+        self._update_undo_menu()
+
+    def _show_field(self, name: str) -> None:
+        if name == "player_name":
+            self.player_name_var.set(self.savefile.player_name)
+        elif name == "money":
+            self.money_var.set(self.savefile.money)
+        elif name == "xp":
+            self.xp_var.set(self.savefile.xp)
+        elif name == "play_time":
+            h, rem = divmod(self.savefile.play_time, 3600)
             m, s = divmod(rem, 60)
             self.playtime_var.set(f"{h:02d}:{m:02d}:{s:02d}")
 
-        # Disable saving until next change
-        self._file_menu.entryconfig("Save", state="disabled")
-        self._file_menu.entryconfig("Save As...", state="disabled")
+    def _refresh_row(self, kind: str, slot: int) -> None:
+        """
+        Update, insert or delete the one tree row showing an inventory slot.
+        """
+        trees = {"inventory": self.tree_items, "weapons": self.tree_weapons, "chips": self.tree_chips}
+        if kind not in trees:
+            return
+        tree, iid = trees[kind], str(slot)
+        manager = getattr(self.savefile, kind)
+        record = manager.raw[slot]
 
-        self.status.config(text="Unsaved changes")
+        if not manager.is_slot_active(record):
+            if tree.exists(iid):
+                tree.delete(iid)
+            return
+
+        if kind == "inventory":
+            values = (record.index, record.name, record.quantity)
+        elif kind == "weapons":
+            values = (record.index, record.name, record.level)
+        else:
+            values = (record.index, record.name, record.level, record.weight)
+        if tree.exists(iid):
+            tree.item(iid, values=values)
+        else:
+            position = sum(1 for other in tree.get_children() if int(other) < slot)
+            tree.insert("", position, iid=iid, values=values)
+
+    def _update_undo_menu(self) -> None:
+        undo, redo = self.history.undo_label, self.history.redo_label
+        self._edit_menu.entryconfig(0, label=f"Undo {undo}" if undo else "Undo",
+                                    state="normal" if undo else "disabled")
+        self._edit_menu.entryconfig(1, label=f"Redo {redo}" if redo else "Redo",
+                                    state="normal" if redo else "disabled")
 
     @staticmethod
     def _set_menu_state(menu: tk.Menu, **items: str) -> None:
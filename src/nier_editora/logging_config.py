@@ -1,12 +1,84 @@
+import atexit
+import logging
+import os
+import queue
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Iterable, Optional
 
+# Listener draining the log queue; None until setup_logging() has run
+_listener: Optional[QueueListener] = None
 
-def setup_logging(level: str = "INFO") -> None:
+
+def parse_module_levels(specs: Iterable[str]) -> Dict[str, str]:
+    """
+    Parse per-module level overrides of the form "MODULE=LEVEL".
+
+    Several overrides may be given comma-separated in one spec, e.g.
+    "nier_editora.core.save=DEBUG,utils=WARNING".
+
+    Args:
+        specs: Override specs.
+
+    Returns:
+        Logger name → upper-case level name.
+
+    Raises:
+        ValueError: If a spec is malformed or names an unknown level.
+    """
+    levels = {}
+    for spec in specs:
+        for part in filter(None, (p.strip() for p in spec.split(","))):
+            name, sep, level = part.partition("=")
+            level = level.strip().upper()
+            if not sep or not name.strip() or not isinstance(logging.getLevelName(level), int):
+                raise ValueError(f"Invalid log level override {part!r} (expected MODULE=LEVEL)")
+            levels[name.strip()] = level
+    return levels
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def _after_fork_in_child() -> None:
+    # The listener thread does not survive fork(): let forked workers write
+    # straight to the console handlers instead of into a queue nobody drains.
+    global _listener
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, QueueHandler):
+            root.removeHandler(handler)
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def setup_logging(level: str = "INFO", module_levels: Optional[Dict[str, str]] = None) -> None:
     """
     Configure the root logger for the application.
 
+    Records are put on an in-memory queue by a QueueHandler and written to
+    stderr by a QueueListener thread, so logging callers never block on the
+    stream. The message itself (msg % args, plus any traceback) is still
+    rendered in the caller's thread by QueueHandler.prepare, which keeps
+    mutable arguments from changing before the record is written; only the
+    final line formatting and the I/O happen on the listener. Records below
+    a logger's level are dropped before any formatting happens.
+
     Args:
         level: Logging level (e.g., "DEBUG", "INFO", "WARNING").
+        module_levels: Logger name → level overrides, e.g.
+            {"nier_editora.core.save": "DEBUG"}.
     """
     config = {
         "version": 1,
@@ -20,13 +92,31 @@ def setup_logging(level: str = "INFO") -> None:
             "console": {
                 "class": "logging.StreamHandler",
                 "formatter": "standard",
-                "level": level,
-                "stream": "ext://sys.stdout"
+                "stream": "ext://sys.stderr"
             }
         },
         "root": {
             "handlers": ["console"],
             "level": level,
         },
+        "loggers": {
+            name: {"level": module_level}
+            for name, module_level in (module_levels or {}).items()
+        },
     }
+    _stop_listener()
     dictConfig(config)
+
+    # Move the configured handlers behind a queue
+    global _listener
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    for handler in handlers:
+        root.removeHandler(handler)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+atexit.register(_stop_listener)
@@ -1,11 +1,10 @@
 import sys
-import logging
 from PySide6.QtWidgets import QApplication
+from nier_editora.logging_config import setup_logging
 from nier_editora.ui.main_window import NierEditoraUI
 
 def main():
-    logging.basicConfig(level=logging.DEBUG,
-                        format="%(asctime)s [%(levelname)s] %(message)s")
+    setup_logging(level="INFO")
 
     app = QApplication(sys.argv)
 
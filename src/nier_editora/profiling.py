@@ -0,0 +1,119 @@
+# src/nier_editora/profiling.py
+"""
+profiling.py
+
+cProfile support for the CLI's --profile option.
+
+A profiled run writes two files next to each other:
+  - <out>.pstats: raw cProfile statistics, loadable with pstats/snakeviz.
+  - <out>.collapsed: folded stacks ("a;b;c <µs>" per line), the input
+    format of flamegraph.pl, speedscope and inferno.
+
+cProfile only records caller/callee pairs, not full stacks, so the folded
+stacks are rebuilt by walking the call graph from its roots and splitting
+each function's time across its callers in proportion to the time each
+caller accounted for.
+"""
+
+import cProfile
+import logging
+import os
+import pstats
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+Func = Tuple[str, int, str]
+
+# Deeper stacks than this are folded into their ancestor
+_MAX_DEPTH = 128
+
+
+def _frame_name(func: Func) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        return name
+    return f"{name} ({os.path.basename(filename)}:{lineno})".replace(";", ",")
+
+
+def write_collapsed(stats: pstats.Stats, path: Path) -> int:
+    """
+    Write folded stacks reconstructed from cProfile statistics.
+
+    Args:
+        stats: Loaded profile statistics.
+        path: Destination file.
+
+    Returns:
+        Number of stack lines written.
+    """
+    raw: Dict[Func, tuple] = stats.stats  # func -> (cc, nc, tt, ct, callers)
+    callees: Dict[Func, List[Tuple[Func, float]]] = {}
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, []).append((func, edge[3]))
+
+    roots = [func for func, entry in raw.items() if not entry[4]]
+    folded: Dict[str, float] = {}
+
+    def walk(func: Func, share: float, stack: List[str], seen: set) -> None:
+        _, _, tt, ct, _ = raw[func]
+        fraction = share / ct if ct else 1.0
+        stack.append(_frame_name(func))
+        key = ";".join(stack)
+        folded[key] = folded.get(key, 0.0) + tt * fraction
+        if len(stack) < _MAX_DEPTH:
+            seen.add(func)
+            for child, edge_ct in callees.get(func, ()):
+                if child not in seen and child in raw:
+                    walk(child, edge_ct * fraction, stack, seen)
+            seen.discard(func)
+        stack.pop()
+
+    for root in roots:
+        walk(root, raw[root][3], [], set())
+
+    lines = 0
+    with path.open("w", encoding="utf-8") as f:
+        for key, seconds in folded.items():
+            micros = int(seconds * 1e6)
+            if micros > 0:
+                f.write(f"{key} {micros}\n")
+                lines += 1
+    return lines
+
+
+def profile_call(func: Callable[..., R], *args, out: Path, top: int = 25) -> R:
+    """
+    Run a callable under cProfile and write its statistics.
+
+    Statistics are written even if the callable raises or exits, and the
+    top functions by cumulative time are printed to stderr.
+
+    Args:
+        func: Callable to profile.
+        *args: Arguments for func.
+        out: Output path prefix; ".pstats" and ".collapsed" are appended.
+        top: Number of functions to print.
+
+    Returns:
+        Whatever func returns.
+    """
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args)
+    finally:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        pstats_path = out.with_name(out.name + ".pstats")
+        collapsed_path = out.with_name(out.name + ".collapsed")
+        profiler.dump_stats(str(pstats_path))
+
+        stats = pstats.Stats(profiler, stream=sys.stderr)
+        lines = write_collapsed(stats, collapsed_path)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+        print(f"Profile written to {pstats_path} and {collapsed_path} ({lines} stacks)", file=sys.stderr)
+        logger.info("Profile written to %s", pstats_path)
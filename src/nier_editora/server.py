@@ -0,0 +1,462 @@
+# src/nier_editora/server.py
+"""
+server.py
+
+Long-lived JSON-RPC daemon behind `niereditora serve`.
+
+The daemon listens on a Unix socket or a localhost TCP port and speaks
+JSON-RPC 2.0, one JSON document per line in each direction. It keeps the
+item catalog, the translations and recently used saves (through a
+SaveCache) in memory, so tooling pays neither interpreter startup nor
+catalog loading per call.
+
+Methods (named params):
+  - info(path)
+  - set(path, [output], [name], [play_time], [money], [xp])
+  - convert(path, to: "pc" | "console", [output])
+  - diff(a, b, [kinds])
+  - dump(paths, [fields], [kinds], [include_inactive])
+  - stats()
+
+Every connection is served by its own thread; requests touching the same
+file are serialized by a per-file lock.
+
+Security: a Unix socket is created readable and writable by its owner
+only. TCP has no such protection, so a TCP service must be given a token,
+which every request carries as the "token" param. A write root, when
+configured, confines the files set and convert may write.
+"""
+
+import hmac
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from nier_editora.core import constants, export
+from nier_editora.core.cache import SaveCache
+from nier_editora.core.diff import diff_saves
+from nier_editora.core.exceptions import SaveEditorError
+from nier_editora.core.i18n import translate_item
+from nier_editora.core.save import SaveFile, iter_save_paths
+from utils import console_to_pc, pc_to_console
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 47600
+
+# Longest accepted request line
+MAX_REQUEST_BYTES = 1 << 20
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+UNAUTHORIZED = -32001
+
+Address = Union[str, Path, Tuple[str, int]]
+
+
+class RpcError(Exception):
+    """
+    A JSON-RPC error, raised by methods and by `call`.
+
+    Attributes:
+        code: JSON-RPC error code.
+        message: Human-readable description.
+    """
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class FileLocks:
+    """
+    One lock per resolved file path.
+    """
+
+    def __init__(self) -> None:
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+
+    @contextmanager
+    def hold(self, *paths: Path) -> Iterator[None]:
+        """
+        Hold the locks of all given files.
+
+        Locks are taken in sorted path order, so two requests touching the
+        same pair of files cannot deadlock.
+        """
+        keys = sorted({str(Path(p).resolve()) for p in paths})
+        with self._guard:
+            locks = [self._locks.setdefault(key, threading.Lock()) for key in keys]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+
+def _path(params: dict, name: str) -> Path:
+    value = params.get(name)
+    if not isinstance(value, str) or not value:
+        raise RpcError(INVALID_PARAMS, f"Missing or invalid '{name}' (expected a path string)")
+    return Path(value)
+
+
+def _non_negative(params: dict, name: str) -> Optional[int]:
+    value = params.get(name)
+    if value is None:
+        return None
+    if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+        raise RpcError(INVALID_PARAMS, f"'{name}' must be a non-negative integer")
+    return value
+
+
+def _play_time(value) -> Optional[int]:
+    if value is None:
+        return None
+    if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+        return value
+    try:
+        h, m, s = map(int, str(value).split(":"))
+    except ValueError:
+        raise RpcError(INVALID_PARAMS, "'play_time' must be seconds or HH:MM:SS") from None
+    return h * 3600 + m * 60 + s
+
+
+class SaveService:
+    """
+    The daemon's methods, independent of the transport.
+    """
+
+    def __init__(self, cache_size: int = 64, write_root: Optional[Path] = None,
+                 token: Optional[str] = None) -> None:
+        """
+        Args:
+            cache_size: Number of parsed saves kept in memory.
+            write_root: If given, set and convert only write files below this directory.
+            token: If given, every request must pass it as the "token" param.
+        """
+        self.cache = SaveCache(max_entries=cache_size)
+        self.write_root = Path(write_root).resolve() if write_root is not None else None
+        self.token = token
+        self.locks = FileLocks()
+        self.requests = 0
+        self._requests_lock = threading.Lock()
+        self.methods: Dict[str, Callable[[dict], object]] = {
+            "info": self.info,
+            "set": self.set,
+            "convert": self.convert,
+            "diff": self.diff,
+            "dump": self.dump,
+            "stats": self.stats,
+        }
+
+    def warm_up(self) -> None:
+        """
+        Load the item catalog and translations before the first request.
+        """
+        translate_item(next(iter(constants.ITEM_LIST)))
+        logger.info("Catalogs loaded: %d item ids", len(constants.ITEM_LIST))
+
+    def _writable(self, path: Path) -> Path:
+        if self.write_root is not None:
+            try:
+                path.resolve().relative_to(self.write_root)
+            except ValueError:
+                raise RpcError(INVALID_PARAMS, f"Refusing to write outside {self.write_root}: {path}") from None
+        return path
+
+    def info(self, params: dict) -> dict:
+        path = _path(params, "path")
+        with self.locks.hold(path):
+            save = self.cache.load(path)
+        return {
+            "path": str(path),
+            "is_console": save.is_console,
+            "header_id": save.header_id.hex(),
+            "player_name": save.player_name,
+            "play_time": save.play_time,
+            "chapter": save.chapter,
+            "money": save.money,
+            "xp": save.xp,
+        }
+
+    def set(self, params: dict) -> dict:
+        path = _path(params, "path")
+        output = self._writable(_path(params, "output") if params.get("output") is not None else path)
+        changes = {}
+        if params.get("name") is not None:
+            if not isinstance(params["name"], str):
+                raise RpcError(INVALID_PARAMS, "'name' must be a string")
+            changes["player_name"] = params["name"][:35]
+        play_time = _play_time(params.get("play_time"))
+        if play_time is not None:
+            changes["play_time"] = play_time
+        for name in ("money", "xp"):
+            value = _non_negative(params, name)
+            if value is not None:
+                changes[name] = value
+        if not changes:
+            raise RpcError(INVALID_PARAMS, "No fields specified to set")
+
+        with self.locks.hold(path, output):
+            save = self.cache.load(path)
+            for name, value in changes.items():
+                setattr(save, name, value)
+            save.save_to_file(output)
+            self.cache.invalidate(output)
+        return {"path": str(output), "changed": changes}
+
+    def convert(self, params: dict) -> dict:
+        path = _path(params, "path")
+        output = self._writable(_path(params, "output") if params.get("output") is not None else path)
+        target = params.get("to")
+        if target not in ("pc", "console"):
+            raise RpcError(INVALID_PARAMS, "'to' must be \"pc\" or \"console\"")
+
+        with self.locks.hold(path, output):
+            data = path.read_bytes()
+            converted = console_to_pc(data) if target == "pc" else pc_to_console(data)
+            output.write_bytes(converted)
+            self.cache.invalidate(output)
+        return {"path": str(output), "size": len(converted)}
+
+    def diff(self, params: dict) -> dict:
+        a, b = _path(params, "a"), _path(params, "b")
+        kinds = params.get("kinds") or SaveFile.INVENTORY_FIELDS
+        unknown = set(kinds) - set(SaveFile.INVENTORY_FIELDS)
+        if unknown:
+            raise RpcError(INVALID_PARAMS, f"Unknown kind(s): {', '.join(sorted(unknown))}")
+        with self.locks.hold(a, b):
+            old, new = self.cache.load(a), self.cache.load(b)
+        changes = [change.to_dict() for change in diff_saves(old, new, kinds)]
+        return {"count": len(changes), "changes": changes}
+
+    def dump(self, params: dict) -> dict:
+        paths = params.get("paths")
+        if isinstance(paths, str):
+            paths = [paths]
+        if not isinstance(paths, list) or not paths or not all(isinstance(p, str) for p in paths):
+            raise RpcError(INVALID_PARAMS, "'paths' must be a path or a list of paths")
+        try:
+            spec = params.get("fields")
+            fields = export.parse_fields(",".join(spec) if isinstance(spec, list) else spec)
+        except ValueError as e:
+            raise RpcError(INVALID_PARAMS, str(e)) from None
+        kinds = params.get("kinds") or tuple(export.KIND_FIELDS)
+        unknown = set(kinds) - set(export.KIND_FIELDS)
+        if unknown:
+            raise RpcError(INVALID_PARAMS, f"Unknown kind(s): {', '.join(sorted(unknown))}")
+
+        records: List[dict] = []
+        for path in iter_save_paths(Path(p) for p in paths):
+            with self.locks.hold(path):
+                save = self.cache.load(path)
+            records.extend(export.iter_records(path, save, fields, kinds,
+                                               bool(params.get("include_inactive"))))
+        return {"count": len(records), "records": records}
+
+    def stats(self, params: dict) -> dict:
+        cache = self.cache.stats
+        return {
+            "requests": self.requests,
+            "cache": {"hits": cache.hits, "misses": cache.misses, "evictions": cache.evictions,
+                      "entries": cache.entries, "bytes": cache.bytes},
+        }
+
+    def handle(self, request) -> Optional[dict]:
+        """
+        Answer one decoded JSON-RPC request object.
+
+        Returns:
+            The response object, or None for notifications (no "id").
+        """
+        if not isinstance(request, dict) or request.get("jsonrpc") != "2.0" \
+                or not isinstance(request.get("method"), str):
+            return _error(None, INVALID_REQUEST, "Invalid JSON-RPC 2.0 request")
+        request_id = request.get("id")
+        params = request.get("params", {})
+        method = self.methods.get(request["method"])
+        with self._requests_lock:
+            self.requests += 1
+        try:
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            params = dict(params)
+            token = params.pop("token", None)
+            if self.token is not None and not (
+                    isinstance(token, str) and hmac.compare_digest(token.encode(), self.token.encode())):
+                raise RpcError(UNAUTHORIZED, "Missing or invalid token")
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Unknown method {request['method']!r}")
+            result = method(params)
+        except RpcError as e:
+            response = _error(request_id, e.code, e.message)
+        except (SaveEditorError, OSError, ValueError) as e:
+            logger.warning("%s failed: %s", request["method"], e)
+            response = _error(request_id, SERVER_ERROR, str(e))
+        except Exception as e:
+            logger.exception("%s failed", request["method"])
+            response = _error(request_id, SERVER_ERROR, f"Internal error: {e}")
+        else:
+            response = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        return response if "id" in request else None
+
+    def handle_line(self, line: bytes) -> Optional[str]:
+        """
+        Answer one request line (a request object or a batch array).
+
+        Returns:
+            The encoded response line, or None if nothing is to be sent.
+        """
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return json.dumps(_error(None, PARSE_ERROR, "Parse error"))
+        if isinstance(request, list):
+            if not request:
+                return json.dumps(_error(None, INVALID_REQUEST, "Empty batch"))
+            responses = [r for r in map(self.handle, request) if r is not None]
+            return json.dumps(responses) if responses else None
+        response = self.handle(request)
+        return json.dumps(response) if response is not None else None
+
+
+def _error(request_id, code: int, message: str) -> dict:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        service: SaveService = self.server.service
+        while True:
+            line = self.rfile.readline(MAX_REQUEST_BYTES + 1)
+            if not line:
+                return
+            if len(line) > MAX_REQUEST_BYTES:
+                self.wfile.write(json.dumps(_error(None, INVALID_REQUEST, "Request too large")).encode() + b"\n")
+                return
+            if not line.strip():
+                continue
+            reply = service.handle_line(line)
+            if reply is not None:
+                self.wfile.write(reply.encode("utf-8") + b"\n")
+                self.wfile.flush()
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+    request_queue_size = 128
+
+
+if hasattr(socketserver, "ThreadingUnixStreamServer"):
+    class _UnixServer(socketserver.ThreadingUnixStreamServer):
+        daemon_threads = True
+        request_queue_size = 128
+
+        def server_close(self) -> None:
+            super().server_close()
+            try:
+                os.unlink(self.server_address)
+            except OSError:
+                pass
+
+
+def _is_listening(path: Path) -> bool:
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except (ConnectionRefusedError, FileNotFoundError):
+        return False
+    finally:
+        probe.close()
+    return True
+
+
+def make_server(address: Address, service: SaveService) -> socketserver.BaseServer:
+    """
+    Bind a threading server for the service.
+
+    Args:
+        address: Unix socket path, or a (host, port) tuple.
+        service: Service answering the requests.
+
+    Returns:
+        A bound server; call serve_forever() to run it.
+
+    Raises:
+        OSError: If the address is in use, e.g. by another running daemon,
+            or if TCP is requested for a service without a token.
+    """
+    if isinstance(address, tuple):
+        if service.token is None:
+            raise OSError("Refusing to serve over TCP without a token")
+        server = _TCPServer(address, _Handler)
+    else:
+        if not hasattr(socketserver, "ThreadingUnixStreamServer"):
+            raise OSError("Unix sockets are not supported on this platform")
+        path = Path(address)
+        if path.exists() and path.is_socket():
+            if _is_listening(path):
+                raise OSError(f"{path} is in use by a running daemon")
+            path.unlink()  # stale socket of a previous run
+        # Bind with a restrictive umask so the socket never exists world-accessible
+        umask = os.umask(0o177)
+        try:
+            server = _UnixServer(str(path), _Handler)
+        finally:
+            os.umask(umask)
+    server.service = service
+    return server
+
+
+def call(address: Address, method: str, params: Optional[dict] = None, timeout: float = 30.0,
+         token: Optional[str] = None):
+    """
+    Send one request to a running daemon and wait for its result.
+
+    Args:
+        address: Unix socket path, or a (host, port) tuple.
+        method: Method name.
+        params: Named parameters.
+        timeout: Socket timeout in seconds.
+        token: The daemon's token, if it requires one.
+
+    Returns:
+        The method's result.
+
+    Raises:
+        RpcError: If the daemon answered with an error.
+        OSError: If the daemon cannot be reached.
+    """
+    if isinstance(address, tuple):
+        sock = socket.create_connection(address, timeout=timeout)
+    else:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        sock.connect(str(address))
+    with sock, sock.makefile("rwb") as stream:
+        params = dict(params or {})
+        if token is not None:
+            params["token"] = token
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        stream.write(json.dumps(request).encode("utf-8") + b"\n")
+        stream.flush()
+        response = json.loads(stream.readline())
+    if "error" in response:
+        raise RpcError(response["error"]["code"], response["error"]["message"])
+    return response["result"]
@@ -0,0 +1,45 @@
+from typing import Optional, Set
+
+from PySide6.QtCore import QSortFilterProxyModel
+
+from nier_editora.core.chipindex import ChipIndex
+
+
+class ChipFilterProxyModel(QSortFilterProxyModel):
+    """
+    Shows the rows of a ChipTableModel whose chip matches the current
+    type/level/weight bounds, answered by a ChipIndex rather than by
+    testing every row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._index: Optional[ChipIndex] = None
+        self._bounds: dict = {}
+        self._slots: Optional[Set[int]] = None
+
+    def setChipIndex(self, index: Optional[ChipIndex]) -> None:
+        self._index = index
+        self.refresh()
+
+    def setBounds(self, **bounds) -> None:
+        """
+        Set the ChipIndex.query bounds; None values are ignored.
+        """
+        self._bounds = {name: value for name, value in bounds.items() if value is not None}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Re-run the query, e.g. after the index was synced.
+        """
+        if self._index is None or not self._bounds:
+            self._slots = None
+        else:
+            self._slots = set(self._index.query(**self._bounds))
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._slots is None:
+            return True
+        return self.sourceModel()._chips[source_row].index in self._slots
@@ -1,13 +1,20 @@
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
 from nier_editora.core import Chip
+from nier_editora.ui.recordrows import RecordRowsMixin
 
-class ChipTableModel(QAbstractTableModel):
+class ChipTableModel(RecordRowsMixin, QAbstractTableModel):
     HEADERS = ["Index", "Name", "Level", "Weight"]
 
+    # slot, field, value
+    editRequested = Signal(int, str, object)
+
     def __init__(self, chips: list[Chip], parent=None):
         super().__init__(parent)
         self._chips = chips
 
+    def _records(self):
+        return self._chips
+
     def rowCount(self, parent=QModelIndex()):
         return len(self._chips)
 
@@ -55,11 +62,9 @@ class ChipTableModel(QAbstractTableModel):
             return False
 
         if col == 2:
-            chip.level = iv
+            self.editRequested.emit(chip.index, "level", iv)
         elif col == 3:
-            chip.weight = iv
+            self.editRequested.emit(chip.index, "weight", iv)
         else:
             return False
-
-        self.dataChanged.emit(index, index, [Qt.DisplayRole])
         return True
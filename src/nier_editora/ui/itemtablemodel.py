@@ -1,15 +1,22 @@
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
 
 from nier_editora.core import Item
+from nier_editora.ui.recordrows import RecordRowsMixin
 
 
-class ItemTableModel(QAbstractTableModel):
+class ItemTableModel(RecordRowsMixin, QAbstractTableModel):
     HEADERS = ["Index", "Name", "Quantity"]
 
+    # slot, field, value
+    editRequested = Signal(int, str, object)
+
     def __init__(self, items: list["Item"], parent=None):
         super().__init__(parent)
         self._items = items
 
+    def _records(self):
+        return self._items
+
     def rowCount(self, parent=QModelIndex()):
         return len(self._items)
 
@@ -47,8 +54,7 @@ class ItemTableModel(QAbstractTableModel):
             qty = int(value)
         except ValueError:
             return False
-        self._items[index.row()].quantity = qty
-        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+        self.editRequested.emit(self._items[index.row()].index, "quantity", qty)
         return True
 
     # ───────────────────────────────────────────────────
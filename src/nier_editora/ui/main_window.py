@@ -1,5 +1,6 @@
 import functools
 import logging
+import re
 import shutil
 import sys
 import time
@@ -7,13 +8,21 @@ from pathlib import Path
 from typing import Optional
 
 import PySide6.QtWidgets
-from PySide6.QtCore import Qt, QSettings, QTime
-from PySide6.QtGui import QAction
+from PySide6.QtCore import Qt, QItemSelection, QItemSelectionModel, QSettings, QTime
+from PySide6.QtGui import QAction, QKeySequence
 
 import nier_editora.core
+from nier_editora.core.cache import load_cached
+from nier_editora.core.chipindex import ChipIndex
 from nier_editora.core.constants import ITEM_LIST
 from nier_editora.core.experience import Experience
+from nier_editora.core.history import Batch, History, SetField, SetRecord
+from nier_editora.core.item import ItemStatus
+from nier_editora.core.loadout import DEFAULT_BUDGET, optimize as optimize_loadout
 from nier_editora.core.i18n import translate_item
+from nier_editora.core.normalize import normalize_save
+from nier_editora.core.validate import validate_file
+from nier_editora.ui.chipfilterproxymodel import ChipFilterProxyModel
 from nier_editora.ui.chiptablemodel import ChipTableModel
 from nier_editora.ui.itemtablemodel import ItemTableModel
 from nier_editora.ui.weapontablemodel import WeaponTableModel
@@ -42,6 +51,9 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         self.savefile: Optional[nier_editora.core.SaveFile] = None
         self.file_path: Optional[Path] = None
         self._dirty: bool = False
+        self.history = History(on_change=self._on_history_change)
+        self._chip_budget: int = DEFAULT_BUDGET
+        self.chip_index: Optional[ChipIndex] = None
 
         self._create_ui()
         self._connect_signals()
@@ -70,6 +82,14 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         self.file_menu.addSeparator()
         self.file_menu.addAction(self.quit_act)
 
+        # Edit Menu
+        self.undo_act = QAction("&Undo", self)
+        self.redo_act = QAction("&Redo", self)
+
+        self.edit_menu = self.menuBar().addMenu("&Edit")
+        self.edit_menu.addAction(self.undo_act)
+        self.edit_menu.addAction(self.redo_act)
+
         # Tools Menu
         self.validate_act = QAction("&Validate Save", self)
         self.backup_act = QAction("&Backup Save", self)
@@ -88,6 +108,12 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         self.export_menu.addAction(self.export_pc_act)
         self.export_menu.addAction(self.export_console_act)
 
+        self.normalize_menu = self.tools_menu.addMenu("&Normalize Inventories")
+        self.normalize_acts = {
+            sort: self.normalize_menu.addAction(label)
+            for sort, label in (("id", "By &ID"), ("category", "By &Category"), ("name", "By &Name"))
+        }
+
         # Help Menu
         self.help_menu = self.menuBar().addMenu("&Help")
         self.about_act = QAction("About", self)
@@ -201,10 +227,29 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         chips_page = PySide6.QtWidgets.QWidget()
         chips_layout = PySide6.QtWidgets.QVBoxLayout(chips_page)
 
+        chip_filters = PySide6.QtWidgets.QHBoxLayout()
+        self.chip_type_filter = PySide6.QtWidgets.QComboBox()
+        self.chip_type_filter.addItem("All types", None)
+        self.chip_level_filter = PySide6.QtWidgets.QSpinBox()
+        self.chip_level_filter.setRange(0, 99)
+        self.chip_level_filter.setSpecialValueText("Any")
+        self.chip_weight_filter = PySide6.QtWidgets.QSpinBox()
+        self.chip_weight_filter.setRange(0, 999)
+        self.chip_weight_filter.setSpecialValueText("Any")
+        chip_filters.addWidget(self.chip_type_filter, 1)
+        chip_filters.addWidget(PySide6.QtWidgets.QLabel("Level ≥"))
+        chip_filters.addWidget(self.chip_level_filter)
+        chip_filters.addWidget(PySide6.QtWidgets.QLabel("Weight ≤"))
+        chip_filters.addWidget(self.chip_weight_filter)
+        chips_layout.addLayout(chip_filters)
+
         self.chip_table = PySide6.QtWidgets.QTableView()
         self.chip_model = ChipTableModel([])
-        self.chip_table.setModel(self.chip_model)
+        self.chip_proxy = ChipFilterProxyModel(self)
+        self.chip_proxy.setSourceModel(self.chip_model)
+        self.chip_table.setModel(self.chip_proxy)
         self.chip_table.setAlternatingRowColors(True)
+        self.chip_table.setSelectionBehavior(PySide6.QtWidgets.QAbstractItemView.SelectRows)
 
         vh = self.chip_table.verticalHeader()
         vh.setVisible(True)
@@ -220,6 +265,10 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         chips_layout.addWidget(self.chip_table)
 
         chip_buttons = PySide6.QtWidgets.QHBoxLayout()
+        self.btn_optimize_chips = PySide6.QtWidgets.QPushButton("Optimize…")
+        self.btn_optimize_chips.setToolTip("Select the best chip loadout for a weight budget")
+        self.btn_optimize_chips.setEnabled(False)
+        chip_buttons.addWidget(self.btn_optimize_chips)
         chip_buttons.addStretch()
         self.btn_add_chip = PySide6.QtWidgets.QPushButton("+")
         self.btn_remove_chip = PySide6.QtWidgets.QPushButton("–")
@@ -248,7 +297,11 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         self.restore_act.triggered.connect(self.restore_backup)
         self.export_pc_act.triggered.connect(lambda: self._export_save(console=False))
         self.export_console_act.triggered.connect(lambda: self._export_save(console=True))
+        for sort, act in self.normalize_acts.items():
+            act.triggered.connect(functools.partial(self.normalize_inventories, sort))
         self.about_act.triggered.connect(self.about_dialog)
+        self.undo_act.triggered.connect(self.undo)
+        self.redo_act.triggered.connect(self.redo)
         self.name_edit.editingFinished.connect(self._on_name_edited)
         self.money_edit.editingFinished.connect(self._on_money_edited)
         self.level_edit.editingFinished.connect(self._on_level_edited)
@@ -258,16 +311,23 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         self.btn_item_add.clicked.connect(self._on_add_item)
         self.btn_item_remove.clicked.connect(self._on_remove_item)
         self.item_table.selectionModel().selectionChanged.connect(self._update_item_buttons)
+        self.item_model.editRequested.connect(functools.partial(self._on_record_edited, "inventory"))
 
         self.btn_add_weapon.clicked.connect(self._on_add_weapon)
         self.btn_remove_weapon.clicked.connect(self._on_remove_weapon)
         self.weapon_table.selectionModel().selectionChanged.connect(self._update_weapon_buttons)
+        self.weapon_model.editRequested.connect(functools.partial(self._on_record_edited, "weapons"))
 
         self.btn_add_chip.clicked.connect(self._on_add_chip)
         self.btn_remove_chip.clicked.connect(self._on_remove_chip)
+        self.btn_optimize_chips.clicked.connect(self._on_optimize_chips)
         self.chip_table.selectionModel().selectionChanged.connect(
             lambda *_: self._update_chip_buttons()
         )
+        self.chip_model.editRequested.connect(functools.partial(self._on_record_edited, "chips"))
+        self.chip_type_filter.currentIndexChanged.connect(lambda *_: self._apply_chip_filter())
+        self.chip_level_filter.valueChanged.connect(lambda *_: self._apply_chip_filter())
+        self.chip_weight_filter.valueChanged.connect(lambda *_: self._apply_chip_filter())
 
     def _create_shortcuts(self) -> None:
         shortcuts = [
@@ -279,6 +339,8 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             (self.backup_act,   "Ctrl+B"),
             (self.restore_act,  "Ctrl+Shift+B"),
             (self.about_act,    "Ctrl+H"),
+            (self.undo_act,     QKeySequence.Undo),
+            (self.redo_act,     QKeySequence.Redo),
         ]
 
         for act, keys in shortcuts:
@@ -315,10 +377,10 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
                 h, m, s = map(int, val.split(":"))
                 widget.setTime(QTime(h, m, s))
         for act in (
-                self.save_act, self.save_as_act,
-                self.validate_act, self.backup_act, self.restore_act, self.export_menu,
+                self.save_act, self.save_as_act, self.undo_act, self.redo_act,
+                self.validate_act, self.backup_act, self.restore_act, self.export_menu, self.normalize_menu,
                 self.btn_item_add, self.btn_item_remove, self.btn_add_weapon,
-                self.btn_remove_weapon, self.btn_add_chip, self.btn_remove_chip
+                self.btn_remove_weapon, self.btn_add_chip, self.btn_remove_chip, self.btn_optimize_chips
         ): act.setEnabled(False)
 
         for field in (
@@ -337,7 +399,7 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             else:
                 return
         try:
-            self.savefile = nier_editora.core.SaveFile.load_from_file(Path(path))
+            self.savefile = load_cached(Path(path))
             self.file_path = Path(path)
             self.status.showMessage(f"Loaded {self.savefile.player_name}", 1200)
         except Exception as e:
@@ -359,13 +421,15 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         self._populate_items()
         self._populate_weapons()
         self._populate_chips()
+        self.history.reset(self.savefile)
+        self._update_undo_actions()
 
         for field in (
-            self.validate_act, self.backup_act, self.restore_act, self.export_menu,
+            self.validate_act, self.backup_act, self.restore_act, self.export_menu, self.normalize_menu,
             self.name_edit, self.money_edit, self.level_edit, self.xp_edit, self.time_edit,
             self.btn_item_add, self.btn_item_remove,
             self.btn_add_weapon, self.btn_remove_weapon,
-            self.btn_add_chip, self.btn_remove_chip
+            self.btn_add_chip, self.btn_remove_chip, self.btn_optimize_chips
         ): field.setEnabled(True)
 
         self._dirty = False
@@ -384,11 +448,14 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             self.status.showMessage(f"Saved as {Path(p).name}", 1200)
 
     def validate_save(self):
-        try:
-            nier_editora.core.SaveFile().load(self.file_path.read_bytes())
+        report = validate_file(self.file_path)
+        details = "\n".join(str(issue) for issue in report.issues[:20])
+        if report.ok and not report.issues:
             PySide6.QtWidgets.QMessageBox.information(self, "Validate", "Save is valid.")
-        except Exception as e:
-            PySide6.QtWidgets.QMessageBox.critical(self, "Invalid", f"Validation failed:\n{e}")
+        elif report.ok:
+            PySide6.QtWidgets.QMessageBox.warning(self, "Validate", f"Save is valid, with warnings:\n{details}")
+        else:
+            PySide6.QtWidgets.QMessageBox.critical(self, "Invalid", f"Validation failed:\n{details}")
 
     def backup_save(self):
         bak = self.file_path.with_suffix(self.file_path.suffix + f".{int(time.time())}.bak")
@@ -405,6 +472,18 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         self.status.showMessage(f"Restored {backups[-1].name}", 800)
 
 
+    def normalize_inventories(self, sort: str):
+        if not self.savefile: return
+        edited = self.savefile.snapshot()
+        results = normalize_save(edited, sort=sort)
+        batch = Batch.from_snapshot(self.savefile, edited, self.savefile.INVENTORY_FIELDS,
+                                    f"Normalize inventories by {sort}")
+        if self.history.push(batch, coalesce=False):
+            self._dirty = True
+        merged = sum(result.merged for result in results)
+        self.status.showMessage(f"Normalized: {len(batch.commands)} slot(s) rewritten, {merged} stack(s) merged", 2000)
+
+
     # helpers
     def _export_save(self, *, console: bool):
         if not self.savefile: return
@@ -436,7 +515,7 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             self.name_edit.setText(self.savefile.player_name)
             return
 
-        self.savefile.player_name = text
+        self.history.push(SetField("player_name", self.savefile.player_name, text))
         
     @mark_dirty
     def _on_money_edited(self):
@@ -450,7 +529,7 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             self.money_edit.setValue(self.savefile.money)
             return
 
-        self.savefile.money = money
+        self.history.push(SetField("money", self.savefile.money, money))
         
     
     @mark_dirty
@@ -466,9 +545,7 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             self.xp_edit.setValue(self.savefile.xp)
             return
 
-        self.savefile.xp = xp
-        lvl = Experience.get_level_from_experience(xp)
-        self.level_edit.setValue(lvl)
+        self.history.push(SetField("xp", self.savefile.xp, xp))
 
 
     @mark_dirty
@@ -486,8 +563,7 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             return
 
         xp_needed = Experience.get_experience_for_level(lvl)
-        self.savefile.xp = xp_needed
-        self.xp_edit.setValue(xp_needed)
+        self.history.push(SetField("xp", self.savefile.xp, xp_needed, label="Set level"))
 
         
 
@@ -514,7 +590,7 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             return
 
         total_secs = h * 3600 + m * 60 + s
-        self.savefile.play_time = total_secs
+        self.history.push(SetField("play_time", self.savefile.play_time, total_secs))
 
         self.time_edit.clearFocus()
         #
@@ -531,8 +607,7 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             self.btn_item_remove.setEnabled(False)
             return
 
-        row = sel[0].row()
-        slot = self.savefile.inventory.raw[row]
+        slot = self.item_model._items[sel[0].row()]
         self.btn_item_remove.setEnabled(slot.id != -1)
 
     @mark_dirty
@@ -566,11 +641,10 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
 
         new_item = nier_editora.core.Item.empty(idx)
         new_item.id = new_id
+        new_item.status = ItemStatus.ACTIVE
         new_item.quantity = 1
-        self.savefile.inventory.raw[idx] = new_item
-
-        self.item_model.appendRow(new_item)
-        self._populate_items()
+        self.history.push(SetRecord.replace(self.savefile, "inventory", new_item, f"Add {new_item.name}"),
+                          coalesce=False)
         
 
     @mark_dirty
@@ -580,9 +654,9 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
             PySide6.QtWidgets.QMessageBox.warning(self, "No Selection", "Please select an item to remove.")
             return
 
-        row = sel[0].row()
-        self.savefile.inventory.raw[row] = nier_editora.core.Item.empty(row)
-        self.item_model.removeRow(row)
+        idx = self.item_model._items[sel[0].row()].index
+        self.history.push(SetRecord.replace(self.savefile, "inventory", nier_editora.core.Item.empty(idx),
+                                            f"Remove {self.savefile.inventory.raw[idx].name}"), coalesce=False)
         
 
     def _populate_weapons(self):
@@ -596,8 +670,7 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         if not sel:
             self.btn_remove_weapon.setEnabled(False)
             return
-        row = sel[0].row()
-        slot = self.savefile.weapons.raw[row]
+        slot = self.weapon_model._weapons[sel[0].row()]
         self.btn_remove_weapon.setEnabled(slot.id != -1)
 
     @mark_dirty
@@ -618,34 +691,63 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         new_slot = nier_editora.core.Weapon.empty(idx)
         new_slot.id = new_id
         new_slot.level = 0
-        self.savefile.weapons.raw[idx] = new_slot
-        self.open_save(self.file_path)  # or just re‑populate weapons
+        self.history.push(SetRecord.replace(self.savefile, "weapons", new_slot, f"Add {new_slot.name}"),
+                          coalesce=False)
         
 
     @mark_dirty
     def _on_remove_weapon(self):
         sel = self.weapon_table.selectionModel().selectedRows()
         if not sel: return
-        row = sel[0].row()
-        idx = self.savefile.weapons.raw[row].index
-        self.savefile.weapons.raw[idx] = nier_editora.core.Weapon.empty(idx)
-        self.open_save(self.file_path)
+        idx = self.weapon_model._weapons[sel[0].row()].index
+        self.history.push(SetRecord.replace(self.savefile, "weapons", nier_editora.core.Weapon.empty(idx),
+                                            f"Remove {self.savefile.weapons.raw[idx].name}"), coalesce=False)
         
 
     def _populate_chips(self):
         self.chip_model.beginResetModel()
         self.chip_model._chips = list(self.savefile.chips)
         self.chip_model.endResetModel()
+        self.chip_index = ChipIndex(self.savefile.chips)
+        self.chip_proxy.setChipIndex(self.chip_index)
+        self._populate_chip_types()
         self._update_chip_buttons()
 
-    def _update_chip_buttons(self):
+    def _populate_chip_types(self):
+        # One entry per type present, labelled with the name of its lowest-level chip
+        names = {}
+        for chip in sorted(self.savefile.chips.active, key=lambda c: c.level, reverse=True):
+            names[chip.chip_type] = re.sub(r" \+\d+$", "", chip.name or str(chip.base_id))
+        current = self.chip_type_filter.currentData()
+        self.chip_type_filter.blockSignals(True)
+        self.chip_type_filter.clear()
+        self.chip_type_filter.addItem("All types", None)
+        for chip_type in self.chip_index.types():
+            self.chip_type_filter.addItem(f"{chip_type}: {names[chip_type]}", chip_type)
+        self.chip_type_filter.setCurrentIndex(max(0, self.chip_type_filter.findData(current)))
+        self.chip_type_filter.blockSignals(False)
+        self._apply_chip_filter()
+
+    def _apply_chip_filter(self):
+        self.chip_proxy.setBounds(
+            chip_type=self.chip_type_filter.currentData(),
+            min_level=self.chip_level_filter.value() or None,
+            max_weight=self.chip_weight_filter.value() or None,
+        )
+        self._update_chip_buttons()
+
+    def _selected_chip(self):
         sel = self.chip_table.selectionModel().selectedRows()
         if not sel:
+            return None
+        return self.chip_model._chips[self.chip_proxy.mapToSource(sel[0]).row()]
+
+    def _update_chip_buttons(self):
+        slot = self._selected_chip()
+        if slot is None:
             self.btn_remove_chip.setEnabled(False)
             return
 
-        row = sel[0].row()
-        slot = self.savefile.chips.raw[row]
         # active if base_id != -1
         self.btn_remove_chip.setEnabled(slot.base_id != -1)
 
@@ -673,22 +775,100 @@ class NierEditoraUI(PySide6.QtWidgets.QMainWindow):
         new_slot.base_id = new_id
         new_slot.level = 0
         new_slot.weight = 0
-        self.savefile.chips.raw[idx] = new_slot
-
-        self._populate_chips()
+        self.history.push(SetRecord.replace(self.savefile, "chips", new_slot, f"Add {new_slot.name}"),
+                          coalesce=False)
         
 
     @mark_dirty
     def _on_remove_chip(self):
-        sel = self.chip_table.selectionModel().selectedRows()
-        if not sel: return
-        row = sel[0].row()
-        idx = self.savefile.chips.raw[row].index
-        self.savefile.chips.raw[idx] = nier_editora.core.Chip.empty(idx)
-
-        self._populate_chips()
+        chip = self._selected_chip()
+        if chip is None: return
+        idx = chip.index
+        self.history.push(SetRecord.replace(self.savefile, "chips", nier_editora.core.Chip.empty(idx),
+                                            f"Remove {self.savefile.chips.raw[idx].name}"), coalesce=False)
         
 
+    def _on_optimize_chips(self):
+        budget, ok = PySide6.QtWidgets.QInputDialog.getInt(
+            self, "Optimize Chips", "Weight budget:", self._chip_budget, 0, 999
+        )
+        if not ok: return
+        self._chip_budget = budget
+        loadout = optimize_loadout(self.savefile.chips.active, budget)
+
+        chosen = {chip.index for chip in loadout.chips}
+        selection = QItemSelection()
+        for row, chip in enumerate(self.chip_model._chips):
+            if chip.index in chosen:
+                selection.select(self.chip_model.index(row, 0),
+                                 self.chip_model.index(row, self.chip_model.columnCount() - 1))
+        selection = self.chip_proxy.mapSelectionFromSource(selection)
+        self.chip_table.selectionModel().select(
+            selection, QItemSelectionModel.ClearAndSelect
+        )
+        self.status.showMessage(
+            f"Best loadout: {len(loadout.chips)} chip(s), weight {loadout.weight}/{budget}, "
+            f"level score {loadout.score:g}", 4000
+        )
+
+    # undo/redo
+    def undo(self):
+        command = self.history.undo()
+        if command:
+            self._dirty = True
+            self.status.showMessage(f"Undid {command.label}", 1200)
+
+    def redo(self):
+        command = self.history.redo()
+        if command:
+            self._dirty = True
+            self.status.showMessage(f"Redid {command.label}", 1200)
+
+    @mark_dirty
+    def _on_record_edited(self, kind: str, slot: int, field: str, value):
+        label = f"Edit {getattr(self.savefile, kind).raw[slot].name} {field}"
+        self.history.push(SetRecord.edit(self.savefile, kind, slot, label, **{field: value}))
+
+    def _on_history_change(self, command):
+        models = {"inventory": self.item_model, "weapons": self.weapon_model, "chips": self.chip_model}
+        chip_types = self.chip_index.types() if self.chip_index else []
+        chips_changed = False
+        for command in command.commands if isinstance(command, Batch) else [command]:
+            if isinstance(command, SetField):
+                self._show_field(command.name)
+            elif command.kind in models:
+                manager = getattr(self.savefile, command.kind)
+                if command.kind == "chips" and self.chip_index:
+                    chips_changed |= self.chip_index.sync(command.slot)
+                record = manager.raw[command.slot]
+                models[command.kind].syncSlot(record, manager.is_slot_active(record))
+        if chips_changed:
+            if self.chip_index.types() != chip_types:
+                self._populate_chip_types()
+            else:
+                self._apply_chip_filter()
+        self._update_undo_actions()
+
+    def _show_field(self, name: str):
+        if name == "player_name":
+            self.name_edit.setText(self.savefile.player_name)
+        elif name == "money":
+            self.money_edit.setValue(self.savefile.money)
+        elif name == "xp":
+            self.xp_edit.setValue(self.savefile.xp)
+            self.level_edit.setValue(Experience.get_level_from_experience(self.savefile.xp))
+        elif name == "play_time":
+            h, rem = divmod(self.savefile.play_time, 3600)
+            m, s = divmod(rem, 60)
+            self.time_edit.setTime(QTime(h, m, s))
+
+    def _update_undo_actions(self):
+        self.undo_act.setEnabled(self.history.can_undo)
+        self.undo_act.setText(f"&Undo {self.history.undo_label}" if self.history.can_undo else "&Undo")
+        self.redo_act.setEnabled(self.history.can_redo)
+        self.redo_act.setText(f"&Redo {self.history.redo_label}" if self.history.can_redo else "&Redo")
+
+
     # shutdown hook
     def closeEvent(self, event):
         if self._dirty:
@@ -0,0 +1,43 @@
+from PySide6.QtCore import QModelIndex, Qt
+
+
+class RecordRowsMixin:
+    """
+    Row-level updates for table models listing the active records of one
+    inventory in slot order.
+
+    Models define `_records()` and `editRequested`; edits made in the view
+    are emitted as (slot, field, value) instead of being applied directly,
+    so the owner can journal them and then call `syncSlot`.
+    """
+
+    def _records(self) -> list:
+        raise NotImplementedError
+
+    def rowOfSlot(self, slot: int) -> int:
+        """
+        Row showing the given slot, or -1 if it is not listed.
+        """
+        for row, record in enumerate(self._records()):
+            if record.index == slot:
+                return row
+        return -1
+
+    def syncSlot(self, record, active: bool) -> None:
+        """
+        Update, insert or remove the one row of `record` to match its state.
+        """
+        records = self._records()
+        row = self.rowOfSlot(record.index)
+        if active and row >= 0:
+            records[row] = record
+            self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1), [Qt.DisplayRole])
+        elif active:
+            row = sum(1 for r in records if r.index < record.index)
+            self.beginInsertRows(QModelIndex(), row, row)
+            records.insert(row, record)
+            self.endInsertRows()
+        elif row >= 0:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del records[row]
+            self.endRemoveRows()
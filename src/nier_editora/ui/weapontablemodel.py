@@ -1,15 +1,22 @@
-from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt, Signal
 
 from nier_editora.core import Weapon
+from nier_editora.ui.recordrows import RecordRowsMixin
 
 
-class WeaponTableModel(QAbstractTableModel):
+class WeaponTableModel(RecordRowsMixin, QAbstractTableModel):
     HEADERS = ["Index", "Name", "Level"]
 
+    # slot, field, value
+    editRequested = Signal(int, str, object)
+
     def __init__(self, weapons: list[Weapon], parent=None):
         super().__init__(parent)
         self._weapons = weapons
 
+    def _records(self):
+        return self._weapons
+
     def rowCount(self, parent=QModelIndex()):
         return len(self._weapons)
 
@@ -45,7 +52,6 @@ class WeaponTableModel(QAbstractTableModel):
                 lvl = int(value)
             except ValueError:
                 return False
-            self._weapons[index.row()].level = lvl
-            self.dataChanged.emit(index, index, [Qt.DisplayRole])
+            self.editRequested.emit(self._weapons[index.row()].index, "level", lvl)
             return True
         return False
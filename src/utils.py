@@ -6,6 +6,7 @@ Conversion utilities for Nier:Automata save files between console and PC layouts
 
 import logging
 
+from nier_editora.core import metrics
 from nier_editora.core.constants import (
     PC_SAVE_SIZE,
     CONSOLE_SAVE_SIZE,
@@ -16,6 +17,7 @@ from nier_editora.core.exceptions import SaveFormatError
 logger = logging.getLogger(__name__)
 
 
+@metrics.timed("convert.console_to_pc")
 def console_to_pc(ps4_data: bytes) -> bytes:
     """
     Convert a decrypted console save to PC format.
@@ -36,42 +38,43 @@ def console_to_pc(ps4_data: bytes) -> bytes:
     """
     length = len(ps4_data)
     if length not in (CONSOLE_SAVE_SIZE, PC_SAVE_SIZE):
-        logger.error(f"Unexpected input size: {length}")
+        logger.error("Unexpected input size: %d", length)
         raise SaveFormatError(f"Unexpected save file length: {hex(length)}")
 
-    logger.debug(f"console_to_pc: starting with input size={length}")
+    logger.debug("console_to_pc: starting with input size=%d", length)
 
     # 1) Prepend header
     data = bytearray(b"\x00" * CONSOLE_HEADER_SIZE + ps4_data)
-    logger.debug(f"Prepended {CONSOLE_HEADER_SIZE}-byte header; size={len(data)}")
+    logger.debug("Prepended %d-byte header; size=%d", CONSOLE_HEADER_SIZE, len(data))
 
     # 2) Duplicate block
     end = DUPLICATION_OFFSET + DUPLICATION_LENGTH
     if len(data) < end:
         logger.error(
-            f"Data too short for duplication at offset {DUPLICATION_OFFSET:#x} "
-            f"(need up to {end:#x}, got {len(data)})"
+            "Data too short for duplication at offset %#x (need up to %#x, got %d)",
+            DUPLICATION_OFFSET, end, len(data),
         )
         raise SaveFormatError("Corrupted save: insufficient data for duplication.")
     block = data[DUPLICATION_OFFSET:end]
     data[DUPLICATION_OFFSET:DUPLICATION_OFFSET] = block
     logger.debug(
-        f"Duplicated {DUPLICATION_LENGTH}-byte block at {DUPLICATION_OFFSET:#x}; size now={len(data)}"
+        "Duplicated %d-byte block at %#x; size now=%d", DUPLICATION_LENGTH, DUPLICATION_OFFSET, len(data)
     )
 
     # 3) Pad or trim
     if len(data) < PC_SAVE_SIZE:
         pad = PC_SAVE_SIZE - len(data)
         data.extend(b"\x00" * pad)
-        logger.debug(f"Padded {pad} bytes; final size={len(data)}")
+        logger.debug("Padded %d bytes; final size=%d", pad, len(data))
     elif len(data) > PC_SAVE_SIZE:
         del data[PC_SAVE_SIZE:]
-        logger.debug(f"Trimmed to {PC_SAVE_SIZE} bytes")
+        logger.debug("Trimmed to %d bytes", PC_SAVE_SIZE)
 
-    logger.info(f"console_to_pc: completed (output size={len(data)})")
+    logger.debug("console_to_pc: completed (output size=%d)", len(data))
     return bytes(data)
 
 
+@metrics.timed("convert.pc_to_console")
 def pc_to_console(pc_data: bytes) -> bytes:
     """
     Revert a PC-formatted save back to console format.
@@ -92,33 +95,31 @@ def pc_to_console(pc_data: bytes) -> bytes:
     """
     length = len(pc_data)
     if length != PC_SAVE_SIZE:
-        logger.error(f"Invalid PC save size: {length} bytes")
+        logger.error("Invalid PC save size: %d bytes", length)
         raise SaveFormatError(f"PC save must be {PC_SAVE_SIZE} bytes (got {length}).")
 
-    logger.debug(f"pc_to_console: starting with input size={length}")
+    logger.debug("pc_to_console: starting with input size=%d", length)
 
     # 1) Remove header
     data = bytearray(pc_data[CONSOLE_HEADER_SIZE:])
-    logger.debug(f"Removed {CONSOLE_HEADER_SIZE}-byte header; size={len(data)}")
+    logger.debug("Removed %d-byte header; size=%d", CONSOLE_HEADER_SIZE, len(data))
 
     # 2) Remove duplicated block
     dup_off = DUPLICATION_OFFSET - CONSOLE_HEADER_SIZE
     end_dup = dup_off + DUPLICATION_LENGTH
     if len(data) < end_dup:
-        logger.error(
-            f"Cannot remove duplicate block: need up to index {end_dup}, got {len(data)}"
-        )
+        logger.error("Cannot remove duplicate block: need up to index %d, got %d", end_dup, len(data))
         raise SaveFormatError("Corrupted PC save: insufficient data to undo duplication.")
     del data[dup_off:end_dup]
     logger.debug(
-        f"Removed duplicated block ({DUPLICATION_LENGTH} bytes) at {dup_off}; size now={len(data)}"
+        "Removed duplicated block (%d bytes) at %d; size now=%d", DUPLICATION_LENGTH, dup_off, len(data)
     )
 
     # 3) Trim to console size
     if len(data) < CONSOLE_SAVE_SIZE:
-        logger.error(f"Data too short after trimming: {len(data)} bytes (expected {CONSOLE_SAVE_SIZE})")
+        logger.error("Data too short after trimming: %d bytes (expected %d)", len(data), CONSOLE_SAVE_SIZE)
         raise SaveFormatError("Corrupted PC save: data too short after reversion.")
     del data[CONSOLE_SAVE_SIZE:]
-    logger.info(f"pc_to_console: completed (output size={CONSOLE_SAVE_SIZE})")
+    logger.debug("pc_to_console: completed (output size=%d)", CONSOLE_SAVE_SIZE)
 
     return bytes(data)
@@ -0,0 +1,26 @@
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nier_editora.core.save import SaveFile  # noqa: E402
+
+SAMPLE = SRC / "nier_editora" / "data" / "saves" / "SlotData_0.dat"
+
+
+@pytest.fixture
+def sample_path(tmp_path) -> Path:
+    """A writable copy of the bundled sample save."""
+    path = tmp_path / "SlotData_0.dat"
+    shutil.copy(SAMPLE, path)
+    return path
+
+
+@pytest.fixture
+def save() -> SaveFile:
+    return SaveFile.load_from_file(SAMPLE)
@@ -0,0 +1,40 @@
+import pytest
+
+
+@pytest.mark.parametrize("ids", [[0x7FFFFF], [-5], [-1], [0, -1]])
+def test_add_many_rejects_unknown_item_ids(save, ids):
+    before = save.write()
+    with pytest.raises(ValueError, match="unknown item id"):
+        save.inventory.add_many(ids)
+    assert save.write() == before
+
+
+def test_add_many_rejects_unknown_weapon_ids(save):
+    before = save.write()
+    with pytest.raises(ValueError, match="unknown weapon id"):
+        save.weapons.add_many([-1])
+    assert save.write() == before
+
+
+def test_add_many_stacks_known_ids(save):
+    inventory = save.inventory
+    item = inventory.active[0]
+    free = inventory.free_slots()
+    summary = inventory.add_many([item.id, 0x205], qty=1, cap=99)
+    assert item.index in summary.changed or item.quantity == 99
+    assert summary.added == [free[0]]
+    assert inventory.raw[free[0]].id == 0x205
+
+
+@pytest.mark.parametrize("ids", [[0], [0x205], [0x3EB, 0]])
+def test_weapon_add_many_rejects_non_weapon_ids(save, ids):
+    save.weapons.raw[38] = type(save.weapons.raw[38]).empty(38)
+    before = save.write()
+    with pytest.raises(ValueError, match="unknown weapon id"):
+        save.weapons.add_many(ids)
+    assert save.write() == before
+
+
+def test_item_add_many_rejects_weapon_ids(save):
+    with pytest.raises(ValueError, match="unknown item id"):
+        save.inventory.add_many([0x3EB])
@@ -0,0 +1,50 @@
+import itertools
+import random
+
+import pytest
+
+from nier_editora.core.chipindex import ChipIndex
+
+
+def _scan(chips, chip_type=None, min_level=None, max_level=None, min_weight=None, max_weight=None):
+    return [chip.index for chip in chips.raw if chips.is_slot_active(chip)
+            and (chip_type is None or chip.chip_type == chip_type)
+            and (min_level is None or chip.level >= min_level)
+            and (max_level is None or chip.level <= max_level)
+            and (min_weight is None or chip.weight >= min_weight)
+            and (max_weight is None or chip.weight <= max_weight)]
+
+
+def _queries(chips):
+    types = [None] + sorted({chip.chip_type for chip in chips.active})[:5]
+    bounds = [None, 0, 3, 8]
+    for chip_type, min_level, max_level, max_weight in itertools.product(types, bounds, bounds, [None, 5, 12]):
+        yield dict(chip_type=chip_type, min_level=min_level, max_level=max_level,
+                   min_weight=None if max_weight is None else max_weight // 2, max_weight=max_weight)
+
+
+def test_query_matches_full_scan(save):
+    index = ChipIndex(save.chips)
+    assert len(index) == len(save.chips.active)
+    for bounds in _queries(save.chips):
+        assert index.query(**bounds) == _scan(save.chips, **bounds), bounds
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sync_matches_rebuild(save, seed):
+    rng = random.Random(seed)
+    chips = save.chips
+    index = ChipIndex(chips)
+    for _ in range(200):
+        slot = rng.randrange(len(chips.raw))
+        if rng.random() < 0.2:
+            chips.raw[slot] = type(chips.raw[slot]).empty(slot)
+        else:
+            chip = chips.raw[slot]
+            chip.base_id = max(chip.base_id, 0)
+            chip.chip_type, chip.level, chip.weight = rng.randrange(6), rng.randrange(9), rng.randrange(25)
+        index.sync(slot)
+
+    assert sorted(index.types()) == sorted({chip.chip_type for chip in chips.active})
+    for bounds in _queries(chips):
+        assert index.query(**bounds) == _scan(chips, **bounds), bounds
@@ -0,0 +1,17 @@
+import pytest
+
+from nier_editora.cli import DEFAULT_PROFILE, _expand_profile_flag
+
+COMMANDS = {"info", "dump"}
+
+
+@pytest.mark.parametrize("argv, expected", [
+    (["--profile", "info", "x"], [f"--profile={DEFAULT_PROFILE}", "info", "x"]),
+    (["--profile", "-v", "info"], [f"--profile={DEFAULT_PROFILE}", "-v", "info"]),
+    (["--profile"], [f"--profile={DEFAULT_PROFILE}"]),
+    (["--profile", "/tmp/p", "dump", "a"], ["--profile", "/tmp/p", "dump", "a"]),
+    (["--profile=/tmp/p", "dump"], ["--profile=/tmp/p", "dump"]),
+    (["info", "--profile"], ["info", "--profile"]),
+])
+def test_expand_profile_flag(argv, expected):
+    assert _expand_profile_flag(argv, COMMANDS) == expected
@@ -0,0 +1,14 @@
+import pytest
+
+from nier_editora.core.corpus import generate_corpus
+
+
+def test_bad_fill_raises_before_the_pool_starts(tmp_path):
+    with pytest.raises(ValueError, match="chips"):
+        generate_corpus(tmp_path, count=20, fill={"chips": 2}, jobs=2)
+
+
+def test_output_does_not_depend_on_jobs(tmp_path):
+    serial = generate_corpus(tmp_path / "a", count=20, seed=7, formats=("pc",), jobs=1)
+    parallel = generate_corpus(tmp_path / "b", count=20, seed=7, formats=("pc",), jobs=2)
+    assert [p.read_bytes() for p in serial] == [p.read_bytes() for p in parallel]
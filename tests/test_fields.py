@@ -0,0 +1,37 @@
+import pytest
+
+from nier_editora.core import fields
+from nier_editora.core.save import SaveFile
+from utils import pc_to_console
+
+VALUES = {"money": 123456, "xp": 7890, "play_time": 3600, "chapter": 5, "player_name": "2B"}
+
+
+@pytest.fixture(params=["pc", "console"])
+def save_path(request, sample_path):
+    if request.param == "console":
+        sample_path.write_bytes(pc_to_console(sample_path.read_bytes()))
+    return sample_path
+
+
+def test_write_many_matches_full_reencode(save_path):
+    expected = SaveFile.load_from_file(save_path)
+    for name, value in VALUES.items():
+        setattr(expected, name, value)
+
+    fields.write_many(save_path, VALUES)
+    assert save_path.read_bytes() == expected.write()
+    for name, value in VALUES.items():
+        assert fields.read(save_path, name) == value
+
+
+def test_bad_value_leaves_file_untouched(save_path):
+    before = save_path.read_bytes()
+    with pytest.raises(ValueError):
+        fields.write_many(save_path, {"money": 1, "xp": 2 ** 40})
+    assert save_path.read_bytes() == before
+
+
+def test_unknown_field(save_path):
+    with pytest.raises(ValueError, match="Unknown field"):
+        fields.read(save_path, "header_id")
@@ -0,0 +1,76 @@
+import dataclasses
+
+from nier_editora.core.history import Batch, History, SetField, SetRecord
+
+
+def test_edits_within_the_window_coalesce(save):
+    money = save.money
+    history = History(save, coalesce_window=60)
+    history.push(SetField("money", money, money + 1))
+    history.push(SetField("money", money + 1, money + 2))
+    assert save.money == money + 2
+
+    history.undo()
+    assert save.money == money
+    assert not history.can_undo
+
+
+def test_coalesce_disabled_keeps_separate_steps(save):
+    money = save.money
+    history = History(save, coalesce_window=0)
+    history.push(SetField("money", money, money + 1))
+    history.push(SetField("money", money + 1, money + 2), coalesce=False)
+    history.undo()
+    assert save.money == money + 1
+
+
+def test_merge_back_to_the_original_drops_the_step(save):
+    money = save.money
+    history = History(save, coalesce_window=60)
+    history.push(SetField("xp", save.xp, save.xp + 1), coalesce=False)
+    history.push(SetField("money", money, money + 5))
+    history.push(SetField("money", money + 5, money))
+    assert save.money == money
+    assert history.undo_label == "Set xp"
+
+    history.undo()
+    assert not history.can_undo
+
+
+def test_noop_push_is_dropped(save):
+    history = History(save)
+    assert not history.push(SetField("money", save.money, save.money))
+    assert not history.can_undo
+
+
+def test_batch_undo_and_redo(save):
+    original = save.write()
+    edited = save.snapshot()
+    free = edited.inventory.free_slots()[0]
+    edited.inventory.raw[free] = dataclasses.replace(edited.inventory.active[0], index=free)
+    edited.chips.raw[0] = type(edited.chips.raw[0]).empty(0)
+    batch = Batch.from_snapshot(save, edited, ("inventory", "chips"), "Batch edit")
+    assert len(batch.commands) == 2
+
+    history = History(save)
+    history.push(batch)
+    assert save.write() == edited.write()
+    history.undo()
+    assert save.write() == original
+    history.redo()
+    assert save.write() == edited.write()
+
+
+def test_replace_stores_only_changed_attributes(save):
+    record = save.inventory.active[0]
+    new = dataclasses.replace(record, quantity=record.quantity + 1)
+    command = SetRecord.replace(save, "inventory", new)
+    assert command.old == {"quantity": record.quantity}
+    assert command.new == {"quantity": record.quantity + 1}
+
+    history = History(save)
+    history.push(command)
+    assert save.inventory.raw[record.index] is record
+    assert record.quantity == new.quantity
+    history.undo()
+    assert record.quantity == new.quantity - 1
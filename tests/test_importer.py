@@ -0,0 +1,52 @@
+import pytest
+
+from nier_editora.core.exceptions import EditConflictError
+from nier_editora.core.importer import RecordEdit, load_edits, plan_edits
+
+
+def _weapon_level(save, level):
+    weapon = save.weapons.active[0]
+    return RecordEdit(line=1, kind="weapons", slot=weapon.index, values={"level": level})
+
+
+@pytest.mark.parametrize("level", [0, 5, 57])
+def test_weapon_level_out_of_range(save, level):
+    with pytest.raises(EditConflictError, match="out of range"):
+        plan_edits(save, [_weapon_level(save, level)])
+
+
+@pytest.mark.parametrize("level", [1, 4])
+def test_weapon_level_in_range(save, level):
+    edit = _weapon_level(save, level)
+    assert plan_edits(save, [edit]) == [(edit, edit.slot)]
+
+
+@pytest.mark.parametrize("kind, item_id", [("inventory", 0x3EB), ("weapons", 0x205), ("chips", 0x205),
+                                           ("corpse_inventory", 0x7FFFFF)])
+def test_id_must_match_the_inventory_kind(save, kind, item_id):
+    with pytest.raises(EditConflictError, match="unknown .* id"):
+        plan_edits(save, [RecordEdit(line=1, kind=kind, op="add", id=item_id)])
+
+
+def test_item_id_is_accepted_in_the_inventory(save):
+    edit = RecordEdit(line=1, kind="inventory", op="add", id=0x205)
+    assert plan_edits(save, [edit]) == [(edit, save.inventory.free_slots()[0])]
+
+
+def test_adding_chips_is_rejected(save):
+    with pytest.raises(EditConflictError, match="adding chips is not supported"):
+        plan_edits(save, [RecordEdit(line=1, kind="chips", op="add", id=save.chips.active[0].base_id)])
+
+
+@pytest.mark.parametrize("text, message", [
+    ("{not json", "invalid JSON"),
+    ('{"rows": []}', '"edits"'),
+    ('{"edits": 5}', "must be a list"),
+    ("42", "must be a list"),
+    ('[{"id": 517}, 3]', "edit 2: expected an object"),
+])
+def test_malformed_documents_are_conflicts(tmp_path, text, message):
+    path = tmp_path / "edits.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(EditConflictError, match=message):
+        load_edits(path)
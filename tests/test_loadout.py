@@ -0,0 +1,43 @@
+import itertools
+import random
+
+import pytest
+
+from nier_editora.core.chip import Chip
+from nier_editora.core.loadout import SCORES, optimize
+
+
+def _chips(rng, count, types):
+    return [Chip(i, 0, i, rng.randrange(types), rng.randrange(9), rng.randrange(1, 25), 0, 0, 0)
+            for i in range(count)]
+
+
+def _brute_force(chips, budget, score):
+    by_type = {}
+    for chip in chips:
+        by_type.setdefault(chip.chip_type, [None]).append(chip)
+    best = 0
+    for pick in itertools.product(*by_type.values()):
+        chosen = [chip for chip in pick if chip is not None]
+        if sum(chip.weight for chip in chosen) <= budget:
+            best = max(best, sum(score(chip) for chip in chosen))
+    return best
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("score", list(SCORES))
+def test_optimize_matches_brute_force(seed, score):
+    rng = random.Random(seed)
+    chips = _chips(rng, rng.randrange(1, 12), rng.randrange(1, 5))
+    budget = rng.randrange(0, 60)
+    loadout = optimize(chips, budget, score)
+
+    assert loadout.score == _brute_force(chips, budget, SCORES[score])
+    assert loadout.weight == sum(chip.weight for chip in loadout.chips) <= budget
+    assert loadout.score == sum(SCORES[score](chip) for chip in loadout.chips)
+    assert len({chip.chip_type for chip in loadout.chips}) == len(loadout.chips)
+
+
+def test_optimize_rejects_negative_budget():
+    with pytest.raises(ValueError):
+        optimize([], -1)
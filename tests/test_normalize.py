@@ -0,0 +1,23 @@
+import pytest
+
+from nier_editora.core.normalize import SORT_KEYS, normalize_save
+
+
+@pytest.mark.parametrize("sort", list(SORT_KEYS))
+def test_normalize_is_idempotent(save, sort):
+    normalize_save(save, sort=sort)
+    once = save.write()
+    results = normalize_save(save, sort=sort)
+    assert save.write() == once
+    assert all(not (r.merged or r.clamped or r.changed) for r in results)
+
+
+def test_normalize_merges_and_clamps(save):
+    inventory = save.inventory
+    item = inventory.active[0]
+    free = inventory.free_slots()[0]
+    inventory.raw[free] = type(item)(free, item.id, item.status, 99)
+    item.quantity = 99
+    (result, *_) = normalize_save(save, kinds=("inventory",), sort="slot", cap=99)
+    assert (result.merged, result.clamped) == (1, 1)
+    assert [r.quantity for r in inventory.active if r.id == item.id] == [99]
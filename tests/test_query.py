@@ -0,0 +1,19 @@
+import pytest
+
+from nier_editora.core.exceptions import QueryError
+from nier_editora.core.query import Aggregate, parse_aggregate
+
+
+@pytest.mark.parametrize("spec", ["sum", "min", "max", "avg", "avg:"])
+def test_aggregate_without_column_is_rejected(spec):
+    with pytest.raises(QueryError, match="needs a column"):
+        parse_aggregate(spec)
+
+
+@pytest.mark.parametrize("spec, expected", [
+    ("count", Aggregate("count", None)),
+    ("COUNT:item_id", Aggregate("count", "item_id")),
+    ("max:level", Aggregate("max", "level")),
+])
+def test_parse_aggregate(spec, expected):
+    assert parse_aggregate(spec) == expected
@@ -0,0 +1,55 @@
+import socket
+import threading
+
+import pytest
+
+from nier_editora.server import UNAUTHORIZED, RpcError, SaveService, call, make_server
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="needs Unix sockets")
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    address = tmp_path / "d.sock"
+    server = make_server(address, SaveService(write_root=tmp_path / "out"))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield address
+    server.shutdown()
+    server.server_close()
+
+
+def test_second_daemon_does_not_steal_socket(daemon):
+    with pytest.raises(OSError, match="in use"):
+        make_server(daemon, SaveService())
+    assert call(daemon, "stats")["requests"] >= 1
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    address = tmp_path / "stale.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(address))
+    stale.close()
+    make_server(address, SaveService()).server_close()
+
+
+def test_writes_outside_root_are_refused(daemon, sample_path, tmp_path):
+    with pytest.raises(RpcError, match="outside"):
+        call(daemon, "set", {"path": str(sample_path), "money": 1})
+    (tmp_path / "out").mkdir()
+    result = call(daemon, "set", {"path": str(sample_path), "money": 1,
+                                  "output": str(tmp_path / "out" / "edited.dat")})
+    assert result["changed"] == {"money": 1}
+
+
+def test_tcp_needs_token():
+    with pytest.raises(OSError, match="token"):
+        make_server(("127.0.0.1", 0), SaveService())
+
+
+def test_token_is_checked():
+    service = SaveService(token="secret")
+    request = {"jsonrpc": "2.0", "id": 1, "method": "stats", "params": {}}
+    assert service.handle(request)["error"]["code"] == UNAUTHORIZED
+    request["params"] = {"token": "secret"}
+    assert "result" in service.handle(request)
@@ -0,0 +1,94 @@
+import dataclasses
+
+import pytest
+
+from nier_editora.core.diff import diff_saves
+from nier_editora.core.item import Item, ItemStatus
+from nier_editora.core.save import SaveFile
+
+
+def test_snapshot_equals_parent(save):
+    snap = save.snapshot()
+    assert snap.write() == save.write()
+
+
+def test_held_slot_list_still_reaches_parent(save):
+    raw = save.inventory.raw
+    snap = save.snapshot()
+    raw[250] = Item(250, 5, ItemStatus.ACTIVE, 3)
+    assert save.inventory.raw[250].id == 5
+    assert snap.inventory.raw[250].id == -1
+
+
+def test_held_record_does_not_reach_snapshot(save):
+    held = save.inventory.raw[0]
+    quantity = held.quantity
+    snap = save.snapshot()
+    held.quantity = quantity + 1
+    assert save.inventory.raw[0].quantity == quantity + 1
+    assert snap.inventory.raw[0].quantity == quantity
+
+
+def test_snapshot_edits_do_not_reach_parent(save):
+    before = save.write()
+    snap = save.snapshot()
+    snap.inventory.raw[1].quantity = 55
+    snap.chips.raw[0].level = 8
+    snap.weapons.raw[0] = type(snap.weapons.raw[0]).empty(0)
+    assert save.write() == before
+    assert snap.write() != before
+
+
+def test_snapshot_of_snapshot_is_isolated(save):
+    first = save.snapshot()
+    second = first.snapshot()
+    first.inventory.raw[2].quantity = 66
+    assert second.inventory.raw[2].quantity == save.inventory.raw[2].quantity
+
+
+def test_snapshot_survives_reload(save):
+    snap = save.snapshot()
+    snap.inventory.raw[3].quantity = 12
+    reloaded = SaveFile()
+    reloaded.load(snap.write())
+    assert reloaded.inventory.raw[3].quantity == 12
+
+
+def test_copy_is_taken_at_call_time(save):
+    quantity = save.inventory.raw[0].quantity
+    copy = save.copy()
+    save.inventory.raw[0].quantity = quantity + 1
+    assert copy.inventory.raw[0].quantity == quantity
+
+
+def test_cache_hands_out_independent_saves(tmp_path, sample_path):
+    from nier_editora.core.cache import SaveCache
+
+    cache = SaveCache()
+    first = cache.load(sample_path)
+    first.inventory.raw[0].quantity = 42
+    second = cache.load(sample_path)
+    assert second.inventory.raw[0].quantity != 42
+    assert cache.stats.hits == 1
+
+
+def test_reading_a_snapshot_builds_no_record(save):
+    snap = save.snapshot()
+    snap.write()
+    snap.chips.free_slots()
+    diff_saves(save, snap)
+    for kind in SaveFile.INVENTORY_FIELDS:
+        manager = getattr(snap, kind)
+        assert len(manager._slots.pending) == manager.SLOT_COUNT
+
+
+def test_peeked_records_are_read_only(save):
+    snap = save.snapshot()
+    view = next(snap.inventory.peek())
+    with pytest.raises(AttributeError):
+        view.quantity = 1
+    assert view == save.inventory.raw[0]
+    assert type(dataclasses.replace(view, quantity=1)) is Item
+    assert type(type(view).empty(0)) is Item
+    snap.inventory.raw[0].quantity += 1
+    assert snap.inventory.raw[0] != save.inventory.raw[0]
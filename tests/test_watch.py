@@ -0,0 +1,16 @@
+import dataclasses
+
+from nier_editora.core.enums import ItemStatus
+from nier_editora.core.watch import diff_raw
+
+
+def test_item_activity_follows_the_inventory(save, sample_path):
+    # An item with an unknown status still occupies its slot
+    slot = save.inventory.free_slots()[0]
+    changed = save.snapshot()
+    changed.inventory.raw[slot] = dataclasses.replace(
+        changed.inventory.raw[slot], id=0x205, status=ItemStatus.INACTIVE, quantity=1)
+
+    events = diff_raw(sample_path, save, save.write(), changed.write())
+    assert [(e.event, e.slot) for e in events] == [("item_added", slot)]
+    assert save.inventory.is_slot_active(save.inventory.raw[slot])